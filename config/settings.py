@@ -28,6 +28,21 @@ class Settings:
     # Banco SQLite
     SQLITE_PATH = DATA_DIR / "analytics.db"
 
+    # Cache de arquivos já parseados pelo FileExtractor
+    PARSE_CACHE_DIR = PROCESSED_DATA_DIR / "parse_cache"
+    PARSE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+    # Backend das etapas de curadoria: "pandas" ou "polars" (requer o pacote polars)
+    TRANSFORM_BACKEND = "pandas"
+
+    # Perfil do dataset: "exact", "sample" ou "auto" (amostra acima de PROFILE_AUTO_SAMPLE_ROWS)
+    PROFILE_MODE = "auto"
+    PROFILE_SAMPLE_SIZE = 50_000
+    PROFILE_AUTO_SAMPLE_ROWS = 1_000_000
+    # Distintos e valores mais frequentes de colunas texto: "exact" ou "approx"
+    # (HyperLogLog + Space-Saving por blocos, memória limitada)
+    PROFILE_DISTINCT_MODE = "exact"
+
     @classmethod
     def create_directories(cls):
         """Cria todos os diretórios necessários se não existirem"""
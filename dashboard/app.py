@@ -27,8 +27,22 @@ from dashboard.utils.analytics import (  # noqa: E402
     summarize_correlation_pairs,
     summarize_transformation_log,
 )
-from src.app.curation_service import curate_dataset  # noqa: E402
+from src.app.curation_service import (  # noqa: E402
+    correlation_columns,
+    curate_dataset,
+    profile_reports,
+)
 from src.app.privacy_guard import mask_sensitive_dataframe  # noqa: E402
+from src.analysis.correlation import CorrelationResult, compute_correlations  # noqa: E402
+from src.analysis.profiler import DatasetProfile, profile_dataframe  # noqa: E402
+from src.data.compression import (  # noqa: E402
+    archive_members,
+    detect_compression,
+    open_decompressed,
+    strip_compression_suffix,
+)
+from src.data.dtype_planner import read_csv_with_dtype_plan  # noqa: E402
+from src.data.file_extractor import FileExtractor  # noqa: E402
 from src.data.sqlite_manager import SQLiteManager  # noqa: E402
 from src.utils.observability import (  # noqa: E402
     get_structured_logger,
@@ -318,9 +332,24 @@ def dataframe_to_excel_bytes(df: pd.DataFrame) -> bytes:
     return buffer.getvalue()
 
 
+def read_uploaded_table(source: Any, source_name: str) -> pd.DataFrame:
+    """Parse an uploaded buffer once, with sniffed encoding and a sampled dtype plan."""
+    if source_name.lower().endswith(".csv"):
+        encoding = FileExtractor.detect_encoding(source)
+        try:
+            return read_csv_with_dtype_plan(source, encoding=encoding)
+        except UnicodeDecodeError:
+            return read_csv_with_dtype_plan(source, encoding="latin-1")
+    codec = detect_compression(source, name=source_name)
+    if codec is None:
+        return pd.read_excel(source)
+    with open_decompressed(source, compression=codec) as stream:
+        return pd.read_excel(stream)
+
+
 def apply_dataset_to_session(df: pd.DataFrame, data_name: str, data_source: str) -> None:
     """Persist raw data, curated data, and metadata in the active session."""
-    artifacts = curate_dataset(df)
+    artifacts = curate_dataset(df, optimize_memory=True)
     business_snapshot = getattr(artifacts, "business_snapshot", None)
     if business_snapshot is None:
         business_snapshot = getattr(artifacts, "executive_snapshot", None)
@@ -339,6 +368,9 @@ def apply_dataset_to_session(df: pd.DataFrame, data_name: str, data_source: str)
     st.session_state.business_snapshot = business_snapshot
     st.session_state.privacy_snapshot = artifacts.privacy_snapshot
     st.session_state.masked_data = artifacts.masked_curated_df
+    st.session_state.profile = artifacts.profile
+    st.session_state.correlations = artifacts.correlations
+    st.session_state.profile_refinement = artifacts.profile_refinement
 
 
 def clear_dataset_state() -> None:
@@ -355,6 +387,9 @@ def clear_dataset_state() -> None:
         "business_snapshot",
         "privacy_snapshot",
         "masked_data",
+        "profile",
+        "correlations",
+        "profile_refinement",
     ):
         if key in st.session_state:
             del st.session_state[key]
@@ -374,6 +409,9 @@ def ensure_session_defaults() -> None:
         "business_snapshot": None,
         "privacy_snapshot": None,
         "masked_data": None,
+        "profile": None,
+        "correlations": None,
+        "profile_refinement": None,
         "selected_page": "Overview",
     }
     for key, value in defaults.items():
@@ -774,27 +812,36 @@ def render_upload(db: SQLiteManager, quality_summary: dict[str, Any] | None) ->
             st.metric("Memory", f"{quality_summary['memory_mb']:.2f} MB")
 
     st.markdown("---")
-    uploaded = st.file_uploader("Upload CSV or Excel", type=["csv", "xlsx", "xls"])
+    uploaded = st.file_uploader(
+        "Upload CSV or Excel (optionally .gz, .zst, .bz2, .xz or .zip)",
+        type=["csv", "xlsx", "xls", "gz", "zst", "bz2", "xz", "zip"],
+    )
 
     if uploaded is None:
         st.info("Upload a file to replace the current dataset.")
         return
 
+    uploaded.seek(0)
+    source_name = strip_compression_suffix(uploaded.name)
+    member = None
     try:
-        if uploaded.name.lower().endswith(".csv"):
-            for encoding in ("utf-8", "utf-8-sig", "latin-1"):
-                uploaded.seek(0)
-                try:
-                    df = pd.read_csv(uploaded, encoding=encoding)
-                    break
-                except UnicodeDecodeError:
-                    continue
-            else:
-                uploaded.seek(0)
-                df = pd.read_csv(uploaded)
+        if detect_compression(uploaded, name=uploaded.name) == "zip":
+            members = archive_members(uploaded)
+            if not members:
+                st.warning("The uploaded archive contains no data files.")
+                return
+            member = (
+                st.selectbox("Archive member", members, key="upload_archive_member")
+                if len(members) > 1
+                else members[0]
+            )
+            source_name = member
+
+        if member is None:
+            df = read_uploaded_table(uploaded, source_name)
         else:
-            uploaded.seek(0)
-            df = pd.read_excel(uploaded)
+            with open_decompressed(uploaded, member=member) as stream:
+                df = read_uploaded_table(stream, source_name)
     except Exception as exc:  # noqa: BLE001
         st.error("Failed to read the uploaded file. Please verify format and encoding.")
         st.exception(exc)
@@ -891,17 +938,26 @@ def render_upload(db: SQLiteManager, quality_summary: dict[str, Any] | None) ->
             st.error("Failed to save table to SQLite.")
 
 
+def _profile_for(df: pd.DataFrame, profile: DatasetProfile | None) -> DatasetProfile:
+    """Session profile of ``df``, re-profiled only when it belongs to another frame."""
+    if profile is not None and profile.describes(df):
+        return profile
+    return profile_dataframe(df)
+
+
 def render_data_preview(
     df: pd.DataFrame | None,
     raw_df: pd.DataFrame | None,
     transform_log: list[dict[str, Any]],
     privacy_snapshot: dict[str, Any] | None,
     masked_df: pd.DataFrame | None,
+    profile: DatasetProfile | None = None,
 ) -> None:
     st.subheader("Data Preview")
     if df is None or df.empty:
         st.warning("No data available.")
         return
+    profile = _profile_for(df, profile)
 
     tab1, tab2, tab3, tab4 = st.tabs(
         ["Curated Sample", "Raw Sample", "Column Profile", "Curation Log"]
@@ -936,10 +992,17 @@ def render_data_preview(
     with tab3:
         info = pd.DataFrame(
             {
-                "Column": df.columns,
-                "Type": df.dtypes.astype(str).values,
-                "Missing": df.isna().sum().values,
-                "Unique": [df[c].nunique(dropna=True) for c in df.columns],
+                "Column": profile.column_names,
+                "Type": [str(column.dtype) for column in profile.columns],
+                "Missing": [column.missing for column in profile.columns],
+                "Unique": [
+                    f"{column.n_unique:,}" if column.exact else f"~{column.n_unique:,}"
+                    for column in profile.columns
+                ],
+                "Top values": [
+                    ", ".join(f"{value} ({count:,})" for value, count in column.top_values[:3])
+                    for column in profile.columns
+                ],
             }
         )
         st.dataframe(info, width="stretch")
@@ -957,21 +1020,27 @@ def render_eda(
     df: pd.DataFrame | None,
     analysis: dict[str, Any] | None,
     quality_summary: dict[str, Any] | None,
+    profile: DatasetProfile | None = None,
+    correlations: CorrelationResult | None = None,
+    transform_log: list[dict[str, Any]] | None = None,
 ) -> None:
     st.subheader("Exploratory Analysis")
     if df is None or df.empty:
         st.warning("No data available.")
         return
-
-    numeric = df.select_dtypes(include="number")
+    profile = _profile_for(df, profile)
+    numeric_columns = correlation_columns(profile, transform_log or [])
+    stale = correlations is None or list(correlations.matrix.columns) != numeric_columns
+    if len(numeric_columns) > 1 and stale:
+        correlations = compute_correlations(df, columns=numeric_columns)
 
     c1, c2, c3, c4 = st.columns(4)
     with c1:
         st.metric("Rows", f"{len(df):,}")
     with c2:
-        st.metric("Missing values", int(df.isna().sum().sum()))
+        st.metric("Missing values", int(profile.total_missing))
     with c3:
-        st.metric("Duplicate rows", int(df.duplicated().sum()))
+        st.metric("Duplicate rows", int(profile.duplicate_count))
     with c4:
         score = quality_summary["quality_score"] if quality_summary else 0
         st.metric("Quality Score", f"{score:.0f}/100")
@@ -988,17 +1057,25 @@ def render_eda(
             st.info("Analysis report not available.")
 
     with tab_stats:
-        if numeric.empty:
+        if not profile.numeric_columns:
             st.info("No numeric columns available for descriptive statistics.")
         else:
-            st.dataframe(numeric.describe().T, width="stretch")
+            st.dataframe(profile.describe_frame(), width="stretch")
+        if not profile.exact and profile.sample_rows:
+            st.caption(
+                f"Estimated from a {profile.sample_rows:,}-row sample; counts, missing values "
+                f"and min/max are exact. {profile.confidence:.0%} confidence intervals below "
+                "(the exact profile replaces these once it finishes)."
+            )
+            st.dataframe(profile.interval_frame(), width="stretch")
 
     with tab_corr:
-        if numeric.shape[1] > 1:
-            corr = numeric.corr(numeric_only=True)
-            fig = px.imshow(corr, text_auto=True, aspect="auto", title="Correlation Matrix")
+        if len(numeric_columns) > 1:
+            fig = px.imshow(
+                correlations.matrix, text_auto=True, aspect="auto", title="Correlation Matrix"
+            )
             st.plotly_chart(fig, width="stretch")
-            strongest_pairs = summarize_correlation_pairs(df)
+            strongest_pairs = summarize_correlation_pairs(df, correlations=correlations)
             if not strongest_pairs.empty:
                 st.caption("Strongest relationships")
                 st.dataframe(strongest_pairs, width="stretch")
@@ -1006,18 +1083,7 @@ def render_eda(
             st.info("At least 2 numeric columns are required.")
 
     with tab_missing:
-        missing_profile = (
-            pd.DataFrame(
-                {
-                    "column": df.columns,
-                    "missing_count": df.isna().sum().values,
-                    "missing_pct": (df.isna().mean() * 100).values,
-                }
-            )
-            .sort_values(["missing_count", "column"], ascending=[False, True])
-            .reset_index(drop=True)
-        )
-        st.dataframe(missing_profile, width="stretch")
+        st.dataframe(profile.missing_frame(), width="stretch")
 
 
 def render_charts(df: pd.DataFrame | None) -> None:
@@ -1058,7 +1124,7 @@ def render_charts(df: pd.DataFrame | None) -> None:
                     key="chart_metric",
                 )
             grouped = (
-                df.groupby(cat, dropna=False)[val]
+                df.groupby(cat, dropna=False, observed=True)[val]
                 .mean()
                 .reset_index()
                 .sort_values(val, ascending=False)
@@ -1249,6 +1315,18 @@ def main() -> None:
     ensure_session_defaults()
     apply_dashboard_style()
     db = get_db()
+    refinement = st.session_state.profile_refinement
+    if refinement is not None and refinement.done():
+        # The background exact profile replaces the sampled one on the next
+        # rerun, together with the reports that were built from the estimates.
+        exact = refinement.profile
+        (
+            st.session_state.analysis,
+            st.session_state.quality_summary,
+            st.session_state.priority_actions,
+        ) = profile_reports(st.session_state.data, exact, st.session_state.correlations)
+        st.session_state.profile = exact
+        st.session_state.profile_refinement = None
     df = st.session_state.data
     raw_df = st.session_state.raw_data
     analysis = st.session_state.analysis
@@ -1258,6 +1336,8 @@ def main() -> None:
     business_snapshot = st.session_state.business_snapshot
     privacy_snapshot = st.session_state.privacy_snapshot
     masked_df = st.session_state.masked_data
+    profile = st.session_state.profile
+    correlations = st.session_state.correlations
     governance_snapshot = build_governance_snapshot(
         df=df,
         quality_summary=quality_summary,
@@ -1330,8 +1410,12 @@ def main() -> None:
             privacy_snapshot,
         ),
         "Upload": lambda: render_upload(db, quality_summary),
-        "Data": lambda: render_data_preview(df, raw_df, transform_log, privacy_snapshot, masked_df),
-        "EDA": lambda: render_eda(df, analysis, quality_summary),
+        "Data": lambda: render_data_preview(
+            df, raw_df, transform_log, privacy_snapshot, masked_df, profile
+        ),
+        "EDA": lambda: render_eda(
+            df, analysis, quality_summary, profile, correlations, transform_log
+        ),
         "Visualizations": lambda: render_charts(df),
         "Database": lambda: render_database(db, privacy_snapshot),
         "Settings": lambda: render_settings(df, quality_summary, transform_log, privacy_snapshot),
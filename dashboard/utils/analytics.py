@@ -5,11 +5,16 @@ from __future__ import annotations
 import json
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import pandas as pd
 
+from src.analysis.correlation import CorrelationResult, compute_correlations
+
+if TYPE_CHECKING:
+    from src.analysis.profiler import DatasetProfile
+
 POLICY_PATH = Path(__file__).resolve().parents[2] / "config" / "dashboard_policy.json"
 
 
@@ -94,18 +99,38 @@ def interpret_correlation(corr: float) -> tuple[str, str]:
 
 
 def build_data_quality_summary(
-    df: pd.DataFrame, policy: dict[str, object] | None = None
+    df: pd.DataFrame,
+    policy: dict[str, object] | None = None,
+    duplicate_count: int | None = None,
+    profile: DatasetProfile | None = None,
 ) -> dict[str, float | int | str]:
-    """Build a decision-ready summary of dataset quality."""
+    """Build a decision-ready summary of dataset quality.
+
+    Pass ``duplicate_count`` when it is already known (e.g. from the dedup
+    step) to skip hashing every row again, and ``profile`` (a
+    ``DatasetProfile`` of ``df``) to read every metric from it instead of
+    scanning the frame.
+    """
     quality_policy = (policy or load_dashboard_policy())["quality_score"]
     rows, columns = df.shape
     total_cells = max(1, rows * columns)
-    missing_count = int(df.isna().sum().sum())
-    duplicate_count = int(df.duplicated().sum())
-    numeric_count = int(df.select_dtypes(include=[np.number]).shape[1])
-    categorical_count = int(df.select_dtypes(include=["object", "category"]).shape[1])
-    datetime_count = int(df.select_dtypes(include=["datetime64[ns]", "datetimetz"]).shape[1])
-    memory_mb = float(df.memory_usage(deep=True).sum() / (1024 * 1024))
+    if profile is not None:
+        missing_count = int(profile.total_missing)
+        if duplicate_count is None:
+            duplicate_count = profile.duplicate_count
+        numeric_count = len(profile.numeric_columns)
+        categorical_count = len(profile.categorical_columns)
+        datetime_count = len(profile.datetime_columns)
+        memory_mb = float(profile.memory_bytes / (1024 * 1024))
+    else:
+        missing_count = int(df.isna().sum().sum())
+        if duplicate_count is None:
+            duplicate_count = int(df.duplicated().sum())
+        numeric_count = int(df.select_dtypes(include=[np.number]).shape[1])
+        categorical_count = int(df.select_dtypes(include=["object", "category"]).shape[1])
+        datetime_count = int(df.select_dtypes(include=["datetime64[ns]", "datetimetz"]).shape[1])
+        memory_mb = float(df.memory_usage(deep=True).sum() / (1024 * 1024))
+    duplicate_count = int(duplicate_count)
 
     missing_pct = float((missing_count / total_cells) * 100)
     duplicate_pct = float((duplicate_count / max(1, rows)) * 100)
@@ -198,6 +223,12 @@ def summarize_transformation_log(log: list[dict]) -> list[str]:
         elif operation == "remove_duplicates":
             removed = details.get("removed", 0)
             summary.append(f"Duplicate removal eliminated {removed} rows.")
+        elif operation == "optimize_memory":
+            before = details.get("memory_before", 0) / 1024**2
+            after = details.get("memory_after", 0) / 1024**2
+            summary.append(
+                f"Memory optimization reduced the dataset from {before:.2f} MB to {after:.2f} MB."
+            )
         elif operation == "create_features":
             summary.append("Feature generation step executed.")
 
@@ -240,7 +271,7 @@ def build_business_snapshot(df: pd.DataFrame) -> dict[str, object]:
 
     if {"categoria", "valor_total"}.issubset(df.columns):
         revenue_by_category = (
-            df.groupby("categoria", dropna=False)["valor_total"]
+            df.groupby("categoria", dropna=False, observed=True)["valor_total"]
             .sum()
             .sort_values(ascending=False)
             .reset_index()
@@ -256,7 +287,7 @@ def build_business_snapshot(df: pd.DataFrame) -> dict[str, object]:
 
     if {"regiao", "valor_total"}.issubset(df.columns):
         revenue_by_region = (
-            df.groupby("regiao", dropna=False)["valor_total"]
+            df.groupby("regiao", dropna=False, observed=True)["valor_total"]
             .sum()
             .sort_values(ascending=False)
             .reset_index()
@@ -444,38 +475,23 @@ def build_governance_snapshot(
     }
 
 
-def summarize_correlation_pairs(df: pd.DataFrame, top_n: int = 5) -> pd.DataFrame:
-    """Return the strongest correlation pairs for business review."""
-    numeric_df = df.select_dtypes(include=[np.number])
-    if numeric_df.shape[1] < 2:
-        return pd.DataFrame(columns=["left", "right", "correlation", "strength"])
+def summarize_correlation_pairs(
+    df: pd.DataFrame, top_n: int = 5, correlations: CorrelationResult | None = None
+) -> pd.DataFrame:
+    """Return the strongest correlation pairs for business review.
 
-    corr_matrix = numeric_df.corr(numeric_only=True)
-    rows: list[dict[str, object]] = []
-
-    for i, left in enumerate(corr_matrix.columns):
-        for j, right in enumerate(corr_matrix.columns):
-            if j <= i:
-                continue
-            corr_value = float(corr_matrix.iloc[i, j])
-            strength, _ = interpret_correlation(corr_value)
-            rows.append(
-                {
-                    "left": left,
-                    "right": right,
-                    "correlation": round(corr_value, 4),
-                    "strength": strength,
-                }
-            )
+    Pass ``correlations`` to reuse a matrix already computed for ``df``.
+    """
+    if correlations is None:
+        numeric_df = df.select_dtypes(include=[np.number])
+        if numeric_df.shape[1] < 2:
+            return pd.DataFrame(columns=["left", "right", "correlation", "strength"])
+        correlations = compute_correlations(numeric_df)
 
-    if not rows:
+    pairs = correlations.top_pairs(top_n)
+    if pairs.empty:
         return pd.DataFrame(columns=["left", "right", "correlation", "strength"])
 
-    return (
-        pd.DataFrame(rows)
-        .assign(abs_correlation=lambda frame: frame["correlation"].abs())
-        .sort_values("abs_correlation", ascending=False)
-        .drop(columns="abs_correlation")
-        .head(top_n)
-        .reset_index(drop=True)
-    )
+    pairs["correlation"] = pairs["correlation"].round(4)
+    pairs["strength"] = [interpret_correlation(value)[0] for value in pairs["correlation"]]
+    return pairs
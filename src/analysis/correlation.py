@@ -0,0 +1,239 @@
+"""Correlation matrices computed once per dataset version and shared by every view.
+
+The analyzer's strong-correlation insight, the dashboard pair table and the
+heatmap all read one :class:`CorrelationResult`. Matrices are built with
+blocked matrix products instead of per-pair loops, and results are cached by
+a fingerprint of the numeric columns.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from src.utils.fingerprint import frame_fingerprint, stable_key
+
+CORRELATION_METHODS = ("pearson", "spearman")
+DEFAULT_BLOCK_SIZE = 256
+DEFAULT_CORRELATION_CACHE_ENTRIES = 8
+STRONG_CORRELATION = 0.7
+# Variances below this fraction of the sum of squares are treated as zero (constant pairs).
+_VARIANCE_TOLERANCE = 1e-12
+
+
+def _numeric_matrix(df: pd.DataFrame) -> np.ndarray:
+    values = np.empty((len(df), df.shape[1]), dtype=np.float64)
+    for position in range(df.shape[1]):
+        values[:, position] = df.iloc[:, position].to_numpy(dtype=np.float64, na_value=np.nan)
+    return values
+
+
+def _column_blocks(columns: int, block_size: int) -> list[slice]:
+    return [
+        slice(start, min(start + block_size, columns)) for start in range(0, columns, block_size)
+    ]
+
+
+def _pearson(values: np.ndarray, min_periods: int, block_size: int) -> np.ndarray:
+    """Pearson matrix over pairwise-complete rows, one block pair at a time.
+
+    Columns are centered on their own mean first, so the sums below stay
+    well conditioned. With nulls, six matrix products per block pair give the
+    pairwise counts, sums, sums of squares and cross products; without them
+    a single Gram product does.
+    """
+    rows, columns = values.shape
+    present = ~np.isnan(values)
+    means = np.nanmean(values, axis=0) if rows else np.zeros(columns)
+    means = np.where(np.isnan(means), 0.0, means)
+    centered = np.where(present, values - means, 0.0)
+    weights = present.astype(np.float64)
+    squares = centered * centered
+    minimum = max(min_periods, 2)
+
+    result = np.full((columns, columns), np.nan)
+    blocks = _column_blocks(columns, block_size)
+    complete = bool(present.all())
+    if complete:
+        # No nulls: every pair shares all rows, so one Gram product per block pair suffices.
+        sum_squares = squares.sum(axis=0)
+    for index, left in enumerate(blocks):
+        for right in blocks[index:]:
+            if complete:
+                count = np.full((left.stop - left.start, right.stop - right.start), rows)
+                sum_xx = np.broadcast_to(sum_squares[left, None], count.shape)
+                sum_yy = np.broadcast_to(sum_squares[None, right], count.shape)
+                var_x, var_y = sum_xx, sum_yy
+                covariance = centered[:, left].T @ centered[:, right]
+            else:
+                count = weights[:, left].T @ weights[:, right]
+                sum_x = centered[:, left].T @ weights[:, right]
+                sum_y = weights[:, left].T @ centered[:, right]
+                sum_xx = squares[:, left].T @ weights[:, right]
+                sum_yy = weights[:, left].T @ squares[:, right]
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    var_x = sum_xx - sum_x * sum_x / count
+                    var_y = sum_yy - sum_y * sum_y / count
+                    covariance = centered[:, left].T @ centered[:, right] - sum_x * sum_y / count
+            with np.errstate(divide="ignore", invalid="ignore"):
+                block = covariance / np.sqrt(var_x * var_y)
+            degenerate = (
+                (count < minimum)
+                | (var_x <= _VARIANCE_TOLERANCE * sum_xx)
+                | (var_y <= _VARIANCE_TOLERANCE * sum_yy)
+            )
+            block[degenerate] = np.nan
+            result[left, right] = block
+            result[right, left] = block.T
+
+    np.clip(result, -1.0, 1.0, out=result)
+    diagonal = np.diagonal(result).copy()
+    np.fill_diagonal(result, np.where(np.isnan(diagonal), np.nan, 1.0))
+    return result
+
+
+def correlation_matrix(
+    df: pd.DataFrame,
+    method: str = "pearson",
+    min_periods: int = 1,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> pd.DataFrame:
+    """``df.corr(method)`` for numeric frames, vectorized and blocked by columns.
+
+    Missing values are excluded pairwise, as pandas does. Spearman ranks each
+    column over its own non-null values (ties averaged) and then applies
+    Pearson; with nulls pandas re-ranks every pair over the rows both columns
+    share instead, so results then differ slightly.
+    """
+    if method not in CORRELATION_METHODS:
+        raise ValueError(f"Método de correlação inválido: {method} (use {CORRELATION_METHODS})")
+    if method == "spearman":
+        df = df.rank(method="average", na_option="keep")
+    matrix = _pearson(_numeric_matrix(df), min_periods, block_size)
+    return pd.DataFrame(matrix, index=df.columns, columns=df.columns)
+
+
+@dataclass(frozen=True)
+class CorrelationResult:
+    """One correlation matrix and the pair views derived from it (treat as read-only)."""
+
+    matrix: pd.DataFrame
+    method: str = "pearson"
+
+    def _upper_triangle(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        values = self.matrix.to_numpy()
+        left, right = np.triu_indices(values.shape[0], k=1)
+        return left, right, values[left, right]
+
+    def top_pairs(self, k: int = 5) -> pd.DataFrame:
+        """The ``k`` pairs with the largest absolute correlation, strongest first.
+
+        Pairs without a defined correlation (NaN) rank last.
+        """
+        left, right, values = self._upper_triangle()
+        if not values.size or k <= 0:
+            return pd.DataFrame(columns=["left", "right", "correlation"])
+        strength = np.where(np.isnan(values), -1.0, np.abs(values))
+        if k < strength.size:
+            candidates = np.argpartition(-strength, k - 1)[:k]
+        else:
+            candidates = np.arange(strength.size)
+        order = candidates[np.lexsort((candidates, -strength[candidates]))]
+        columns = self.matrix.columns
+        return pd.DataFrame(
+            {
+                "left": columns[left[order]],
+                "right": columns[right[order]],
+                "correlation": values[order],
+            }
+        )
+
+    def strong_pairs(
+        self, threshold: float = STRONG_CORRELATION
+    ) -> list[tuple[Hashable, Hashable, float]]:
+        """Pairs with ``|r| > threshold``, in matrix (row-major) order."""
+        left, right, values = self._upper_triangle()
+        selected = np.flatnonzero(np.abs(np.nan_to_num(values)) > threshold)
+        columns = self.matrix.columns
+        return [(columns[left[i]], columns[right[i]], float(values[i])) for i in selected]
+
+
+class CorrelationCache:
+    """Small LRU of correlation results keyed by dataset fingerprint and method."""
+
+    def __init__(self, max_entries: int = DEFAULT_CORRELATION_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CorrelationResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CorrelationResult | None:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: str, result: CorrelationResult) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+@lru_cache(maxsize=1)
+def default_correlation_cache() -> CorrelationCache:
+    """Process-wide cache so Streamlit reruns reuse the last matrices."""
+    return CorrelationCache()
+
+
+def compute_correlations(
+    df: pd.DataFrame,
+    method: str = "pearson",
+    columns: Sequence[Hashable] | None = None,
+    min_periods: int = 1,
+    cache: CorrelationCache | None = None,
+    key: str | None = None,
+) -> CorrelationResult:
+    """Correlations of the numeric columns of ``df`` (or ``columns``), cached.
+
+    The cache key is a content fingerprint of those columns; pass ``key``
+    (e.g. a dataset version) to skip hashing them.
+    """
+    if columns is None:
+        columns = df.select_dtypes(include=[np.number]).columns.tolist()
+    frame = df[list(columns)]
+    cache = default_correlation_cache() if cache is None else cache
+    cache_key = stable_key(
+        "correlation",
+        key or frame_fingerprint(frame),
+        list(map(str, frame.columns)),
+        method,
+        min_periods,
+    )
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+    result = CorrelationResult(correlation_matrix(frame, method, min_periods), method)
+    cache.put(cache_key, result)
+    return result
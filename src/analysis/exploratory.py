@@ -4,155 +4,170 @@ Análise exploratória de dados automatizada
 """
 
 import pandas as pd
-import numpy as np
 from loguru import logger
 import json
 from datetime import datetime
 
+from src.analysis.correlation import STRONG_CORRELATION, compute_correlations
+from src.analysis.profiler import profile_dataframe
+
 
 class ExploratoryAnalyzer:
     """
     Realiza análise exploratória completa
     """
 
-    def __init__(self):
+    def __init__(self, executor=None):
+        """
+        Args:
+            executor: Executor (ex: ProcessPoolExecutor) para perfilar lotes de colunas
+                em paralelo; None perfila em série
+        """
+        self.executor = executor
         self.results = {}
+        self.profiles = {}
         logger.info("ExploratoryAnalyzer inicializado")
 
-    def analyze_dataframe(self, df, df_name="dataset"):
+    def analyze_dataframe(
+        self, df, df_name="dataset", duplicate_count=None, profile=None, correlations=None
+    ):
         """
         Análise completa do DataFrame
 
         Args:
-            df: DataFrame para análise
+            df: DataFrame para análise (opcional quando profile é informado; sem ele,
+                o insight de correlações é omitido)
             df_name: Nome do dataset
+            duplicate_count: Duplicatas já conhecidas (evita recalcular o hash das linhas)
+            profile: DatasetProfile já calculado para df (evita percorrer os dados de novo),
+                p.ex. o perfil incremental salvo com a tabela no SQLite
+            correlations: CorrelationResult já calculado (o mesmo usado pelo dashboard)
 
         Returns:
             Dicionário com resultados
         """
         logger.info(f"Iniciando análise de {df_name}")
 
+        if profile is None:
+            profile = profile_dataframe(df, duplicate_count=duplicate_count, executor=self.executor)
+
         analysis = {
-            "basic_info": self._basic_info(df),
-            "data_types": self._data_types(df),
-            "missing_values": self._missing_values(df),
-            "descriptive_stats": self._descriptive_stats(df),
-            "unique_values": self._unique_values(df),
-            "insights": self._generate_insights(df),
+            "basic_info": self._basic_info(profile),
+            "data_types": self._data_types(profile),
+            "missing_values": self._missing_values(profile),
+            "descriptive_stats": self._descriptive_stats(profile),
+            "unique_values": self._unique_values(profile),
+            "insights": self._generate_insights(df, profile, correlations),
         }
 
         self.results[df_name] = analysis
+        self.profiles[df_name] = profile
         logger.success(f"Análise concluída para {df_name}")
 
         return analysis
 
-    def _basic_info(self, df):
+    def _basic_info(self, profile):
         """Informações básicas"""
         return {
-            "shape": {"rows": df.shape[0], "columns": df.shape[1]},
-            "memory_usage": f"{df.memory_usage(deep=True).sum() / 1024 ** 2:.2f} MB",
-            "columns": list(df.columns),
+            "shape": {"rows": profile.rows, "columns": len(profile.columns)},
+            "memory_usage": f"{profile.memory_bytes / 1024 ** 2:.2f} MB",
+            "columns": profile.column_names,
         }
 
-    def _data_types(self, df):
+    def _data_types(self, profile):
         """Tipos de dados"""
-        dtypes = df.dtypes.value_counts()
+        dtypes = pd.Series([column.dtype for column in profile.columns], dtype=object)
         return {
-            "summary": {str(k): int(v) for k, v in dtypes.items()},
-            "details": df.dtypes.astype(str).to_dict(),
+            "summary": {str(k): int(v) for k, v in dtypes.value_counts().items()},
+            "details": {column.name: str(column.dtype) for column in profile.columns},
         }
 
-    def _missing_values(self, df):
+    def _missing_values(self, profile):
         """Valores faltantes"""
-        missing = df.isnull().sum()
-        missing_pct = (missing / len(df)) * 100
+        missing = profile.missing_counts
+        missing_pct = (missing / profile.rows) * 100
 
         missing_df = pd.DataFrame({"count": missing, "percentage": missing_pct}).sort_values(
             "count", ascending=False
         )
 
         return {
-            "total_missing": int(df.isnull().sum().sum()),
-            "total_missing_pct": float(
-                (df.isnull().sum().sum() / (df.shape[0] * df.shape[1])) * 100
-            ),
+            "total_missing": int(profile.total_missing),
+            "total_missing_pct": float((profile.total_missing / max(1, profile.total_cells)) * 100),
             "columns_with_missing": int((missing > 0).sum()),
             "details": missing_df[missing_df["count"] > 0].to_dict(),
         }
 
-    def _descriptive_stats(self, df):
+    def _descriptive_stats(self, profile):
         """Estatísticas descritivas"""
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        numeric_cols = [column for column in profile.columns if column.kind == "numeric"]
 
         if len(numeric_cols) == 0:
             return {"message": "Sem colunas numéricas"}
 
-        stats = df[numeric_cols].describe(percentiles=[0.25, 0.5, 0.75]).to_dict()
-
-        # Adiciona skewness e kurtosis
-        for col in numeric_cols:
-            if col not in stats:
-                stats[col] = {}
-            stats[col]["skewness"] = float(df[col].skew())
-            stats[col]["kurtosis"] = float(df[col].kurtosis())
+        stats = {}
+        for column in numeric_cols:
+            stats[column.name] = column.describe()
+            stats[column.name]["skewness"] = float(column.skewness)
+            stats[column.name]["kurtosis"] = float(column.kurtosis)
 
         return stats
 
-    def _unique_values(self, df):
+    def _unique_values(self, profile):
         """Valores únicos por coluna"""
         unique_info = {}
 
-        for col in df.columns:
-            n_unique = df[col].nunique()
-            unique_info[col] = {
-                "n_unique": int(n_unique),
-                "unique_ratio": float(n_unique / len(df)),
-                "sample": df[col].dropna().unique()[:5].tolist() if n_unique <= 10 else [],
+        for column in profile.columns:
+            unique_info[column.name] = {
+                "n_unique": int(column.n_unique),
+                "unique_ratio": float(column.n_unique / profile.rows) if profile.rows else 0.0,
+                "sample": column.sample,
+                "top_values": column.top_values,
+                "exact": column.exact,
             }
 
         return unique_info
 
-    def _generate_insights(self, df):
+    def _generate_insights(self, df, profile, correlations=None):
         """Gera insights automáticos"""
         insights = []
+        rows = profile.rows
 
         # Insight 1: Tamanho do dataset
-        if df.shape[0] > 10000:
-            insights.append(f"📊 Dataset grande: {df.shape[0]:,} linhas")
-        elif df.shape[0] > 1000:
-            insights.append(f"📊 Dataset médio: {df.shape[0]:,} linhas")
+        if rows > 10000:
+            insights.append(f"📊 Dataset grande: {rows:,} linhas")
+        elif rows > 1000:
+            insights.append(f"📊 Dataset médio: {rows:,} linhas")
         else:
-            insights.append(f"📊 Dataset pequeno: {df.shape[0]} linhas")
+            insights.append(f"📊 Dataset pequeno: {rows} linhas")
 
         # Insight 2: Valores faltantes
-        missing_total = df.isnull().sum().sum()
+        missing_total = profile.total_missing
         if missing_total > 0:
-            missing_pct = (missing_total / (df.shape[0] * df.shape[1])) * 100
+            missing_pct = (missing_total / profile.total_cells) * 100
             insights.append(f"⚠️ {missing_pct:.1f}% dos valores são faltantes")
         else:
             insights.append("✅ Sem valores faltantes")
 
         # Insight 3: Colunas numéricas vs categóricas
-        numeric = len(df.select_dtypes(include=[np.number]).columns)
-        categorical = len(df.select_dtypes(include=["object"]).columns)
+        numeric = len(profile.numeric_columns)
+        categorical = len(profile.categorical_columns)
         insights.append(f"📐 {numeric} colunas numéricas, {categorical} categóricas")
 
         # Insight 4: Duplicatas
-        duplicates = df.duplicated().sum()
+        duplicates = profile.duplicate_count
         if duplicates > 0:
-            dup_pct = (duplicates / df.shape[0]) * 100
+            dup_pct = (duplicates / rows) * 100
             insights.append(f"🔄 {duplicates} linhas duplicadas ({dup_pct:.1f}%)")
 
         # Insight 5: Correlações fortes
-        numeric_df = df.select_dtypes(include=[np.number])
-        if numeric_df.shape[1] > 1:
-            corr_matrix = numeric_df.corr()
-            strong_corr = []
-            for i in range(len(corr_matrix.columns)):
-                for j in range(i + 1, len(corr_matrix.columns)):
-                    if abs(corr_matrix.iloc[i, j]) > 0.7:
-                        strong_corr.append(f"{corr_matrix.columns[i]} x {corr_matrix.columns[j]}")
-
+        if correlations is None and df is not None and len(profile.numeric_columns) > 1:
+            correlations = compute_correlations(df, columns=profile.numeric_columns)
+        if correlations is not None:
+            strong_corr = [
+                f"{left} x {right}"
+                for left, right, _ in correlations.strong_pairs(STRONG_CORRELATION)
+            ]
             if strong_corr:
                 insights.append(f"🔗 Correlações fortes: {', '.join(strong_corr[:3])}")
 
@@ -0,0 +1,649 @@
+"""Single-pass dataset profiling shared by the analyzer, quality summary and EDA page.
+
+:func:`profile_dataframe` profiles an in-memory frame exactly. :class:`ProfileState`
+keeps the same statistics as mergeable accumulators (moments, quantile sketch,
+HyperLogLog) so a profile can be built chunk by chunk, stored next to a
+dataset and updated with appended rows only.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Hashable
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from config.settings import Settings
+from src.utils.parallel import run_column_batches
+from src.utils.sketches import (
+    DEFAULT_FREQUENT_CAPACITY,
+    FrequentItemsSketch,
+    HyperLogLog,
+    MomentAccumulator,
+    QuantileSketch,
+    hash_values,
+)
+
+PROFILE_QUANTILES = (0.25, 0.5, 0.75)
+# Columns with at most this many distinct values keep a sample of them.
+SAMPLE_MAX_UNIQUE = 10
+SAMPLE_SIZE = 5
+# Row hashes kept exactly (8 bytes each) before duplicates become an estimate.
+ROW_HASH_EXACT_LIMIT = 1_000_000
+ROW_HASH_PRECISION = 14
+PROFILE_STATE_VERSION = 2
+DEFAULT_TOP_K = 5
+DISTINCT_MODES = ("exact", "approx")
+# Rows factorized at a time by the approximate distinct/top-k pass.
+DISTINCT_CHUNK_ROWS = 262_144
+
+
+def column_kind(dtype: Any) -> str:
+    """'numeric', 'categorical', 'datetime', 'boolean' or 'other' (select_dtypes semantics)."""
+    if pd.api.types.is_bool_dtype(dtype):
+        return "boolean"
+    if pd.api.types.is_numeric_dtype(dtype):
+        return "numeric"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "datetime"
+    if pd.api.types.is_object_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+        return "categorical"
+    return "other"
+
+
+@dataclass
+class ColumnProfile:
+    """Statistics of one column; numeric moments and quantiles are NaN elsewhere."""
+
+    name: Hashable
+    dtype: Any
+    kind: str
+    count: int
+    missing: int
+    n_unique: int
+    memory_bytes: int
+    mean: float = np.nan
+    std: float = np.nan
+    min: Any = None
+    max: Any = None
+    quantiles: dict[float, float] = field(default_factory=dict)
+    skewness: float = np.nan
+    kurtosis: float = np.nan
+    sample: list[Any] = field(default_factory=list)
+    # Most frequent values as (value, count), most frequent first.
+    top_values: list[tuple[Any, int]] = field(default_factory=list)
+    exact: bool = True
+    # Sampled profiles: confidence interval per estimated statistic ("mean", "50%", "n_unique").
+    intervals: dict[str, tuple[float, float]] = field(default_factory=dict)
+
+    def describe(self) -> dict[str, float]:
+        """The column's ``DataFrame.describe()`` entry (numeric columns)."""
+        stats = {"count": float(self.count), "mean": self.mean, "std": self.std}
+        stats["min"] = float(self.min) if self.count else np.nan
+        for q in PROFILE_QUANTILES:
+            stats[f"{q:.0%}"] = self.quantiles.get(q, np.nan)
+        stats["max"] = float(self.max) if self.count else np.nan
+        return stats
+
+
+@dataclass
+class DatasetProfile:
+    """Column profiles of one frame, computed once and read by every consumer."""
+
+    rows: int
+    columns: list[ColumnProfile]
+    memory_bytes: int
+    duplicate_count: int
+    exact: bool = True
+    sample_rows: int | None = None
+    confidence: float | None = None
+
+    @property
+    def column_names(self) -> list[Hashable]:
+        return [column.name for column in self.columns]
+
+    @property
+    def total_cells(self) -> int:
+        return self.rows * len(self.columns)
+
+    @property
+    def total_missing(self) -> int:
+        return sum(column.missing for column in self.columns)
+
+    @property
+    def missing_counts(self) -> pd.Series:
+        return pd.Series(
+            [column.missing for column in self.columns], index=self.column_names, dtype="int64"
+        )
+
+    def columns_of_kind(self, *kinds: str) -> list[Hashable]:
+        return [column.name for column in self.columns if column.kind in kinds]
+
+    @property
+    def numeric_columns(self) -> list[Hashable]:
+        return self.columns_of_kind("numeric")
+
+    @property
+    def categorical_columns(self) -> list[Hashable]:
+        return self.columns_of_kind("categorical")
+
+    @property
+    def datetime_columns(self) -> list[Hashable]:
+        return self.columns_of_kind("datetime")
+
+    def column(self, name: Hashable) -> ColumnProfile:
+        for column in self.columns:
+            if column.name == name:
+                return column
+        raise KeyError(name)
+
+    def describes(self, df: pd.DataFrame) -> bool:
+        """Whether this profile was built from a frame shaped like ``df``."""
+        return self.rows == len(df) and self.column_names == list(df.columns)
+
+    def describe_frame(self) -> pd.DataFrame:
+        """``df.select_dtypes('number').describe().T`` without touching the data."""
+        numeric = [column for column in self.columns if column.kind == "numeric"]
+        return pd.DataFrame(
+            [column.describe() for column in numeric],
+            index=[column.name for column in numeric],
+        )
+
+    def interval_frame(self) -> pd.DataFrame:
+        """Estimate and confidence bounds of every sampled statistic, one row each."""
+        records = [
+            {
+                "column": column.name,
+                "statistic": statistic,
+                "estimate": (
+                    column.n_unique
+                    if statistic == "n_unique"
+                    else column.describe().get(statistic, np.nan)
+                ),
+                "lower": low,
+                "upper": high,
+            }
+            for column in self.columns
+            for statistic, (low, high) in column.intervals.items()
+        ]
+        return pd.DataFrame(records, columns=["column", "statistic", "estimate", "lower", "upper"])
+
+    def missing_frame(self) -> pd.DataFrame:
+        """Missing count and percentage per column, most incomplete first."""
+        missing = self.missing_counts
+        return (
+            pd.DataFrame(
+                {
+                    "column": missing.index,
+                    "missing_count": missing.values,
+                    "missing_pct": missing.values / max(1, self.rows) * 100,
+                }
+            )
+            .sort_values(["missing_count", "column"], ascending=[False, True])
+            .reset_index(drop=True)
+        )
+
+
+def _sorted_quantile(values: np.ndarray, q: float) -> float:
+    """Linear-interpolated quantile of an already sorted array (pandas' default)."""
+    position = q * (values.size - 1)
+    lower = int(np.floor(position))
+    upper = min(lower + 1, values.size - 1)
+    return float(values[lower] + (values[upper] - values[lower]) * (position - lower))
+
+
+def _sample(uniques: Any, n_unique: int) -> list[Any]:
+    if n_unique > SAMPLE_MAX_UNIQUE:
+        return []
+    return uniques[:SAMPLE_SIZE].tolist()
+
+
+def resolve_distinct_mode(mode: str | None = None) -> str:
+    """'exact' or 'approx' (default: ``Settings.PROFILE_DISTINCT_MODE``)."""
+    mode = (mode or getattr(Settings, "PROFILE_DISTINCT_MODE", "exact")).lower()
+    if mode not in DISTINCT_MODES:
+        raise ValueError(f"Modo de contagem de distintos inválido: {mode} (use {DISTINCT_MODES})")
+    return mode
+
+
+def value_counts(values: pd.Series) -> pd.Series:
+    """Count of every non-null value, in first-appearance order.
+
+    One factorize (a single hash pass) plus a bincount; cheaper than
+    ``Series.value_counts``, which also sorts and boxes the result.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    return pd.Series(counts, index=pd.Index(uniques), dtype=np.int64)
+
+
+def _top_values(counts: pd.Series, k: int) -> list[tuple[Any, int]]:
+    """The ``k`` largest counts, ties in index order."""
+    if counts.empty or k <= 0:
+        return []
+    values = counts.to_numpy()
+    candidates = np.arange(values.size)
+    if k < values.size:
+        threshold = np.partition(values, values.size - k)[values.size - k]
+        candidates = np.flatnonzero(values >= threshold)
+    order = candidates[np.lexsort((candidates, -values[candidates]))][:k]
+    return [
+        (value, int(count))
+        for value, count in zip(counts.index[order].tolist(), values[order], strict=True)
+    ]
+
+
+def _sorted_value_counts(ordered: np.ndarray) -> pd.Series:
+    """Value counts of an already sorted array, read off its runs."""
+    if not ordered.size:
+        return pd.Series(dtype=np.int64)
+    starts = np.flatnonzero(np.concatenate(([True], ordered[1:] != ordered[:-1])))
+    counts = np.diff(np.append(starts, ordered.size))
+    return pd.Series(counts, index=ordered[starts], dtype=np.int64)
+
+
+def _sketch_counts(present: pd.Series, capacity: int) -> tuple[HyperLogLog, FrequentItemsSketch]:
+    """HyperLogLog and Space-Saving summaries of ``present``, chunk by chunk.
+
+    Each chunk is factorized once: its distinct values feed the
+    HyperLogLog (duplicates do not change it) and its counts the
+    frequent-items sketch, so no hash table ever holds more than one chunk.
+    """
+    distinct = HyperLogLog()
+    frequent = FrequentItemsSketch(capacity)
+    for start in range(0, len(present), DISTINCT_CHUNK_ROWS):
+        counts = value_counts(present.iloc[start : start + DISTINCT_CHUNK_ROWS])
+        distinct.update_hashes(hash_values(pd.Series(counts.index), distinct=True))
+        frequent.update_counts(counts)
+    return distinct, frequent
+
+
+def profile_column(
+    series: pd.Series, distinct: str | None = None, top_k: int = DEFAULT_TOP_K
+) -> ColumnProfile:
+    """Profile one column in a single scan of its values.
+
+    Numeric columns are sorted once: min, max, quantiles, the distinct
+    count and the most frequent values all come from the sorted copy. Other
+    columns are factorized once for the distinct count, top values and
+    sample. With ``distinct="approx"`` those columns are summarized chunk by
+    chunk with a HyperLogLog and a Space-Saving sketch instead, bounding
+    memory on high-cardinality text; counts stay exact while the sketches
+    have room (``ColumnProfile.exact`` tells).
+    """
+    kind = column_kind(series.dtype)
+    memory_bytes = int(series.memory_usage(deep=True, index=False))
+
+    if kind == "numeric":
+        if pd.api.types.is_integer_dtype(series.dtype):
+            # Distinct and top values on the integers themselves: float64 merges
+            # distinct values above 2**53. Casting a sorted array keeps it sorted.
+            unsigned = pd.api.types.is_unsigned_integer_dtype(series.dtype)
+            exact_values = np.sort(
+                series[series.notna()].to_numpy(dtype=np.uint64 if unsigned else np.int64)
+            )
+            ordered = exact_values.astype(np.float64)
+        else:
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            ordered = exact_values = np.sort(values[~np.isnan(values)])
+        count = int(ordered.size)
+        counts = _sorted_value_counts(exact_values)
+        n_unique = len(counts)
+        moments = MomentAccumulator.from_values(ordered)
+        profile = ColumnProfile(
+            name=series.name,
+            dtype=series.dtype,
+            kind=kind,
+            count=count,
+            missing=int(len(series) - count),
+            n_unique=n_unique,
+            memory_bytes=memory_bytes,
+            mean=moments.mean if count else np.nan,
+            std=moments.std,
+            skewness=moments.skewness,
+            kurtosis=moments.kurtosis,
+            top_values=_top_values(counts, top_k),
+        )
+        if count:
+            profile.min, profile.max = float(ordered[0]), float(ordered[-1])
+            profile.quantiles = {q: _sorted_quantile(ordered, q) for q in PROFILE_QUANTILES}
+        if n_unique <= SAMPLE_MAX_UNIQUE:
+            profile.sample = _sample(series[series.notna()].unique(), n_unique)
+        return profile
+
+    missing = series.isna().to_numpy()
+    present = series[~missing]
+    exact = True
+    if resolve_distinct_mode(distinct) == "approx":
+        sketch, frequent = _sketch_counts(present, max(DEFAULT_FREQUENT_CAPACITY, top_k))
+        n_unique = sketch.count()
+        exact = sketch.is_exact and not frequent.error
+        counts = frequent.counts
+    else:
+        counts = value_counts(present)
+        n_unique = len(counts)
+    profile = ColumnProfile(
+        name=series.name,
+        dtype=series.dtype,
+        kind=kind,
+        count=int(present.size),
+        missing=int(missing.sum()),
+        n_unique=n_unique,
+        memory_bytes=memory_bytes,
+        sample=_sample(counts.index, n_unique) if exact else [],
+        top_values=_top_values(counts, top_k),
+        exact=exact,
+    )
+    if kind == "datetime" and n_unique:
+        profile.min, profile.max = present.min(), present.max()
+    return profile
+
+
+def _profile_columns_batch(
+    columns: dict[int, pd.Series], distinct: str, top_k: int
+) -> dict[int, ColumnProfile]:
+    """Worker: profiles one batch of columns keyed by position."""
+    return {
+        position: profile_column(series, distinct=distinct, top_k=top_k)
+        for position, series in columns.items()
+    }
+
+
+def profile_dataframe(
+    df: pd.DataFrame,
+    duplicate_count: int | None = None,
+    executor: Executor | None = None,
+    distinct: str | None = None,
+    top_k: int = DEFAULT_TOP_K,
+) -> DatasetProfile:
+    """Profile every column of ``df`` in one pass over each column.
+
+    Pass ``duplicate_count`` when it is already known (e.g. from the dedup
+    step) to skip hashing every row. With an ``executor``, column batches are
+    profiled concurrently; the result is identical to the serial one.
+    ``distinct`` picks exact or sketch-based distinct counts and top values
+    for non-numeric columns (see :func:`profile_column`).
+    """
+    batches = run_column_batches(
+        partial(_profile_columns_batch, distinct=resolve_distinct_mode(distinct), top_k=top_k),
+        {position: df.iloc[:, position] for position in range(df.shape[1])},
+        executor,
+    )
+    columns = list(batches.values())
+    if duplicate_count is None:
+        duplicate_count = int(df.duplicated().sum()) if df.shape[1] else 0
+    memory_bytes = int(df.index.memory_usage(deep=True)) + sum(
+        column.memory_bytes for column in columns
+    )
+    return DatasetProfile(
+        rows=len(df),
+        columns=columns,
+        memory_bytes=memory_bytes,
+        duplicate_count=int(duplicate_count),
+        exact=all(column.exact for column in columns),
+    )
+
+
+def _restore_dtype(name: str) -> Any:
+    try:
+        return pd.api.types.pandas_dtype(name)
+    except TypeError:
+        return name
+
+
+def _timestamps(ns: Any, dtype: Any) -> pd.DatetimeIndex:
+    """Timestamps from nanoseconds since the epoch, in the timezone of ``dtype``."""
+    values = pd.DatetimeIndex(np.asarray(ns, dtype=np.int64).view("datetime64[ns]"))
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return values.tz_localize("UTC").tz_convert(dtype.tz)
+    return values
+
+
+@dataclass
+class ColumnState:
+    """Mergeable accumulators behind one :class:`ColumnProfile`."""
+
+    name: Hashable
+    dtype: str
+    kind: str
+    rows: int = 0
+    missing: int = 0
+    memory_bytes: int = 0
+    moments: MomentAccumulator = field(default_factory=MomentAccumulator)
+    quantiles: QuantileSketch = field(default_factory=QuantileSketch)
+    distinct: HyperLogLog = field(default_factory=HyperLogLog)
+    frequent: FrequentItemsSketch = field(default_factory=FrequentItemsSketch)
+    sample: list[Any] = field(default_factory=list)
+    # Datetime columns: min/max, sample and counted values as UTC nanoseconds
+    # since the epoch, so they round-trip through JSON; see to_profile.
+    extremes: list[int] | None = None
+
+    @classmethod
+    def for_series(cls, series: pd.Series) -> ColumnState:
+        return cls(name=series.name, dtype=str(series.dtype), kind=column_kind(series.dtype))
+
+    def update(self, series: pd.Series) -> np.ndarray:
+        """Add a chunk of the column; returns its per-row hashes."""
+        kind = column_kind(series.dtype)
+        if kind != self.kind:
+            raise ValueError(f"Coluna {self.name!r}: tipo {kind} incompatível com {self.kind}")
+        hashes = hash_values(series)
+        missing = series.isna().to_numpy()
+        present = series[~missing]
+        self.rows += len(series)
+        self.missing += int(missing.sum())
+        self.memory_bytes += int(series.memory_usage(deep=True, index=False))
+        self.distinct.update_hashes(hashes[~missing])
+        if kind == "numeric":
+            values = present.to_numpy(dtype=np.float64)
+            self.moments.update(values)
+            self.quantiles.update(values)
+        elif kind == "datetime" and len(present):
+            ns = present.to_numpy(dtype="datetime64[ns]").view(np.int64)
+            self._merge_extremes([int(ns.min()), int(ns.max())])
+            present = pd.Series(ns)
+        self.frequent.update_counts(value_counts(present))
+        if len(self.sample) < SAMPLE_SIZE and self.distinct.count() <= SAMPLE_MAX_UNIQUE:
+            self._merge_sample(present.unique()[:SAMPLE_SIZE].tolist())
+        return hashes
+
+    def _merge_extremes(self, extremes: list[int] | None) -> None:
+        if extremes is None:
+            return
+        if self.extremes is None:
+            self.extremes = list(extremes)
+        else:
+            self.extremes = [min(self.extremes[0], extremes[0]), max(self.extremes[1], extremes[1])]
+
+    def _merge_sample(self, values: list[Any]) -> None:
+        for value in values:
+            if len(self.sample) >= SAMPLE_SIZE:
+                break
+            if value not in self.sample:
+                self.sample.append(value)
+
+    def merge(self, other: ColumnState) -> ColumnState:
+        if other.kind != self.kind:
+            raise ValueError(
+                f"Coluna {self.name!r}: tipo {other.kind} incompatível com {self.kind}"
+            )
+        self.rows += other.rows
+        self.missing += other.missing
+        self.memory_bytes += other.memory_bytes
+        self.moments.merge(other.moments)
+        self.quantiles.merge(other.quantiles)
+        self.distinct.merge(other.distinct)
+        self.frequent.merge(other.frequent)
+        self._merge_sample(other.sample)
+        self._merge_extremes(other.extremes)
+        return self
+
+    def to_profile(self) -> ColumnProfile:
+        count = self.rows - self.missing
+        n_unique = self.distinct.count()
+        counts = self.frequent.counts
+        dtype = _restore_dtype(self.dtype)
+        sample = list(self.sample) if n_unique <= SAMPLE_MAX_UNIQUE else []
+        if self.kind == "datetime":
+            counts = pd.Series(counts.to_numpy(), index=_timestamps(counts.index, dtype))
+            sample = list(_timestamps(sample, dtype))
+        profile = ColumnProfile(
+            name=self.name,
+            dtype=dtype,
+            kind=self.kind,
+            count=count,
+            missing=self.missing,
+            n_unique=n_unique,
+            memory_bytes=self.memory_bytes,
+            sample=sample,
+            top_values=_top_values(counts, DEFAULT_TOP_K),
+            exact=self.distinct.is_exact and self.quantiles.is_exact and not self.frequent.error,
+        )
+        if self.kind == "numeric" and count:
+            moments = self.moments
+            profile.mean, profile.std = moments.mean, moments.std
+            profile.skewness, profile.kurtosis = moments.skewness, moments.kurtosis
+            profile.min, profile.max = moments.min, moments.max
+            profile.quantiles = {q: self.quantiles.quantile(q) for q in PROFILE_QUANTILES}
+        elif self.extremes is not None:
+            profile.min, profile.max = _timestamps(self.extremes, dtype)
+        return profile
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "dtype": self.dtype,
+            "kind": self.kind,
+            "rows": self.rows,
+            "missing": self.missing,
+            "memory_bytes": self.memory_bytes,
+            "moments": self.moments.to_dict(),
+            "quantiles": self.quantiles.to_dict(),
+            "distinct": self.distinct.to_dict(),
+            "frequent": self.frequent.to_dict(),
+            "sample": self.sample,
+            "extremes": self.extremes,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> ColumnState:
+        return cls(
+            name=payload["name"],
+            dtype=payload["dtype"],
+            kind=payload["kind"],
+            rows=payload["rows"],
+            missing=payload["missing"],
+            memory_bytes=payload["memory_bytes"],
+            moments=MomentAccumulator.from_dict(payload["moments"]),
+            quantiles=QuantileSketch.from_dict(payload["quantiles"]),
+            distinct=HyperLogLog.from_dict(payload["distinct"]),
+            frequent=FrequentItemsSketch.from_dict(payload["frequent"]),
+            sample=payload["sample"],
+            extremes=payload["extremes"],
+        )
+
+
+def _row_hashes() -> HyperLogLog:
+    return HyperLogLog(precision=ROW_HASH_PRECISION, exact_limit=ROW_HASH_EXACT_LIMIT)
+
+
+@dataclass
+class ProfileState:
+    """Mergeable profile of a dataset seen in chunks.
+
+    ``update`` costs one pass over the new rows; ``merge`` combines states of
+    disjoint row sets (chunks, workers or appends). Counts and moments are
+    exact; quantiles and distinct counts are exact until the sketches fill
+    up (``QuantileSketch`` capacity, ``DEFAULT_HLL_EXACT_LIMIT`` values) and
+    approximate afterwards. Duplicates come from a distinct count of row
+    hashes, exact up to ``ROW_HASH_EXACT_LIMIT`` distinct rows. Null positions
+    are not kept, only their counts.
+    """
+
+    columns: list[ColumnState] = field(default_factory=list)
+    rows: int = 0
+    row_hashes: HyperLogLog = field(default_factory=_row_hashes)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> ProfileState:
+        return cls().update(df)
+
+    @property
+    def column_names(self) -> list[Hashable]:
+        return [column.name for column in self.columns]
+
+    def _check_columns(self, names: list[Hashable]) -> None:
+        if names != self.column_names:
+            raise ValueError(
+                f"Colunas incompatíveis com o perfil: {names} (esperado {self.column_names})"
+            )
+
+    def update(self, df: pd.DataFrame) -> ProfileState:
+        if not self.columns:
+            self.columns = [
+                ColumnState.for_series(df.iloc[:, position]) for position in range(df.shape[1])
+            ]
+        self._check_columns(list(df.columns))
+        combined = np.zeros(len(df), dtype=np.uint64)
+        for position, column in enumerate(self.columns):
+            hashes = column.update(df.iloc[:, position])
+            combined = combined * np.uint64(1_000_003) ^ hashes
+        self.rows += len(df)
+        if self.columns:
+            self.row_hashes.update_hashes(combined)
+        return self
+
+    def merge(self, other: ProfileState) -> ProfileState:
+        if not self.columns:
+            self.columns = [ColumnState.from_dict(column.to_dict()) for column in other.columns]
+        else:
+            self._check_columns(other.column_names)
+            for column, other_column in zip(self.columns, other.columns, strict=True):
+                column.merge(other_column)
+        self.rows += other.rows
+        self.row_hashes.merge(other.row_hashes)
+        return self
+
+    @property
+    def duplicate_count(self) -> int:
+        if not self.rows or not self.columns:
+            return 0
+        return max(0, self.rows - self.row_hashes.count())
+
+    def to_profile(self) -> DatasetProfile:
+        columns = [column.to_profile() for column in self.columns]
+        return DatasetProfile(
+            rows=self.rows,
+            columns=columns,
+            memory_bytes=sum(column.memory_bytes for column in columns),
+            duplicate_count=self.duplicate_count,
+            exact=self.row_hashes.is_exact and all(column.exact for column in columns),
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "version": PROFILE_STATE_VERSION,
+                "rows": self.rows,
+                "row_hashes": self.row_hashes.to_dict(),
+                "columns": [column.to_dict() for column in self.columns],
+            },
+            ensure_ascii=False,
+            default=str,
+        )
+
+    @classmethod
+    def from_json(cls, payload: str) -> ProfileState:
+        data = json.loads(payload)
+        if data.get("version") != PROFILE_STATE_VERSION:
+            raise ValueError(f"Versão de perfil não suportada: {data.get('version')}")
+        return cls(
+            columns=[ColumnState.from_dict(column) for column in data["columns"]],
+            rows=data["rows"],
+            row_hashes=HyperLogLog.from_dict(data["row_hashes"]),
+        )
@@ -0,0 +1,216 @@
+"""Sample-based dataset profiles with confidence intervals and background refinement.
+
+On very large frames :func:`sample_profile` answers in roughly constant time:
+counts, nulls and min/max are computed exactly (single vectorized passes),
+everything else comes from a stratified row sample and carries a confidence
+interval. :class:`ProfileRefinement` hands out that profile immediately and
+replaces it with the exact one once a background job finishes.
+"""
+
+from __future__ import annotations
+
+import math
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import lru_cache
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from config.settings import Settings
+from src.analysis.profiler import (
+    PROFILE_QUANTILES,
+    ColumnProfile,
+    DatasetProfile,
+    profile_dataframe,
+)
+
+PROFILE_MODES = ("exact", "sample", "auto")
+DEFAULT_PROFILE_CONFIDENCE = 0.95
+
+
+def resolve_profile_mode(mode: str | None, rows: int) -> str:
+    """'exact' or 'sample' for a frame of ``rows`` rows (default: ``Settings.PROFILE_MODE``).
+
+    'auto' samples frames larger than ``Settings.PROFILE_AUTO_SAMPLE_ROWS``.
+    """
+    mode = (mode or getattr(Settings, "PROFILE_MODE", "exact")).lower()
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Modo de perfil inválido: {mode} (use {PROFILE_MODES})")
+    if mode == "auto":
+        threshold = int(getattr(Settings, "PROFILE_AUTO_SAMPLE_ROWS", 1_000_000))
+        return "sample" if rows > threshold else "exact"
+    return mode
+
+
+def _sample_size(size: int | None) -> int:
+    return int(size or getattr(Settings, "PROFILE_SAMPLE_SIZE", 50_000))
+
+
+def sample_positions(rows: int, size: int | None = None, seed: int = 0) -> np.ndarray | None:
+    """Sorted row positions of a stratified sample, or None when every row fits.
+
+    The rows are cut into ``size`` equal strata and one row is drawn from
+    each, so ordered data (dates, appended batches) is covered evenly.
+    """
+    size = _sample_size(size)
+    if rows <= size:
+        return None
+    edges = np.linspace(0, rows, size + 1).astype(np.int64)
+    widths = np.diff(edges)
+    offsets = np.floor(np.random.default_rng(seed).random(size) * widths).astype(np.int64)
+    return edges[:-1] + offsets
+
+
+def sample_frame(df: pd.DataFrame, size: int | None = None, seed: int = 0) -> pd.DataFrame:
+    """The stratified sample behind :func:`sample_profile` (``df`` itself when small)."""
+    positions = sample_positions(len(df), size, seed)
+    return df if positions is None else df.iloc[positions]
+
+
+def count_duplicate_rows(df: pd.DataFrame) -> int:
+    """Duplicate rows from one vectorized hash per row and a sort."""
+    if not df.shape[1] or len(df) < 2:
+        return 0
+    try:
+        hashes = np.sort(pd.util.hash_pandas_object(df, index=False).to_numpy())
+    except TypeError:  # unhashable cells (lists, dicts)
+        return int(df.duplicated().sum())
+    return int(np.count_nonzero(hashes[1:] == hashes[:-1]))
+
+
+def _distinct_interval(values: pd.Series, present_rows: int) -> tuple[int, tuple[float, float]]:
+    """GEE distinct-count estimate (Charikar et al.) and its bounds from a sample.
+
+    Values seen once in the sample stand for up to ``present_rows / sampled``
+    distinct values each; values seen more often are assumed to be all there is.
+    """
+    counts = values.value_counts(dropna=True)
+    distinct = len(counts)
+    sampled = int(counts.sum())
+    if not sampled or sampled >= present_rows:
+        return distinct, (distinct, distinct)
+    singletons = int((counts == 1).sum())
+    scale = present_rows / sampled
+    upper = min(present_rows, scale * singletons + distinct - singletons)
+    estimate = min(upper, math.sqrt(scale) * singletons + distinct - singletons)
+    return int(round(estimate)), (float(distinct), float(upper))
+
+
+def _numeric_intervals(
+    column: ColumnProfile, values: np.ndarray, present_rows: int, z: float
+) -> dict[str, tuple[float, float]]:
+    """Normal-approximation CI of the mean and order-statistic CIs of the quartiles."""
+    ordered = np.sort(values[~np.isnan(values)])
+    sampled = ordered.size
+    if sampled < 2:
+        return {}
+    correction = math.sqrt(max(0.0, 1 - sampled / present_rows)) if present_rows else 0.0
+    half_width = z * column.std / math.sqrt(sampled) * correction
+    intervals = {"mean": (column.mean - half_width, column.mean + half_width)}
+    for q in PROFILE_QUANTILES:
+        spread = z * math.sqrt(q * (1 - q) / sampled)
+        low = int(np.clip(math.floor((q - spread) * (sampled - 1)), 0, sampled - 1))
+        high = int(np.clip(math.ceil((q + spread) * (sampled - 1)), 0, sampled - 1))
+        intervals[f"{q:.0%}"] = (float(ordered[low]), float(ordered[high]))
+    return intervals
+
+
+def sample_profile(
+    df: pd.DataFrame,
+    sample_size: int | None = None,
+    confidence: float = DEFAULT_PROFILE_CONFIDENCE,
+    duplicate_count: int | None = None,
+    seed: int = 0,
+) -> DatasetProfile:
+    """Profile ``df`` from a stratified sample, with exact counts and extremes.
+
+    Rows, null counts and numeric/datetime min/max are exact. Moments,
+    quartiles and distinct counts are estimated on the sample, each with a
+    ``confidence`` interval in ``ColumnProfile.intervals``; memory and top
+    value counts are scaled from the sample. Duplicates are counted exactly
+    from row hashes unless ``duplicate_count`` is given. Frames no larger
+    than the sample are profiled exactly.
+    """
+    rows = len(df)
+    positions = sample_positions(rows, sample_size, seed)
+    if positions is None:
+        return profile_dataframe(df, duplicate_count=duplicate_count)
+    sample = df.iloc[positions]
+    profile = profile_dataframe(sample, duplicate_count=0)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    scale = rows / len(positions)
+
+    for position, column in enumerate(profile.columns):
+        series = df.iloc[:, position]
+        sampled = sample.iloc[:, position]
+        column.missing = int(series.isna().sum())
+        column.count = rows - column.missing
+        column.memory_bytes = int(column.memory_bytes * scale)
+        column.top_values = [(value, round(count * scale)) for value, count in column.top_values]
+        column.exact = False
+        column.n_unique, column.intervals["n_unique"] = _distinct_interval(sampled, column.count)
+        if column.kind == "numeric" and column.count:
+            column.min, column.max = float(series.min()), float(series.max())
+            values = sampled.to_numpy(dtype=np.float64, na_value=np.nan)
+            column.intervals.update(_numeric_intervals(column, values, column.count, z))
+        elif column.kind == "datetime" and column.count:
+            column.min, column.max = series.min(), series.max()
+
+    if duplicate_count is None:
+        duplicate_count = count_duplicate_rows(df)
+    return DatasetProfile(
+        rows=rows,
+        columns=profile.columns,
+        memory_bytes=int(df.index.memory_usage(deep=False))
+        + sum(column.memory_bytes for column in profile.columns),
+        duplicate_count=int(duplicate_count),
+        exact=False,
+        sample_rows=len(positions),
+        confidence=confidence,
+    )
+
+
+@lru_cache(maxsize=1)
+def refinement_executor() -> ThreadPoolExecutor:
+    """Single background worker shared by all refinements (one exact profile at a time)."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="profile-refine")
+
+
+class ProfileRefinement:
+    """A sampled profile available now and the exact one computed in the background.
+
+    ``df`` must not be mutated until :meth:`done`, or the exact profile
+    describes the mutated frame. If the exact job fails, :attr:`profile`
+    keeps returning the sampled profile.
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        duplicate_count: int | None = None,
+        sample_size: int | None = None,
+        confidence: float = DEFAULT_PROFILE_CONFIDENCE,
+        executor: Executor | None = None,
+    ):
+        self.sampled = sample_profile(
+            df, sample_size=sample_size, confidence=confidence, duplicate_count=duplicate_count
+        )
+        executor = refinement_executor() if executor is None else executor
+        self._future: Future[DatasetProfile] = executor.submit(
+            profile_dataframe, df, duplicate_count
+        )
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    @property
+    def profile(self) -> DatasetProfile:
+        """The exact profile when ready, otherwise the sampled one."""
+        if self._future.done() and self._future.exception() is None:
+            return self._future.result()
+        return self.sampled
+
+    def result(self, timeout: float | None = None) -> DatasetProfile:
+        """Wait for the exact profile."""
+        return self._future.result(timeout=timeout)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Hashable
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from typing import Any
 
@@ -13,8 +15,12 @@ from dashboard.utils.analytics import (
     build_priority_actions,
 )
 from src.app.privacy_guard import build_privacy_snapshot, mask_sensitive_dataframe
+from src.analysis.correlation import CorrelationResult, compute_correlations
 from src.analysis.exploratory import ExploratoryAnalyzer
-from src.data.transformer import DataTransformer
+from src.analysis.profiler import DatasetProfile, profile_dataframe
+from src.analysis.sampling import ProfileRefinement, resolve_profile_mode, sample_frame
+from src.data.polars_backend import PolarsTransformer, resolve_backend
+from src.data.transform_plan import PlanCache, curation_plan
 
 
 @dataclass
@@ -28,6 +34,9 @@ class CurationArtifacts:
     business_snapshot: dict[str, Any]
     privacy_snapshot: dict[str, Any]
     masked_curated_df: pd.DataFrame
+    profile: DatasetProfile | None = None
+    correlations: CorrelationResult | None = None
+    profile_refinement: ProfileRefinement | None = None
 
     @property
     def executive_snapshot(self) -> dict[str, Any]:
@@ -35,22 +44,113 @@ class CurationArtifacts:
         return self.business_snapshot
 
 
-def curate_dataset(df: pd.DataFrame) -> CurationArtifacts:
-    """Run the end-to-end curation and profiling pipeline."""
-    raw_df = df.copy()
-    transformer = DataTransformer()
-    curated_df = transformer.clean_column_names(raw_df)
-    curated_df = transformer.convert_dtypes(curated_df)
-    curated_df = transformer.handle_missing_values(curated_df, strategy="auto")
-    curated_df = transformer.remove_duplicates(curated_df)
-
-    analyzer = ExploratoryAnalyzer()
-    analysis = analyzer.analyze_dataframe(curated_df, df_name="active_dataset")
-    transform_log = transformer.get_transformation_log()
-    quality_summary = build_data_quality_summary(curated_df)
-    priority_actions = build_priority_actions(quality_summary)
+def generated_columns(transform_log: list[dict[str, Any]]) -> set[Hashable]:
+    """Columns added by ``create_features`` steps of a transform log."""
+    return {
+        column
+        for entry in transform_log
+        if entry.get("operation") == "create_features"
+        for column in entry.get("details", {}).get("new_columns", [])
+    }
+
+
+def correlation_columns(
+    profile: DatasetProfile, transform_log: list[dict[str, Any]]
+) -> list[Hashable]:
+    """Numeric columns to correlate: every one except generated calendar features.
+
+    Features such as ``<col>_month`` and ``<col>_quarter`` restate their
+    source date, so they only correlate with each other and would crowd the
+    matrix and the strong-correlation insight.
+    """
+    generated = generated_columns(transform_log)
+    return [column for column in profile.numeric_columns if column not in generated]
+
+
+def profile_reports(
+    curated_df: pd.DataFrame,
+    profile: DatasetProfile,
+    correlations: CorrelationResult | None = None,
+    executor: Executor | None = None,
+) -> tuple[dict[str, Any], dict[str, Any], list[str]]:
+    """Analysis, quality summary and priority actions built from one profile.
+
+    Rebuild them when the exact profile of a sampled curation arrives.
+    """
+    analyzer = ExploratoryAnalyzer(executor=executor)
+    analysis = analyzer.analyze_dataframe(
+        curated_df, df_name="active_dataset", profile=profile, correlations=correlations
+    )
+    quality_summary = build_data_quality_summary(curated_df, profile=profile)
+    return analysis, quality_summary, build_priority_actions(quality_summary)
+
+
+def curate_dataset(
+    df: pd.DataFrame,
+    keep_original_copy: bool = False,
+    executor: Executor | None = None,
+    optimize_memory: bool = False,
+    plan_cache: PlanCache | None = None,
+    backend: str | None = None,
+    date_features: bool = True,
+    profile_mode: str | None = None,
+) -> CurationArtifacts:
+    """Run the end-to-end curation and profiling pipeline.
+
+    The transformer runs in pipeline mode: no step mutates its input and only
+    changed columns are reallocated, so raw, curated and masked frames share
+    the untouched columns. Pass ``keep_original_copy=True`` when the caller
+    will keep mutating ``df`` in place and needs an isolated raw snapshot.
+    With an ``executor``, dtype conversion, missing-value filling, profiling
+    and the privacy content scan run column batches in parallel.
+    ``date_features`` adds compact calendar features for every datetime
+    column; they are profiled but left out of the correlations and the
+    insights built on them. ``optimize_memory`` adds a final stage that
+    downcasts numerics and stores low-cardinality text as ``category``.
+    The steps run as a :class:`TransformPlan`. With a ``plan_cache`` (owned by
+    the caller, e.g. one per session), curating the same input again, or
+    toggling only ``optimize_memory``, reuses the earlier steps and the curated
+    frame is the caller's own copy, never the cached one; without it nothing
+    is kept after the call.
+    ``backend="polars"`` (or ``Settings.TRANSFORM_BACKEND``) runs the chain on
+    Polars instead, converting only at the boundaries; the artifacts are the same.
+    ``profile_mode`` (default ``Settings.PROFILE_MODE``) set to ``"sample"``, or
+    ``"auto"`` on very large frames, profiles a stratified sample with
+    confidence intervals and correlates that sample; the exact profile is then
+    computed in the background and exposed through ``profile_refinement``.
+    """
+    raw_df = df.copy() if keep_original_copy else df
+    if resolve_backend(backend) == "polars":
+        transformer = PolarsTransformer()
+        curated_df = transformer.curate(
+            raw_df, optimize_memory=optimize_memory, date_features=date_features
+        )
+        transform_log = transformer.get_transformation_log()
+    else:
+        plan = curation_plan(optimize_memory=optimize_memory, date_features=date_features)
+        plan_result = plan.execute(raw_df, cache=plan_cache, executor=executor)
+        curated_df = plan_result.frame
+        transform_log = plan_result.transform_log
+
+    # remove_duplicates ran on full rows, so the curated frame has none left.
+    # One profiling pass and one correlation matrix feed the analysis, the
+    # quality summary and the EDA page.
+    refinement = None
+    correlation_frame = curated_df
+    if resolve_profile_mode(profile_mode, len(curated_df)) == "sample":
+        refinement = ProfileRefinement(curated_df, duplicate_count=0)
+        profile = refinement.sampled
+        correlation_frame = sample_frame(curated_df)
+    else:
+        profile = profile_dataframe(curated_df, duplicate_count=0, executor=executor)
+    correlations = compute_correlations(
+        correlation_frame, columns=correlation_columns(profile, transform_log)
+    )
+    analysis, quality_summary, priority_actions = profile_reports(
+        curated_df, profile, correlations, executor=executor
+    )
     business_snapshot = build_business_snapshot(curated_df)
-    privacy_snapshot = build_privacy_snapshot(curated_df)
+    privacy_snapshot = build_privacy_snapshot(curated_df, executor=executor)
     masked_curated_df = mask_sensitive_dataframe(curated_df, privacy_snapshot["personal_columns"])
 
     return CurationArtifacts(
@@ -63,4 +163,7 @@ def curate_dataset(df: pd.DataFrame) -> CurationArtifacts:
         business_snapshot=business_snapshot,
         privacy_snapshot=privacy_snapshot,
         masked_curated_df=masked_curated_df,
+        profile=profile,
+        correlations=correlations,
+        profile_refinement=refinement,
     )
@@ -4,18 +4,23 @@ from __future__ import annotations
 
 import json
 import re
+from concurrent.futures import Executor
 from dataclasses import dataclass
-from functools import lru_cache
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
 
+from src.utils.parallel import run_column_batches
+
 POLICY_PATH = Path(__file__).resolve().parents[2] / "config" / "privacy_policy.json"
 
 EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 CPF_RE = re.compile(r"^\d{11}$")
 PHONE_RE = re.compile(r"^\+?\d{10,13}$")
+# Values per column matched against the content rules.
+CONTENT_SAMPLE_SIZE = 100
 
 
 @lru_cache(maxsize=1)
@@ -24,64 +29,91 @@ def load_privacy_policy() -> dict[str, Any]:
         return json.load(policy_file)
 
 
-def _looks_like_email(series: pd.Series, min_ratio: float) -> bool:
-    non_null = series.dropna().astype(str).str.strip()
-    if non_null.empty:
-        return False
-    sample = non_null.head(100)
-    ratio = float(sample.apply(lambda value: bool(EMAIL_RE.match(value))).mean())
-    return ratio >= min_ratio
+def _content_sample(series: pd.Series) -> pd.Series:
+    """First ``CONTENT_SAMPLE_SIZE`` non-null values as stripped text.
 
+    Only a growing head of the column is read, not the whole column.
+    """
+    window = CONTENT_SAMPLE_SIZE
+    while True:
+        head = series.iloc[:window].dropna()
+        if len(head) >= CONTENT_SAMPLE_SIZE or window >= len(series):
+            break
+        window *= 4
+    return head.head(CONTENT_SAMPLE_SIZE).astype(str).str.strip()
 
-def _looks_like_cpf(series: pd.Series, min_ratio: float) -> bool:
-    non_null = series.dropna().astype(str).str.strip()
-    if non_null.empty:
-        return False
-    sample = non_null.head(100)
-    ratio = float(sample.apply(lambda value: bool(CPF_RE.match(re.sub(r"\D", "", value)))).mean())
-    return ratio >= min_ratio
 
-
-def _looks_like_phone(series: pd.Series, min_ratio: float) -> bool:
-    non_null = series.dropna().astype(str).str.strip()
-    if non_null.empty:
+def _looks_like_identifier(series: pd.Series, content_rules: dict[str, Any]) -> bool:
+    """Whether enough leading values look like an e-mail, CPF or phone number."""
+    sample = _content_sample(series)
+    if sample.empty:
         return False
-    sample = non_null.head(100)
-    ratio = float(sample.apply(lambda value: bool(PHONE_RE.match(re.sub(r"\D", "", value)))).mean())
-    return ratio >= min_ratio
+    digits = sample.str.replace(r"\D", "", regex=True)
+    return (
+        float(sample.str.fullmatch(EMAIL_RE).mean()) >= float(content_rules["email_min_ratio"])
+        or float(digits.str.fullmatch(CPF_RE).mean()) >= float(content_rules["cpf_min_ratio"])
+        or float(digits.str.fullmatch(PHONE_RE).mean()) >= float(content_rules["phone_min_ratio"])
+    )
+
+
+def _is_text_column(series: pd.Series) -> bool:
+    return (
+        pd.api.types.is_object_dtype(series)
+        or pd.api.types.is_string_dtype(series)
+        or isinstance(series.dtype, pd.CategoricalDtype)
+    )
+
+
+def _scan_content_batch(
+    columns: dict[int, pd.Series], content_rules: dict[str, Any]
+) -> dict[int, bool]:
+    """Worker: content scan of one batch of text columns keyed by position."""
+    return {
+        position: _looks_like_identifier(series, content_rules)
+        for position, series in columns.items()
+    }
+
 
+def detect_sensitive_columns(
+    df: pd.DataFrame, executor: Executor | None = None
+) -> dict[str, list[str]]:
+    """Classify columns that should trigger privacy controls.
 
-def detect_sensitive_columns(df: pd.DataFrame) -> dict[str, list[str]]:
-    """Classify columns that should trigger privacy controls."""
+    Names are matched against the policy patterns; text columns are also
+    scanned by content, in column batches on ``executor`` when one is given.
+    """
     policy = load_privacy_policy()
     direct_patterns = tuple(policy["direct_identifier_patterns"])
     sensitive_patterns = tuple(policy["sensitive_patterns"])
     quasi_patterns = tuple(policy["quasi_identifier_patterns"])
-    content_rules = policy["content_rules"]
 
     direct_identifiers: list[str] = []
     sensitive_columns: list[str] = []
     quasi_identifiers: list[str] = []
 
-    for column in df.columns:
-        normalized = str(column).lower()
-        series = df[column]
+    names = [str(column).lower() for column in df.columns]
+    text_columns = {
+        position: df.iloc[:, position]
+        for position, normalized in enumerate(names)
+        if not any(pattern in normalized for pattern in sensitive_patterns)
+        and _is_text_column(df.iloc[:, position])
+    }
+    content_flags = run_column_batches(
+        partial(_scan_content_batch, content_rules=policy["content_rules"]),
+        text_columns,
+        executor,
+    )
 
+    for position, (column, normalized) in enumerate(zip(df.columns, names, strict=True)):
         if any(pattern in normalized for pattern in sensitive_patterns):
             sensitive_columns.append(column)
             continue
 
-        is_direct = any(pattern in normalized for pattern in direct_patterns)
+        is_direct = content_flags.get(position, False) or any(
+            pattern in normalized for pattern in direct_patterns
+        )
         is_quasi = any(pattern in normalized for pattern in quasi_patterns)
 
-        if pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
-            if _looks_like_email(series, float(content_rules["email_min_ratio"])):
-                is_direct = True
-            if _looks_like_cpf(series, float(content_rules["cpf_min_ratio"])):
-                is_direct = True
-            if _looks_like_phone(series, float(content_rules["phone_min_ratio"])):
-                is_direct = True
-
         if is_direct:
             direct_identifiers.append(column)
         elif is_quasi:
@@ -107,16 +139,17 @@ def _mask_value(value: Any) -> Any:
 
 
 def mask_sensitive_dataframe(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
-    masked = df.copy()
+    # Shallow copy: only the masked columns are reallocated.
+    masked = df.copy(deep=False)
     for column in columns:
         if column in masked.columns:
             masked[column] = masked[column].apply(_mask_value)
     return masked
 
 
-def build_privacy_snapshot(df: pd.DataFrame) -> dict[str, Any]:
+def build_privacy_snapshot(df: pd.DataFrame, executor: Executor | None = None) -> dict[str, Any]:
     """Build LGPD-oriented privacy controls for UI and persistence decisions."""
-    classifications = detect_sensitive_columns(df)
+    classifications = detect_sensitive_columns(df, executor=executor)
     direct_identifiers = classifications["direct_identifiers"]
     sensitive_columns = classifications["sensitive_columns"]
     quasi_identifiers = classifications["quasi_identifiers"]
@@ -0,0 +1,121 @@
+"""Opt-in incremental profiles kept next to tables stored in SQLite.
+
+:func:`save_with_profile` and :func:`save_chunks_with_profile` write through
+:class:`SQLiteManager` and keep a mergeable :class:`ProfileState` of the table
+in its ``dataset_profiles`` table: rebuilt on replace, and merged with a
+profile of only the new rows on append. :func:`load_dataset_profile` then
+returns the table's profile without reading its rows. Plain
+``SQLiteManager`` writes drop the stored state, so it never describes only
+part of a table.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import pandas as pd
+
+from src.analysis.profiler import DatasetProfile, ProfileState
+from src.data.sqlite_manager import SQLiteManager
+
+logger = logging.getLogger(__name__)
+
+
+def load_profile_state(manager: SQLiteManager, table_name: str) -> ProfileState | None:
+    """Stored profile state of a table; None when untracked or saved by an older format."""
+    payload = manager.get_profile_payload(table_name)
+    if payload is None:
+        return None
+    try:
+        return ProfileState.from_json(payload)
+    except ValueError as exc:
+        logger.warning(f"Perfil de '{table_name}' ignorado: {exc}")
+        return None
+
+
+def load_dataset_profile(manager: SQLiteManager, table_name: str) -> DatasetProfile | None:
+    """Profile of a stored table without reading its rows."""
+    state = load_profile_state(manager, table_name)
+    return None if state is None else state.to_profile()
+
+
+def _update(state: ProfileState | None, df: pd.DataFrame, table_name: str) -> ProfileState | None:
+    """Add rows to a profile state; None once the rows cannot be profiled."""
+    if state is None:
+        return None
+    try:
+        return state.update(df)
+    except (TypeError, ValueError) as exc:  # unhashable cells or changing column types
+        logger.warning(f"Perfil de '{table_name}' não será mantido: {exc}")
+        return None
+
+
+def _base_state(manager: SQLiteManager, table_name: str, if_exists: str) -> ProfileState | None:
+    """Profile of the rows the write keeps: empty unless appending to an existing table.
+
+    Must run before the write, which drops the stored state. Appending to a
+    table without a stored state gives None (its earlier rows are unknown).
+    """
+    if if_exists != "append" or table_name not in manager.list_tables():
+        return ProfileState()
+    return load_profile_state(manager, table_name)
+
+
+def _store(
+    manager: SQLiteManager, table_name: str, base: ProfileState | None, new: ProfileState | None
+) -> None:
+    state = None
+    if base is not None and new is not None:
+        try:
+            state = base.merge(new)
+        except ValueError as exc:
+            logger.warning(f"Perfil de '{table_name}' descartado: {exc}")
+    if state is not None:
+        manager.store_profile_payload(table_name, state.rows, state.to_json())
+
+
+def save_with_profile(
+    manager: SQLiteManager,
+    df: pd.DataFrame,
+    table_name: str,
+    if_exists: str = "replace",
+    metadata: dict[str, Any] | None = None,
+) -> bool:
+    """``manager.df_to_sql`` that keeps the table's profile state up to date.
+
+    On append only ``df`` is profiled and merged into the stored state.
+    """
+    base = _base_state(manager, table_name, if_exists)
+    new = _update(ProfileState(), df, table_name)
+    if not manager.df_to_sql(df, table_name, if_exists=if_exists, metadata=metadata):
+        return False
+    _store(manager, table_name, base, new)
+    return True
+
+
+def save_chunks_with_profile(
+    manager: SQLiteManager,
+    chunks: Iterable[pd.DataFrame],
+    table_name: str,
+    if_exists: str = "replace",
+    metadata: dict[str, Any] | None = None,
+) -> bool:
+    """``manager.df_chunks_to_sql`` profiling each chunk as it is written.
+
+    Tables larger than memory are profiled in the same single pass.
+    """
+    base = _base_state(manager, table_name, if_exists)
+    new: ProfileState | None = ProfileState()
+
+    def profiled() -> Iterator[pd.DataFrame]:
+        nonlocal new
+        for chunk in chunks:
+            new = _update(new, chunk, table_name)
+            yield chunk
+
+    if not manager.df_chunks_to_sql(profiled(), table_name, if_exists=if_exists, metadata=metadata):
+        return False
+    _store(manager, table_name, base, new)
+    return True
@@ -0,0 +1,380 @@
+"""Streaming curation for inputs larger than memory.
+
+Mirrors :func:`src.app.curation_service.curate_dataset` (clean names, type
+inference, auto fill, duplicate removal, date features) without ever holding
+the whole dataset. Pass 1 reads every chunk once and keeps only mergeable statistics
+per column: row and null counts, dtype votes, a quantile sketch for medians
+and a frequent-items sketch for modes. Pass 2 re-reads the chunks, applies
+the decided types and fill values, and streams them through the out-of-core
+deduplicator into a Parquet file or a SQLite table.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from src.data.date_features import add_date_features
+from src.data.dedup import DEFAULT_DEDUP_PARTITIONS, ChunkedDeduplicator
+from src.data.transformer import clean_column_name
+from src.data.type_inference import MIXED_DATE_FORMAT, TypeInferenceEngine, default_type_engine
+from src.utils.sketches import (
+    DEFAULT_FREQUENT_CAPACITY,
+    DEFAULT_QUANTILE_K,
+    FrequentItemsSketch,
+    QuantileSketch,
+)
+
+if TYPE_CHECKING:
+    from src.data.file_extractor import FileExtractor
+    from src.data.sqlite_manager import SQLiteManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STREAM_CHUNKSIZE = 100_000
+ChunkSource = Callable[[], Iterable[pd.DataFrame]]
+
+
+@dataclass
+class ColumnStats:
+    """Mergeable pass-1 statistics for one column."""
+
+    rows: int = 0
+    nulls: int = 0
+    kinds: set[str] = field(default_factory=set)
+    date_formats: set[str] = field(default_factory=set)
+    quantiles: QuantileSketch = field(default_factory=QuantileSketch)
+    frequent: FrequentItemsSketch = field(default_factory=FrequentItemsSketch)
+
+    def observe(self, series: pd.Series, engine: TypeInferenceEngine) -> None:
+        self.rows += len(series)
+        nulls = int(series.isna().sum())
+        self.nulls += nulls
+        if nulls == len(series):
+            return
+
+        if pd.api.types.is_bool_dtype(series):
+            self.kinds.add("bool")
+            self.frequent.update(series)
+        elif pd.api.types.is_numeric_dtype(series):
+            self.kinds.add("int" if series.dtype.kind in "iu" else "float")
+            self.quantiles.update(series.to_numpy(dtype=np.float64, na_value=np.nan))
+            if series.dtype.kind in "iu":
+                self.frequent.update(series)
+        elif pd.api.types.is_datetime64_any_dtype(series):
+            self.kinds.add("datetime")
+            self.frequent.update(series)
+        else:
+            self.frequent.update(series)
+            inference = engine.infer(series)
+            if inference.kind == "datetime":
+                self.kinds.add("datetime")
+                self.date_formats.add(inference.date_format)
+            elif inference.kind == "numeric":
+                numeric = pd.to_numeric(series, errors="coerce")
+                self.kinds.add("int" if numeric.dtype.kind in "iu" else "float")
+                self.quantiles.update(numeric.to_numpy(dtype=np.float64, na_value=np.nan))
+            else:
+                self.kinds.add("text")
+
+    def merge(self, other: ColumnStats) -> ColumnStats:
+        self.rows += other.rows
+        self.nulls += other.nulls
+        self.kinds |= other.kinds
+        self.date_formats |= other.date_formats
+        self.quantiles.merge(other.quantiles)
+        self.frequent.merge(other.frequent)
+        return self
+
+
+@dataclass(frozen=True)
+class ColumnPlan:
+    """Type and fill value decided for a column after pass 1."""
+
+    kind: str
+    dtype: str
+    fill_value: Any = None
+    date_format: str | None = None
+
+
+def plan_column(stats: ColumnStats) -> ColumnPlan:
+    """Turn pass-1 votes into a type that holds for every chunk."""
+    kinds = stats.kinds
+    if kinds and kinds <= {"int", "float"}:
+        dtype = "int64" if kinds == {"int"} and stats.nulls == 0 else "float64"
+        return ColumnPlan("numeric", dtype, fill_value=stats.quantiles.median())
+
+    mode = stats.frequent.mode()
+    if kinds == {"datetime"}:
+        formats = stats.date_formats
+        date_format = next(iter(formats)) if len(formats) == 1 else MIXED_DATE_FORMAT
+        fill_value = None
+        if mode is not None:
+            fill_value = pd.to_datetime(pd.Series([mode]), format=date_format, errors="coerce")[0]
+        return ColumnPlan(
+            "datetime",
+            "datetime64[ns]",
+            fill_value=None if pd.isna(fill_value) else fill_value,
+            date_format=date_format if formats else None,
+        )
+    if kinds == {"bool"}:
+        return ColumnPlan("bool", "bool" if stats.nulls == 0 else "object", fill_value=mode)
+    return ColumnPlan("text", "object", fill_value="Unknown" if mode is None else str(mode))
+
+
+@dataclass
+class StreamingCurationResult:
+    rows_in: int
+    rows_out: int
+    duplicates_removed: int
+    column_types: dict[str, str]
+    fill_values: dict[str, Any]
+    coerced: dict[str, int]
+    transform_log: list[dict[str, Any]]
+
+
+class StreamingCurator:
+    """Two-pass curation over a re-readable chunk source.
+
+    ``chunk_source`` must return a fresh iterator of DataFrames on every call;
+    it is read once for statistics and twice more by the deduplicator, since
+    curated chunks are cheaper to rebuild than to spill. Peak memory is one
+    chunk plus the per-column sketches and one hash partition. Medians and
+    modes are exact until a column exceeds the sketch sizes, then approximate
+    within the sketch error bounds; ``sketch_error`` sizes both sketches for a
+    target rank/frequency error instead of ``quantile_k``/``frequent_capacity``.
+    """
+
+    def __init__(
+        self,
+        chunk_source: ChunkSource,
+        type_engine: TypeInferenceEngine | None = None,
+        quantile_k: int = DEFAULT_QUANTILE_K,
+        frequent_capacity: int = DEFAULT_FREQUENT_CAPACITY,
+        dedup_bits: int = 64,
+        dedup_partitions: int = DEFAULT_DEDUP_PARTITIONS,
+        spill_dir: str | Path | None = None,
+        date_features: bool = True,
+        sketch_error: float | None = None,
+    ):
+        self.chunk_source = chunk_source
+        self.type_engine = type_engine or default_type_engine()
+        self.quantile_k = quantile_k
+        self.frequent_capacity = frequent_capacity
+        self.dedup_bits = dedup_bits
+        self.dedup_partitions = dedup_partitions
+        self.spill_dir = spill_dir
+        self.date_features = date_features
+        self.sketch_error = sketch_error
+        self.stats: dict[str, ColumnStats] | None = None
+        self.plans: dict[str, ColumnPlan] | None = None
+        self.original_columns: list[str] = []
+        self.result: StreamingCurationResult | None = None
+
+    @classmethod
+    def from_csv(
+        cls,
+        file_path: str | Path,
+        extractor: FileExtractor | None = None,
+        chunksize: int = DEFAULT_STREAM_CHUNKSIZE,
+        reader_options: dict[str, Any] | None = None,
+        **options: Any,
+    ) -> StreamingCurator:
+        """Curator reading a (possibly compressed) CSV in chunks on every pass."""
+        if extractor is None:
+            from src.data.file_extractor import FileExtractor
+
+            extractor = FileExtractor(data_dir=Path(file_path).parent)
+        reader_options = reader_options or {}
+
+        def chunk_source() -> Iterator[pd.DataFrame]:
+            return extractor.iter_csv_chunks(file_path, chunksize=chunksize, **reader_options)
+
+        return cls(chunk_source, **options)
+
+    def _clean_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        chunk = chunk.copy(deep=False)
+        chunk.columns = [clean_column_name(column) for column in chunk.columns]
+        return chunk
+
+    def _new_stats(self) -> ColumnStats:
+        if self.sketch_error is None:
+            return ColumnStats(
+                quantiles=QuantileSketch(self.quantile_k),
+                frequent=FrequentItemsSketch(self.frequent_capacity),
+            )
+        return ColumnStats(
+            quantiles=QuantileSketch.for_error(self.sketch_error),
+            frequent=FrequentItemsSketch.for_error(self.sketch_error),
+        )
+
+    def profile(self) -> dict[str, ColumnPlan]:
+        """Pass 1: collect column statistics and decide types and fill values."""
+        stats: dict[str, ColumnStats] = {}
+        for chunk in self.chunk_source():
+            if not self.original_columns:
+                self.original_columns = [str(column) for column in chunk.columns]
+            chunk = self._clean_chunk(chunk)
+            for column in chunk.columns:
+                if column not in stats:
+                    stats[column] = self._new_stats()
+                stats[column].observe(chunk[column], self.type_engine)
+
+        self.stats = stats
+        self.plans = {column: plan_column(column_stats) for column, column_stats in stats.items()}
+        rows = max((column_stats.rows for column_stats in stats.values()), default=0)
+        logger.info(f"Curadoria em fluxo: perfil de {len(stats)} colunas em {rows} linhas")
+        return self.plans
+
+    def _apply_plan(self, series: pd.Series, plan: ColumnPlan) -> tuple[pd.Series, int]:
+        present = series.notna()
+        if plan.kind == "numeric":
+            values = pd.to_numeric(series, errors="coerce")
+        elif plan.kind == "datetime":
+            if pd.api.types.is_datetime64_any_dtype(series):
+                values = series
+            else:
+                values = pd.to_datetime(series, format=plan.date_format, errors="coerce")
+        elif plan.kind == "text" and series.dtype != object:
+            values = series.astype(object).where(~present, series.astype(str))
+        else:
+            values = series
+        coerced = int((values.isna() & present).sum())
+
+        if plan.fill_value is not None and values.isna().any():
+            values = values.fillna(plan.fill_value)
+        if plan.kind in {"numeric", "bool"} and values.dtype != plan.dtype:
+            values = values.astype(plan.dtype)
+        return values, coerced
+
+    def _iter_transformed(self, counters: dict[str, Any] | None = None) -> Iterator[pd.DataFrame]:
+        for chunk in self.chunk_source():
+            chunk = self._clean_chunk(chunk)
+            for column in chunk.columns:
+                values, coerced = self._apply_plan(chunk[column], self.plans[column])
+                chunk[column] = values
+                if counters is not None and coerced:
+                    counters["coerced"][column] = counters["coerced"].get(column, 0) + coerced
+            if counters is not None:
+                counters["rows"] += len(chunk)
+                counters["missing"] += int(chunk.isna().sum().sum())
+            yield chunk
+
+    def iter_curated(self) -> Iterator[pd.DataFrame]:
+        """Pass 2: yield curated, deduplicated chunks; fills :attr:`result` when exhausted."""
+        if self.plans is None:
+            self.profile()
+        counters: dict[str, Any] = {"rows": 0, "missing": 0, "coerced": {}, "features": []}
+        date_columns = [column for column, plan in self.plans.items() if plan.kind == "datetime"]
+        rows_out = 0
+        with ChunkedDeduplicator(
+            bits=self.dedup_bits, n_partitions=self.dedup_partitions, spill_dir=self.spill_dir
+        ) as deduplicator:
+            report = deduplicator.scan(self._iter_transformed(counters))
+            for chunk in deduplicator.iter_unique(self._iter_transformed()):
+                # Features derive from existing columns, so they are added after dedup.
+                if self.date_features:
+                    chunk, counters["features"] = add_date_features(chunk, date_columns)
+                rows_out += len(chunk)
+                yield chunk
+        self.result = self._build_result(counters, report.duplicate_count, rows_out)
+
+    def _build_result(
+        self, counters: dict[str, Any], duplicates: int, rows_out: int
+    ) -> StreamingCurationResult:
+        plans = self.plans or {}
+        stats = self.stats or {}
+        coerced = counters["coerced"]
+        rows_in = counters["rows"]
+        missing_before = sum(item.nulls for item in stats.values()) + sum(coerced.values())
+        conversion_stats = {
+            "datetime_converted": [c for c, plan in plans.items() if plan.kind == "datetime"],
+            "numeric_converted": [c for c, plan in plans.items() if plan.kind == "numeric"],
+            "datetime_failed": [],
+            "numeric_failed": [],
+            "date_formats": {
+                c: plan.date_format for c, plan in plans.items() if plan.date_format is not None
+            },
+            "coerced": coerced,
+        }
+        transform_log = [
+            {
+                "operation": "clean_column_names",
+                "details": {"original": self.original_columns, "new": list(plans)},
+            },
+            {
+                "operation": "convert_dtypes",
+                "details": {
+                    "dtypes": {c: plan.dtype for c, plan in plans.items()},
+                    "conversion_stats": conversion_stats,
+                },
+            },
+            {
+                "operation": "handle_missing_values",
+                "details": {
+                    "missing_before": missing_before,
+                    "missing_after": counters["missing"],
+                },
+            },
+            {
+                "operation": "remove_duplicates",
+                "details": {"before": rows_in, "after": rows_out, "removed": duplicates},
+            },
+        ]
+        if self.date_features:
+            transform_log.append(
+                {"operation": "create_features", "details": {"new_columns": counters["features"]}}
+            )
+        logger.info(
+            f"Curadoria em fluxo concluída: {rows_in} linhas lidas, {rows_out} gravadas, "
+            f"{duplicates} duplicatas removidas"
+        )
+        return StreamingCurationResult(
+            rows_in=rows_in,
+            rows_out=rows_out,
+            duplicates_removed=duplicates,
+            column_types={c: plan.dtype for c, plan in plans.items()},
+            fill_values={c: plan.fill_value for c, plan in plans.items()},
+            coerced=coerced,
+            transform_log=transform_log,
+        )
+
+    def to_parquet(self, path: str | Path) -> StreamingCurationResult:
+        """Curate into a single Parquet file, one row group per chunk."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        writer = None
+        try:
+            for chunk in self.iter_curated():
+                if writer is None:
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+                    writer = pq.ParquetWriter(path, table.schema)
+                else:
+                    table = pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        logger.info(f"Parquet curado salvo em {path}")
+        return self.result
+
+    def to_sqlite(
+        self,
+        manager: SQLiteManager,
+        table_name: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> StreamingCurationResult:
+        """Curate into a SQLite table registered once in the dataset registry."""
+        metadata = {"source_name": "streaming_curation", **(metadata or {})}
+        if not manager.df_chunks_to_sql(self.iter_curated(), table_name, metadata=metadata):
+            raise RuntimeError(f"Falha ao gravar '{table_name}' no SQLite")
+        return self.result
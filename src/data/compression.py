@@ -0,0 +1,165 @@
+"""Detection and streaming decompression of compressed raw drops."""
+
+from __future__ import annotations
+
+import bz2
+import fnmatch
+import gzip
+import io
+import lzma
+import zipfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
+from typing import IO, Any
+
+COMPRESSION_SUFFIXES = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".zst": "zstd",
+    ".zip": "zip",
+}
+
+MAGIC_BYTES = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+    (b"PK\x03\x04", "zip"),
+)
+# Office Open XML workbooks are zip containers read as a whole, never archives.
+ZIP_CONTAINER_SUFFIXES = {".xlsx", ".xlsm", ".xltx", ".xltm"}
+
+
+def _peek(source: Any, size: int = 8) -> bytes:
+    if hasattr(source, "read"):
+        position = source.tell()
+        try:
+            return source.read(size)
+        finally:
+            source.seek(position)
+    with Path(source).open("rb") as handle:
+        return handle.read(size)
+
+
+def detect_compression(source: Any, name: str | None = None) -> str | None:
+    """Identify the codec from the file suffix, falling back to magic bytes.
+
+    Files named as Excel workbooks (``.xlsx``/``.xlsm``) are never taken for
+    zip archives, although they start with the same bytes.
+    """
+    suffix_source = name or (None if hasattr(source, "read") else str(source))
+    suffix = PurePosixPath(suffix_source).suffix.lower() if suffix_source else ""
+    if suffix in COMPRESSION_SUFFIXES:
+        return COMPRESSION_SUFFIXES[suffix]
+    try:
+        head = _peek(source)
+    except OSError:
+        return None
+    for magic, codec in MAGIC_BYTES:
+        if head.startswith(magic):
+            return None if codec == "zip" and suffix in ZIP_CONTAINER_SUFFIXES else codec
+    return None
+
+
+def strip_compression_suffix(name: str) -> str:
+    """Drop a trailing codec suffix: ``vendas.csv.gz`` -> ``vendas.csv``."""
+    path = PurePosixPath(name)
+    if path.suffix.lower() in COMPRESSION_SUFFIXES:
+        return str(path.with_suffix(""))
+    return name
+
+
+def dataset_name(name: str) -> str:
+    """Dataset name of a (possibly compressed) file: ``vendas.csv.gz`` -> ``vendas``."""
+    return PurePosixPath(strip_compression_suffix(PurePosixPath(name).name)).stem
+
+
+def compressed_patterns(pattern: str) -> list[str]:
+    """Glob patterns matching the compressed variants of ``pattern``."""
+    return [f"{pattern}{suffix}" for suffix in COMPRESSION_SUFFIXES if suffix != ".gzip"]
+
+
+def _zstd_reader(raw: IO[bytes]) -> IO[bytes]:
+    try:
+        import zstandard
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise ImportError("Leitura de arquivos .zst requer o pacote 'zstandard'") from exc
+    return zstandard.ZstdDecompressor().stream_reader(raw, closefd=False)
+
+
+def _data_members(archive: zipfile.ZipFile, pattern: str) -> list[str]:
+    return [
+        member.filename
+        for member in archive.infolist()
+        if not member.is_dir()
+        and not PurePosixPath(member.filename).name.startswith(".")
+        and fnmatch.fnmatch(PurePosixPath(member.filename).name, pattern)
+    ]
+
+
+def archive_members(source: Any, pattern: str = "*") -> list[str]:
+    """Data members of a zip archive matching the pattern (directories skipped)."""
+    with zipfile.ZipFile(source) as archive:
+        return _data_members(archive, pattern)
+
+
+@contextmanager
+def open_decompressed(
+    source: Any, compression: str | None = None, member: str | None = None
+) -> Iterator[IO[bytes]]:
+    """Open a source as a binary stream, decompressing on the fly.
+
+    Nothing is written to disk. Zip archives must hold exactly one data member
+    unless ``member`` selects one; use :func:`iter_archive_members` to explode
+    multi-member bundles.
+    """
+    codec = compression or detect_compression(source)
+    owns_raw = not hasattr(source, "read")
+    raw: IO[bytes] = Path(source).open("rb") if owns_raw else source
+    stream: IO[bytes] | None = None
+    archive: zipfile.ZipFile | None = None
+    try:
+        if codec is None:
+            stream = raw
+        elif codec == "gzip":
+            stream = gzip.GzipFile(fileobj=raw, mode="rb")
+        elif codec == "bz2":
+            stream = bz2.BZ2File(raw, mode="rb")
+        elif codec == "xz":
+            stream = lzma.LZMAFile(raw, mode="rb")
+        elif codec == "zstd":
+            stream = _zstd_reader(raw)
+        elif codec == "zip":
+            archive = zipfile.ZipFile(raw)
+            members = [member] if member else _data_members(archive, "*")
+            if len(members) != 1:
+                raise ValueError(
+                    f"Arquivo zip com {len(members)} membros; selecione um membro explicitamente"
+                )
+            stream = archive.open(members[0])
+        else:
+            raise ValueError(f"Compressão não suportada: {codec}")
+        yield stream
+    finally:
+        if stream is not None and stream is not raw:
+            stream.close()
+        if archive is not None:
+            archive.close()
+        if owns_raw:
+            raw.close()
+
+
+def iter_archive_members(source: Any, pattern: str = "*") -> Iterator[tuple[str, IO[bytes]]]:
+    """Yield ``(member_name, stream)`` for every matching member of a zip bundle."""
+    with zipfile.ZipFile(source) as archive:
+        for name in _data_members(archive, pattern):
+            with archive.open(name) as stream:
+                yield name, stream
+
+
+def supports_random_access(handle: Any) -> bool:
+    """True for plain file/buffer handles where seeking is cheap."""
+    return isinstance(handle, (io.BytesIO, io.BufferedReader, io.FileIO))
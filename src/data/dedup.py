@@ -0,0 +1,216 @@
+"""Hash-based duplicate detection that works chunk by chunk, out of core."""
+
+from __future__ import annotations
+
+import logging
+import shutil
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.utils.sketches import hash_values
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEDUP_PARTITIONS = 64
+# Second hash key used to extend row hashes to 128 bits.
+SECONDARY_HASH_KEY = "d5e1a7c39b0f4e26"
+
+
+def row_hashes(df: pd.DataFrame, subset: list[str] | None = None, bits: int = 64) -> np.ndarray:
+    """Vectorized per-row hashes: shape ``(n,)`` for 64 bits, ``(n, 2)`` for 128 bits.
+
+    Columns are hashed with :func:`hash_values`, so numbers hash by value and
+    the same row read as int64 in one chunk and float64 in another matches.
+    """
+    if bits not in (64, 128):
+        raise ValueError("bits deve ser 64 ou 128")
+    frame = df if subset is None else df.loc[:, list(subset)]
+
+    def hash_with(key: str | None) -> np.ndarray:
+        combined = np.zeros(len(frame), dtype=np.uint64)
+        for position in range(frame.shape[1]):
+            column = frame.iloc[:, position]
+            try:
+                hashes = hash_values(column, hash_key=key)
+            except TypeError:  # unhashable cells (lists, dicts) are hashed by their repr
+                hashes = hash_values(column.astype(str), hash_key=key)
+            combined = combined * np.uint64(1_000_003) ^ hashes.astype(np.uint64, copy=False)
+        return combined
+
+    primary = hash_with(None)
+    if bits == 64:
+        return primary
+    return np.column_stack([primary, hash_with(SECONDARY_HASH_KEY)])
+
+
+def _hash_frame(hashes: np.ndarray) -> pd.DataFrame:
+    if hashes.ndim == 1:
+        return pd.DataFrame({"h0": hashes})
+    return pd.DataFrame({"h0": hashes[:, 0], "h1": hashes[:, 1]})
+
+
+def duplicated_mask(
+    df: pd.DataFrame, subset: list[str] | None = None, bits: int = 64
+) -> np.ndarray:
+    """Boolean mask of rows whose hash was already seen earlier in the frame."""
+    if df.empty:
+        return np.zeros(0, dtype=bool)
+    return _hash_frame(row_hashes(df, subset=subset, bits=bits)).duplicated().to_numpy()
+
+
+def count_duplicates(df: pd.DataFrame, subset: list[str] | None = None, bits: int = 64) -> int:
+    """Number of repeated rows (first occurrences excluded), computed from row hashes."""
+    return int(duplicated_mask(df, subset=subset, bits=bits).sum())
+
+
+@dataclass
+class DuplicateReport:
+    total_rows: int
+    duplicate_count: int
+    bits: int = 64
+
+    @property
+    def unique_rows(self) -> int:
+        return self.total_rows - self.duplicate_count
+
+    @property
+    def duplicate_pct(self) -> float:
+        return float(self.duplicate_count / max(1, self.total_rows) * 100)
+
+
+class ChunkedDeduplicator:
+    """Two-pass duplicate removal for data that does not fit in memory.
+
+    Pass 1 (:meth:`scan`) hashes every chunk and appends ``(row_id, hash)``
+    records to one of ``n_partitions`` spill files chosen by the hash, so equal
+    rows always meet in the same partition. Each partition is then loaded on
+    its own to find repeated hashes. Pass 2 (:meth:`iter_unique`) streams the
+    chunks again and drops the rows flagged as repeats. Peak memory is one
+    chunk plus one partition of hashes. With 64-bit hashes, collisions become
+    plausible around a billion rows; use ``bits=128`` for larger inputs.
+    """
+
+    def __init__(
+        self,
+        subset: list[str] | None = None,
+        bits: int = 64,
+        n_partitions: int = DEFAULT_DEDUP_PARTITIONS,
+        spill_dir: str | Path | None = None,
+    ):
+        if bits not in (64, 128):
+            raise ValueError("bits deve ser 64 ou 128")
+        self.subset = subset
+        self.bits = bits
+        self.n_partitions = n_partitions
+        self._spill_root = spill_dir
+        self._spill_dir: Path | None = None
+        self._duplicate_ids: np.ndarray | None = None
+        self.report: DuplicateReport | None = None
+
+    @property
+    def _record_dtype(self) -> np.dtype:
+        fields = [("row", "<i8"), ("h0", "<u8")]
+        if self.bits == 128:
+            fields.append(("h1", "<u8"))
+        return np.dtype(fields)
+
+    def __enter__(self) -> ChunkedDeduplicator:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Remove the spill files."""
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+    def scan(self, chunks: Iterable[pd.DataFrame]) -> DuplicateReport:
+        """Pass 1: spill row hashes by partition and find the repeated row ids."""
+        self.close()
+        if self._spill_root is not None:
+            Path(self._spill_root).mkdir(parents=True, exist_ok=True)
+        self._spill_dir = Path(tempfile.mkdtemp(prefix="dedup_", dir=self._spill_root))
+        paths = [self._spill_dir / f"part-{index:04d}.bin" for index in range(self.n_partitions)]
+
+        total_rows = 0
+        handles = [path.open("ab") for path in paths]
+        try:
+            for chunk in chunks:
+                if chunk.empty:
+                    continue
+                hashes = row_hashes(chunk, subset=self.subset, bits=self.bits)
+                records = np.empty(len(chunk), dtype=self._record_dtype)
+                records["row"] = np.arange(total_rows, total_rows + len(chunk), dtype=np.int64)
+                primary = hashes if hashes.ndim == 1 else hashes[:, 0]
+                records["h0"] = primary
+                if self.bits == 128:
+                    records["h1"] = hashes[:, 1]
+                total_rows += len(chunk)
+
+                partitions = (primary % np.uint64(self.n_partitions)).astype(np.int64)
+                order = np.argsort(partitions, kind="stable")
+                bounds = np.searchsorted(partitions[order], np.arange(self.n_partitions + 1))
+                for index in range(self.n_partitions):
+                    start, end = bounds[index], bounds[index + 1]
+                    if end > start:
+                        handles[index].write(records[order[start:end]].tobytes())
+        finally:
+            for handle in handles:
+                handle.close()
+
+        duplicate_ids = []
+        for path in paths:
+            records = np.fromfile(path, dtype=self._record_dtype)
+            if len(records) < 2:
+                continue
+            frame = pd.DataFrame({name: records[name] for name in records.dtype.names})
+            repeated = frame.drop(columns="row").duplicated().to_numpy()
+            if repeated.any():
+                duplicate_ids.append(records["row"][repeated])
+        self._duplicate_ids = (
+            np.sort(np.concatenate(duplicate_ids)) if duplicate_ids else np.empty(0, np.int64)
+        )
+
+        self.report = DuplicateReport(
+            total_rows=total_rows, duplicate_count=len(self._duplicate_ids), bits=self.bits
+        )
+        logger.info(
+            f"Deduplicação: {self.report.duplicate_count} duplicatas em {total_rows} linhas "
+            f"({self.n_partitions} partições de hash)"
+        )
+        return self.report
+
+    def iter_unique(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Pass 2: stream the same chunks again without the repeated rows."""
+        if self._duplicate_ids is None:
+            raise RuntimeError("Execute scan() antes de iter_unique()")
+        offset = 0
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+            end = offset + len(chunk)
+            low, high = np.searchsorted(self._duplicate_ids, [offset, end])
+            if high > low:
+                keep = np.ones(len(chunk), dtype=bool)
+                keep[self._duplicate_ids[low:high] - offset] = False
+                chunk = chunk.loc[keep]
+            offset = end
+            if not chunk.empty:
+                yield chunk
+
+    def deduplicate(
+        self, chunk_source: Callable[[], Iterable[pd.DataFrame]]
+    ) -> Iterator[pd.DataFrame]:
+        """Run both passes; ``chunk_source`` must return a fresh chunk iterator per call."""
+        self.scan(chunk_source())
+        try:
+            yield from self.iter_unique(chunk_source())
+        finally:
+            self.close()
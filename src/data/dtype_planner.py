@@ -0,0 +1,258 @@
+"""Sample-based dtype planning so CSV reads land in compact dtypes."""
+
+from __future__ import annotations
+
+import io
+import logging
+import random
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import IO, Any
+
+import numpy as np
+import pandas as pd
+
+from src.data.compression import open_decompressed, supports_random_access
+from src.data.predicates import Filter, iter_filtered
+
+logger = logging.getLogger(__name__)
+
+# Explicit formats tried in order; month-first precedes day-first to match
+# pandas' own default for ambiguous values.
+COMMON_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y/%m/%d",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%d-%m-%Y",
+    "%m/%d/%Y %H:%M:%S",
+    "%d/%m/%Y %H:%M:%S",
+)
+
+DEFAULT_SAMPLE_ROWS = 1_000
+DEFAULT_PLAN_CHUNKSIZE = 100_000
+
+
+@dataclass
+class DtypePlan:
+    """Target dtype per column decided from a sample of the source."""
+
+    numeric: list[str] = field(default_factory=list)
+    categorical: list[str] = field(default_factory=list)
+    date_formats: dict[str, str] = field(default_factory=dict)
+    sampled_rows: int = 0
+
+
+def detect_date_format(
+    values: pd.Series, formats: tuple[str, ...] = COMMON_DATE_FORMATS
+) -> str | None:
+    """Return the first explicit format that parses every sampled value."""
+    sample = values.dropna().astype(str)
+    if sample.empty or sample.str.fullmatch(r"[+-]?\d+(\.\d+)?").all():
+        return None
+    for date_format in formats:
+        try:
+            pd.to_datetime(sample, format=date_format)
+            return date_format
+        except (ValueError, TypeError, OverflowError):
+            continue
+    return None
+
+
+def downcast_numeric(series: pd.Series) -> pd.Series:
+    """Shrink a numeric column to the smallest dtype that holds it losslessly."""
+    if pd.api.types.is_bool_dtype(series) or not pd.api.types.is_numeric_dtype(series):
+        return series
+    if pd.api.types.is_integer_dtype(series):
+        if pd.api.types.is_extension_array_dtype(series):
+            return series
+        return pd.to_numeric(series, downcast="integer")
+    if series.dtype == np.float64:
+        values = series.to_numpy()
+        narrowed = values.astype(np.float32)
+        if np.array_equal(narrowed.astype(np.float64), values, equal_nan=True):
+            return pd.Series(narrowed, index=series.index, name=series.name)
+    return series
+
+
+def concat_chunks(chunks: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate chunks, unioning categories instead of falling back to object."""
+    if not chunks:
+        return pd.DataFrame()
+    if len(chunks) == 1:
+        return chunks[0].reset_index(drop=True)
+
+    categorical = [
+        column
+        for column in chunks[0].columns
+        if all(
+            column in chunk.columns and isinstance(chunk[column].dtype, pd.CategoricalDtype)
+            for chunk in chunks
+        )
+    ]
+    if categorical:
+        categories = {
+            column: pd.api.types.union_categoricals([chunk[column] for chunk in chunks]).categories
+            for column in categorical
+        }
+        aligned = []
+        for chunk in chunks:
+            chunk = chunk.copy(deep=False)
+            for column in categorical:
+                chunk[column] = chunk[column].cat.set_categories(categories[column])
+            aligned.append(chunk)
+        chunks = aligned
+    return pd.concat(chunks, ignore_index=True)
+
+
+@contextmanager
+def _binary_handle(source: Any):
+    """Open a path or rewindable buffer as a (decompressed) binary stream."""
+    start = source.tell() if hasattr(source, "read") else None
+    try:
+        with open_decompressed(source) as handle:
+            yield handle
+    finally:
+        if start is not None:
+            source.seek(start)
+
+
+def _offset_samples(
+    handle: IO[bytes], head_rows: int, n_offsets: int, offset_rows: int, seed: int
+) -> list[bytes]:
+    """Read non-overlapping line blocks from random offsets after the head rows."""
+    handle.seek(0, io.SEEK_END)
+    size = handle.tell()
+    handle.seek(0)
+    header = handle.readline()
+    for _ in range(head_rows):
+        if not handle.readline():
+            return []
+    tail_start = handle.tell()
+    if n_offsets <= 0 or size <= tail_start:
+        return []
+
+    rng = random.Random(seed)
+    covered: list[tuple[int, int]] = []
+    samples = []
+    for offset in sorted(rng.randrange(tail_start, size) for _ in range(n_offsets)):
+        handle.seek(offset)
+        handle.readline()  # discard the partial line at the offset
+        block_start = handle.tell()
+        if any(start <= block_start < end for start, end in covered):
+            continue
+        lines = [line for line in (handle.readline() for _ in range(offset_rows)) if line]
+        if lines:
+            covered.append((block_start, handle.tell()))
+            samples.append(header + b"".join(lines))
+    return samples
+
+
+def sample_csv(
+    source: Any,
+    sample_rows: int = DEFAULT_SAMPLE_ROWS,
+    n_offsets: int = 4,
+    offset_rows: int = 200,
+    seed: int = 42,
+    **read_kwargs: Any,
+) -> pd.DataFrame:
+    """Read the head plus a few blocks starting at random byte offsets."""
+    read_kwargs = {
+        key: value
+        for key, value in read_kwargs.items()
+        if key not in {"chunksize", "dtype", "nrows", "parse_dates", "iterator"}
+    }
+    with _binary_handle(source) as handle:
+        frames = [pd.read_csv(handle, nrows=sample_rows, dtype=str, **read_kwargs)]
+        if not supports_random_access(handle):
+            n_offsets = 0  # seeking a decompressing stream means re-inflating it
+        for block in _offset_samples(handle, sample_rows, n_offsets, offset_rows, seed):
+            try:
+                frames.append(pd.read_csv(io.BytesIO(block), dtype=str, **read_kwargs))
+            except (ValueError, pd.errors.ParserError, UnicodeDecodeError):
+                continue  # offset landed inside a quoted multi-line field
+    return pd.concat(frames, ignore_index=True)
+
+
+def infer_dtype_plan(
+    source: Any,
+    sample_rows: int = DEFAULT_SAMPLE_ROWS,
+    n_offsets: int = 4,
+    category_max_ratio: float = 0.5,
+    category_max_unique: int = 1_000,
+    **read_kwargs: Any,
+) -> DtypePlan:
+    """Decide compact dtypes for a CSV from a head + random-offset sample."""
+    sample = sample_csv(source, sample_rows=sample_rows, n_offsets=n_offsets, **read_kwargs)
+    plan = DtypePlan(sampled_rows=len(sample))
+
+    for column in sample.columns:
+        values = sample[column].dropna()
+        if values.empty:
+            continue
+        if pd.to_numeric(values, errors="coerce").notna().all():
+            plan.numeric.append(column)
+            continue
+        date_format = detect_date_format(values)
+        if date_format:
+            plan.date_formats[column] = date_format
+            continue
+        n_unique = values.nunique()
+        if n_unique <= category_max_unique and n_unique <= len(values) * category_max_ratio:
+            plan.categorical.append(column)
+
+    logger.info(
+        f"Plano de dtypes: {len(plan.numeric)} numéricas, {len(plan.categorical)} categóricas, "
+        f"{len(plan.date_formats)} datas (amostra de {plan.sampled_rows} linhas)"
+    )
+    return plan
+
+
+def apply_dtype_plan(df: pd.DataFrame, plan: DtypePlan) -> pd.DataFrame:
+    """Apply a plan to a parsed frame or chunk; values that do not fit are kept as read."""
+    converted = {}
+    for column in plan.numeric:
+        if column in df.columns:
+            converted[column] = downcast_numeric(df[column])
+    for column in plan.categorical:
+        if column in df.columns and not pd.api.types.is_numeric_dtype(df[column]):
+            converted[column] = df[column].astype("category")
+    for column, date_format in plan.date_formats.items():
+        if column in df.columns and df[column].dtype == object:
+            try:
+                converted[column] = pd.to_datetime(df[column], format=date_format)
+            except (ValueError, TypeError, OverflowError):
+                logger.debug(f"Coluna {column} não segue o formato {date_format}")
+    if not converted:
+        return df
+    df = df.copy(deep=False)
+    for column, values in converted.items():
+        df[column] = values
+    return df
+
+
+def read_csv_with_dtype_plan(
+    source: Any,
+    plan: DtypePlan | None = None,
+    chunksize: int = DEFAULT_PLAN_CHUNKSIZE,
+    filters: list[Filter] | None = None,
+    columns: list[str] | None = None,
+    **read_kwargs: Any,
+) -> pd.DataFrame:
+    """Two-phase CSV read: sample a dtype plan, then parse in compacted chunks.
+
+    Each chunk is narrowed as soon as it is parsed, so the full-width pandas
+    default dtypes only ever exist for one chunk at a time. ``filters`` and
+    ``columns`` are applied per chunk, after the plan parsed the dates.
+    """
+    plan = plan or infer_dtype_plan(source, **read_kwargs)
+    with _binary_handle(source) as handle:
+        with pd.read_csv(handle, chunksize=chunksize, **read_kwargs) as reader:
+            chunks = (apply_dtype_plan(chunk, plan) for chunk in reader)
+            if filters or columns is not None:
+                chunks = iter_filtered(chunks, filters, columns)
+            frames = list(chunks)
+    return concat_chunks(frames)
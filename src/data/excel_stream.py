@@ -0,0 +1,183 @@
+"""Streaming, read-only Excel readers used by FileExtractor."""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+CALAMINE_AVAILABLE = find_spec("python_calamine") is not None
+OPENPYXL_SUFFIXES = {".xlsx", ".xlsm", ".xltx", ".xltm"}
+DEFAULT_CHUNKSIZE = 50_000
+
+
+def default_excel_engine() -> str | None:
+    """Prefer the Rust-backed calamine engine when it is installed."""
+    return "calamine" if CALAMINE_AVAILABLE else None
+
+
+def list_sheet_names(path: str | Path) -> list[str]:
+    """Read sheet names without loading any cell data."""
+    path = Path(path)
+    if CALAMINE_AVAILABLE:
+        from python_calamine import CalamineWorkbook
+
+        workbook = CalamineWorkbook.from_path(str(path))
+        try:
+            return list(workbook.sheet_names)
+        finally:
+            workbook.close()
+
+    if path.suffix.lower() in OPENPYXL_SUFFIXES:
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(path, read_only=True)
+        try:
+            return list(workbook.sheetnames)
+        finally:
+            workbook.close()
+
+    return list(pd.ExcelFile(path).sheet_names)
+
+
+def _header_names(values: tuple[Any, ...]) -> list[str]:
+    """Column names as ``pd.read_excel`` builds them, duplicates mangled to ``x.1``.
+
+    Same order as the pandas parser: named columns first, then the unnamed
+    ones, skipping suffixes that another header already uses.
+    """
+    unnamed = [index for index, value in enumerate(values) if value in (None, "")]
+    names = [
+        f"Unnamed: {index}" if value in (None, "") else str(value)
+        for index, value in enumerate(values)
+    ]
+    counts: defaultdict[str, int] = defaultdict(int)
+    skipped = set(unnamed)
+    for index in [i for i in range(len(names)) if i not in skipped] + unnamed:
+        name = original = names[index]
+        count = counts[name]
+        while count > 0:
+            counts[original] = count + 1
+            name = f"{original}.{count}"
+            count = count + 1 if name in names else counts[name]
+        names[index] = name
+        counts[name] = count + 1
+    return names
+
+
+def _iter_row_values(path: Path, sheet_name: str | int) -> Iterator[tuple[Any, ...]]:
+    if CALAMINE_AVAILABLE:
+        from python_calamine import CalamineWorkbook
+
+        workbook = CalamineWorkbook.from_path(str(path))
+        try:
+            sheet = (
+                workbook.get_sheet_by_index(sheet_name)
+                if isinstance(sheet_name, int)
+                else workbook.get_sheet_by_name(sheet_name)
+            )
+            for row in sheet.iter_rows():
+                yield tuple(None if value == "" else value for value in row)
+        finally:
+            workbook.close()
+        return
+
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        worksheet = (
+            workbook.worksheets[sheet_name] if isinstance(sheet_name, int) else workbook[sheet_name]
+        )
+        yield from worksheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def iter_excel_chunks(
+    path: str | Path,
+    sheet_name: str | int = 0,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> Iterator[pd.DataFrame]:
+    """Yield a sheet as DataFrame chunks without materializing the workbook.
+
+    Uses calamine when available and openpyxl read-only mode otherwise. Legacy
+    ``.xls`` files without calamine fall back to a full pandas read, sliced.
+    """
+    path = Path(path)
+    if not CALAMINE_AVAILABLE and path.suffix.lower() not in OPENPYXL_SUFFIXES:
+        df = pd.read_excel(path, sheet_name=sheet_name)
+        for start in range(0, max(len(df), 1), chunksize):
+            yield df.iloc[start : start + chunksize]
+        return
+
+    rows = _iter_row_values(path, sheet_name)
+    header = next(rows, None)
+    if header is None:
+        return
+    columns = _header_names(header)
+
+    buffer: list[tuple[Any, ...]] = []
+    # Blank rows are kept like pd.read_excel does, except trailing ones, so
+    # they are only counted until a row with data follows.
+    blank_rows = 0
+    emitted = False
+    for row in rows:
+        if all(value is None for value in row):
+            blank_rows += 1
+            continue
+        buffer.extend([(np.nan,) * len(columns)] * blank_rows)
+        blank_rows = 0
+        # Empty cells become NaN, as pandas reads them (None would keep object columns).
+        buffer.append(tuple(np.nan if value is None else value for value in row[: len(columns)]))
+        while len(buffer) >= chunksize:
+            yield pd.DataFrame.from_records(buffer[:chunksize], columns=columns)
+            buffer = buffer[chunksize:]
+            emitted = True
+
+    if buffer or not emitted:
+        yield pd.DataFrame.from_records(buffer, columns=columns)
+
+
+def read_excel_streaming(
+    path: str | Path, sheet_name: str | int = 0, chunksize: int = DEFAULT_CHUNKSIZE
+) -> pd.DataFrame:
+    """Load one sheet through the streaming reader and concatenate the chunks."""
+    chunks = list(iter_excel_chunks(path, sheet_name=sheet_name, chunksize=chunksize))
+    if not chunks:
+        return pd.DataFrame()
+    return pd.concat(chunks, ignore_index=True)
+
+
+def read_excel_sheets(
+    path: str | Path,
+    sheet_names: list[str] | None = None,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+) -> dict[str, pd.DataFrame]:
+    """Load several sheets concurrently; one worker streams each sheet.
+
+    A process pool is used by default because both readers hold the GIL while
+    parsing. Results keep the workbook's sheet order.
+    """
+    names = sheet_names or list_sheet_names(path)
+    if not names:
+        return {}
+
+    owns_executor = executor is None
+    pool = executor or ProcessPoolExecutor(max_workers=max_workers or min(len(names), 4))
+    try:
+        futures = {name: pool.submit(read_excel_streaming, str(path), name) for name in names}
+        return {name: future.result() for name, future in futures.items()}
+    finally:
+        if owns_executor:
+            pool.shutdown()
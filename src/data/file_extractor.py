@@ -5,129 +5,655 @@ Extrator de dados de arquivos locais
 
 import pandas as pd
 from pathlib import Path
+import codecs
 import logging
 import glob
 from config.settings import Settings
+from src.data.compression import (
+    compressed_patterns,
+    dataset_name,
+    detect_compression,
+    iter_archive_members,
+    open_decompressed,
+)
+from src.data.dtype_planner import concat_chunks, read_csv_with_dtype_plan
+from src.data.excel_stream import (
+    DEFAULT_CHUNKSIZE,
+    default_excel_engine,
+    iter_excel_chunks,
+    read_excel_sheets,
+)
+from src.data.jsonl_reader import (
+    DEFAULT_JSONL_CHUNKSIZE,
+    DEFAULT_SAMPLE_SIZE,
+    iter_jsonl_chunks,
+    read_jsonl,
+)
+from src.data.parse_cache import PARQUET_AVAILABLE, ParsedFileCache
+from src.data.partitions import PartitionedDataset
+from src.data.predicates import (
+    apply_filters,
+    iter_filtered,
+    normalize_filters,
+    read_columns,
+    to_arrow_filters,
+)
 
 # Configurar logger
 logger = logging.getLogger(__name__)
 
+# Prefixo inspecionado na detecção de encoding
+ENCODING_SNIFF_BYTES = 4 * 1024 * 1024
+
+# Linhas por bloco quando há filtros de linha
+FILTER_CHUNKSIZE = 100_000
+
+
+def sniff_encoding(prefix, complete=False):
+    """
+    Detecta o encoding a partir de um prefixo de bytes
+
+    Args:
+        prefix: Bytes iniciais do arquivo
+        complete: True se o prefixo contém o arquivo inteiro
+
+    Returns:
+        Nome do encoding para o pandas
+    """
+    if prefix.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if prefix.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+
+    try:
+        # Decoder incremental: um caractere multibyte cortado no fim do prefixo não é erro
+        codecs.getincrementaldecoder("utf-8")().decode(prefix, final=complete)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+
+    # Bytes 0x80-0x9F são controles em latin-1, mas pontuação comum em cp1252
+    if any(0x80 <= byte <= 0x9F for byte in prefix):
+        try:
+            prefix.decode("cp1252")
+            return "cp1252"
+        except UnicodeDecodeError:
+            pass
+    return "latin-1"
+
+
+def _read_csv_projected(source, filters=None, columns=None, **kwargs):
+    """
+    Lê um CSV aplicando filtros de linha bloco a bloco e a projeção de colunas
+
+    Sem filtros, é um único pandas.read_csv; com filtros, só as linhas
+    aceitas de cada bloco ficam em memória.
+    """
+    if not filters:
+        df = pd.read_csv(source, **kwargs)
+        return df if columns is None else apply_filters(df, None, columns)
+    with pd.read_csv(source, chunksize=FILTER_CHUNKSIZE, **kwargs) as reader:
+        return concat_chunks(list(iter_filtered(reader, filters, columns)))
+
+
+def _projection_options(kwargs, columns, filters, usecols_key="usecols"):
+    """
+    Monta os argumentos do leitor e a chave de cache para projeção e filtros
+
+    Returns:
+        Tupla (argumentos do leitor, argumentos que identificam a leitura no cache)
+    """
+    options = dict(kwargs)
+    usecols = read_columns(columns, filters)
+    if usecols is not None:
+        options[usecols_key] = usecols
+    cache_options = dict(options)
+    if columns is not None:
+        cache_options["columns"] = list(columns)
+    if filters:
+        cache_options["filters"] = filters
+    return options, cache_options
+
 
 class FileExtractor:
     """Extrai dados de arquivos locais"""
 
-    def __init__(self, data_dir=None):
+    def __init__(self, data_dir=None, cache=None):
         """
         Inicializa o extrator com um diretório de dados
 
         Args:
             data_dir: Caminho para o diretório de dados (opcional)
+            cache: ParsedFileCache para reaproveitar leituras (True usa o padrão)
         """
         self.data_dir = Path(data_dir) if data_dir else Settings.RAW_DATA_DIR
+        self.cache = ParsedFileCache() if cache is True else cache or None
         logger.info(f"FileExtractor inicializado: {self.data_dir}")
 
-    def extract_csv(self, file_path, **kwargs):
+    def _resolve_path(self, file_path):
+        """Resolve caminhos relativos ao diretório de dados"""
+        path = Path(file_path)
+        if not path.exists():
+            path = self.data_dir / file_path
+        return path
+
+    def _read_cached(self, path, reader, read_fn, kwargs):
+        """
+        Lê o arquivo passando pelo cache de parsing, quando configurado
+
+        Args:
+            path: Caminho resolvido do arquivo
+            reader: Nome do leitor (faz parte da chave do cache)
+            read_fn: Função que executa o parsing completo
+            kwargs: Argumentos do leitor (fazem parte da chave do cache)
+
+        Returns:
+            DataFrame com os dados
+        """
+        if self.cache is None or not self.cache.is_cacheable(path, kwargs):
+            return read_fn()
+
+        cached = self.cache.get(path, reader, kwargs)
+        if cached is not None:
+            return cached
+
+        df = read_fn()
+        if isinstance(df, pd.DataFrame):
+            self.cache.put(path, reader, kwargs, df)
+        return df
+
+    @staticmethod
+    def detect_encoding(source, sample_bytes=None):
+        """
+        Detecta o encoding de um arquivo ou buffer lendo só um prefixo limitado
+
+        Args:
+            source: Caminho ou buffer binário (compactado ou não)
+            sample_bytes: Tamanho máximo do prefixo (padrão: ENCODING_SNIFF_BYTES)
+
+        Returns:
+            Nome do encoding para o pandas
+        """
+        sample_bytes = sample_bytes or ENCODING_SNIFF_BYTES
+        start = source.tell() if hasattr(source, "read") else None
+        try:
+            with open_decompressed(source) as stream:
+                prefix = stream.read(sample_bytes + 1)
+        finally:
+            if start is not None:
+                source.seek(start)
+        encoding = sniff_encoding(prefix[:sample_bytes], complete=len(prefix) <= sample_bytes)
+        logger.info(f"Encoding detectado: {encoding}")
+        return encoding
+
+    def _read_csv_sniffed(self, read_fn, path, kwargs):
+        """
+        Lê um CSV com encoding detectado, fazendo um único parse no caso comum
+
+        Se o arquivo tiver bytes inválidos depois do prefixo inspecionado, o
+        parse é refeito uma vez em latin-1 (que aceita qualquer byte).
+        """
+        if "encoding" in kwargs:
+            return read_fn(dict(kwargs))
+
+        options = {**kwargs, "encoding": self.detect_encoding(path)}
+        try:
+            return read_fn(options)
+        except UnicodeDecodeError:
+            logger.warning(
+                f"Encoding {options['encoding']} inválido após o prefixo; usando latin-1"
+            )
+            return read_fn({**kwargs, "encoding": "latin-1"})
+
+    def _read_stream(self, read_fn, path, kwargs):
+        """Executa o leitor do pandas descompactando o arquivo em streaming, se preciso"""
+        if "compression" in kwargs or not detect_compression(path):
+            return read_fn(path, **kwargs)
+        with open_decompressed(path) as stream:
+            return read_fn(stream, **kwargs)
+
+    def invalidate_cache(self, file_path=None):
+        """
+        Remove entradas do cache de parsing
+
+        Args:
+            file_path: Arquivo a invalidar (None limpa o cache inteiro)
+
+        Returns:
+            Quantidade de entradas removidas
+        """
+        if self.cache is None:
+            return 0
+        if file_path is None:
+            return self.cache.invalidate()
+        return self.cache.invalidate(self._resolve_path(file_path))
+
+    def extract_csv(
+        self,
+        file_path,
+        optimize_dtypes=False,
+        columns=None,
+        filters=None,
+        raise_errors=False,
+        **kwargs,
+    ):
         """
         Extrai dados de arquivo CSV
 
         Args:
             file_path: Caminho do arquivo CSV
+            optimize_dtypes: Amostra o arquivo e lê direto em dtypes compactos
+            columns: Colunas a carregar (as demais nem são parseadas)
+            filters: Filtros de linha [(coluna, operador, valor)], aplicados por bloco
+            raise_errors: Propaga erros de leitura em vez de retornar um DataFrame vazio
             **kwargs: Argumentos adicionais do pandas.read_csv
 
         Returns:
             DataFrame com os dados
         """
         try:
-            path = Path(file_path)
-            if not path.exists():
-                path = self.data_dir / file_path
+            path = self._resolve_path(file_path)
+            filters = normalize_filters(filters)
+            read_options, cache_options = _projection_options(kwargs, columns, filters)
 
             logger.info(f"Lendo CSV: {path}")
-            df = pd.read_csv(path, **kwargs)
+            if optimize_dtypes:
+                df = self._read_cached(
+                    path,
+                    "csv_dtype_plan",
+                    lambda: self._read_csv_sniffed(
+                        lambda options: read_csv_with_dtype_plan(
+                            path, filters=filters, columns=columns, **options
+                        ),
+                        path,
+                        read_options,
+                    ),
+                    cache_options,
+                )
+            else:
+                df = self._read_cached(
+                    path,
+                    "csv",
+                    lambda: self._read_csv_sniffed(
+                        lambda options: self._read_stream(
+                            _read_csv_projected,
+                            path,
+                            {**options, "filters": filters, "columns": columns},
+                        ),
+                        path,
+                        read_options,
+                    ),
+                    cache_options,
+                )
             logger.info(f"Arquivo lido: {len(df)} linhas, {len(df.columns)} colunas")
             return df
         except Exception as e:
             logger.error(f"Erro ao ler CSV {file_path}: {e}")
+            if raise_errors:
+                raise
             return pd.DataFrame()
 
-    def extract_excel(self, file_path, sheet_name=0, **kwargs):
+    def iter_csv_chunks(
+        self, file_path, columns=None, filters=None, chunksize=FILTER_CHUNKSIZE, **kwargs
+    ):
+        """
+        Lê um CSV em blocos, já com projeção de colunas e filtros de linha
+
+        Args:
+            file_path: Caminho do arquivo CSV
+            columns: Colunas a carregar
+            filters: Filtros de linha [(coluna, operador, valor)]
+            chunksize: Quantidade de linhas por bloco
+            **kwargs: Argumentos adicionais do pandas.read_csv
+
+        Returns:
+            Iterador de DataFrames
+        """
+        path = self._resolve_path(file_path)
+        filters = normalize_filters(filters)
+        options, _ = _projection_options(kwargs, columns, filters)
+        options.setdefault("encoding", self.detect_encoding(path))
+        logger.info(f"Lendo CSV em blocos: {path}")
+        with open_decompressed(path) as stream:
+            with pd.read_csv(stream, chunksize=chunksize, **options) as reader:
+                yield from iter_filtered(reader, filters, columns)
+
+    def extract_excel(
+        self, file_path, sheet_name=0, columns=None, filters=None, raise_errors=False, **kwargs
+    ):
         """
         Extrai dados de arquivo Excel
 
         Args:
             file_path: Caminho do arquivo Excel
             sheet_name: Nome ou índice da planilha
+            columns: Colunas a carregar
+            filters: Filtros de linha [(coluna, operador, valor)]
+            raise_errors: Propaga erros de leitura em vez de retornar um DataFrame vazio
             **kwargs: Argumentos adicionais do pandas.read_excel
 
         Returns:
             DataFrame com os dados
         """
         try:
-            path = Path(file_path)
-            if not path.exists():
-                path = self.data_dir / file_path
+            path = self._resolve_path(file_path)
+            engine = default_excel_engine()
+            if engine and "engine" not in kwargs:
+                kwargs["engine"] = engine
+            filters = normalize_filters(filters)
+            read_options, cache_options = _projection_options(kwargs, columns, filters)
 
             logger.info(f"Lendo Excel: {path}, sheet: {sheet_name}")
-            df = pd.read_excel(path, sheet_name=sheet_name, **kwargs)
+            df = self._read_cached(
+                path,
+                "excel",
+                lambda: apply_filters(
+                    pd.read_excel(path, sheet_name=sheet_name, **read_options), filters, columns
+                ).reset_index(drop=True),
+                {"sheet_name": sheet_name, **cache_options},
+            )
             logger.info(f"Arquivo lido: {len(df)} linhas, {len(df.columns)} colunas")
             return df
         except Exception as e:
             logger.error(f"Erro ao ler Excel {file_path}: {e}")
+            if raise_errors:
+                raise
             return pd.DataFrame()
 
-    def extract_json(self, file_path, **kwargs):
+    def iter_excel_chunks(self, file_path, sheet_name=0, chunksize=DEFAULT_CHUNKSIZE):
+        """
+        Lê uma planilha em blocos, em modo somente leitura
+
+        Args:
+            file_path: Caminho do arquivo Excel
+            sheet_name: Nome ou índice da planilha
+            chunksize: Quantidade de linhas por bloco
+
+        Returns:
+            Iterador de DataFrames
+        """
+        path = self._resolve_path(file_path)
+        logger.info(f"Lendo Excel em blocos: {path}, sheet: {sheet_name}")
+        return iter_excel_chunks(path, sheet_name=sheet_name, chunksize=chunksize)
+
+    def extract_excel_sheets(self, file_path, sheet_names=None, max_workers=None, executor=None):
+        """
+        Extrai várias planilhas de uma pasta de trabalho em paralelo
+
+        Args:
+            file_path: Caminho do arquivo Excel
+            sheet_names: Planilhas a carregar (None carrega todas)
+            max_workers: Número de processos de leitura
+            executor: Executor alternativo (ex: ThreadPoolExecutor)
+
+        Returns:
+            Dicionário com nome da planilha: DataFrame
+        """
+        try:
+            path = self._resolve_path(file_path)
+            logger.info(f"Lendo planilhas em paralelo: {path}")
+            sheets = read_excel_sheets(
+                path, sheet_names=sheet_names, max_workers=max_workers, executor=executor
+            )
+            logger.info(f"Planilhas lidas: {len(sheets)}")
+            return sheets
+        except Exception as e:
+            logger.error(f"Erro ao ler planilhas de {file_path}: {e}")
+            return {}
+
+    def extract_parquet(self, file_path, columns=None, filters=None, raise_errors=False, **kwargs):
+        """
+        Extrai dados de arquivo Parquet com projeção e filtros empurrados ao leitor
+
+        Os filtros viram filtros do Arrow: row groups cujas estatísticas min/max
+        não atendem ao filtro são descartados sem serem decodificados.
+
+        Args:
+            file_path: Caminho do arquivo Parquet
+            columns: Colunas a carregar
+            filters: Filtros de linha [(coluna, operador, valor)]
+            raise_errors: Propaga erros de leitura em vez de retornar um DataFrame vazio
+            **kwargs: Argumentos adicionais do pandas.read_parquet
+
+        Returns:
+            DataFrame com os dados
+        """
+        try:
+            if not PARQUET_AVAILABLE:
+                raise ImportError("Leitura de Parquet requer o pacote 'pyarrow'")
+            import pyarrow.parquet as pq
+
+            path = self._resolve_path(file_path)
+            filters = normalize_filters(filters)
+            _, cache_options = _projection_options(kwargs, columns, filters)
+
+            logger.info(f"Lendo Parquet: {path}")
+            df = self._read_cached(
+                path,
+                "parquet",
+                lambda: pd.read_parquet(
+                    path,
+                    engine="pyarrow",
+                    columns=list(columns) if columns is not None else None,
+                    filters=to_arrow_filters(filters, pq.read_schema(path)),
+                    **kwargs,
+                ),
+                cache_options,
+            )
+            logger.info(f"Arquivo lido: {len(df)} linhas, {len(df.columns)} colunas")
+            return df
+        except Exception as e:
+            logger.error(f"Erro ao ler Parquet {file_path}: {e}")
+            if raise_errors:
+                raise
+            return pd.DataFrame()
+
+    def extract_json(self, file_path, raise_errors=False, **kwargs):
         """
         Extrai dados de arquivo JSON
 
         Args:
             file_path: Caminho do arquivo JSON
+            raise_errors: Propaga erros de leitura em vez de retornar um DataFrame vazio
             **kwargs: Argumentos adicionais do pandas.read_json
 
         Returns:
             DataFrame com os dados
         """
         try:
-            path = Path(file_path)
-            if not path.exists():
-                path = self.data_dir / file_path
+            path = self._resolve_path(file_path)
 
             logger.info(f"Lendo JSON: {path}")
-            df = pd.read_json(path, **kwargs)
+            df = self._read_cached(
+                path, "json", lambda: self._read_stream(pd.read_json, path, kwargs), kwargs
+            )
             logger.info(f"Arquivo lido: {len(df)} linhas, {len(df.columns)} colunas")
             return df
         except Exception as e:
             logger.error(f"Erro ao ler JSON {file_path}: {e}")
+            if raise_errors:
+                raise
             return pd.DataFrame()
 
-    def find_files(self, pattern):
+    def extract_jsonl(
+        self,
+        file_path,
+        chunksize=DEFAULT_JSONL_CHUNKSIZE,
+        sample_size=DEFAULT_SAMPLE_SIZE,
+        flatten=False,
+        schema=None,
+        encoding="utf-8",
+        columns=None,
+        filters=None,
+    ):
+        """
+        Extrai dados de arquivo JSON Lines (NDJSON) em blocos
+
+        Args:
+            file_path: Caminho do arquivo .jsonl/.ndjson
+            chunksize: Quantidade de linhas por bloco
+            sample_size: Registros amostrados para inferir o schema
+            flatten: Achata campos aninhados em colunas "pai.filho"
+            schema: Dicionário coluna: dtype (dispensa a amostragem)
+            encoding: Codificação do arquivo
+            columns: Colunas a manter
+            filters: Filtros de linha [(coluna, operador, valor)], aplicados por bloco
+
+        Returns:
+            DataFrame com os dados
+        """
+        try:
+            path = self._resolve_path(file_path)
+            options = {
+                "sample_size": sample_size,
+                "flatten": flatten,
+                "schema": schema,
+                "encoding": encoding,
+            }
+            filters = normalize_filters(filters)
+            if columns is not None:
+                options["columns"] = list(columns)
+            if filters:
+                options["filters"] = filters
+
+            logger.info(f"Lendo JSON Lines: {path}")
+            df = self._read_cached(
+                path,
+                "jsonl",
+                lambda: read_jsonl(path, chunksize=chunksize, **options),
+                options,
+            )
+            logger.info(f"Arquivo lido: {len(df)} linhas, {len(df.columns)} colunas")
+            return df
+        except Exception as e:
+            logger.error(f"Erro ao ler JSON Lines {file_path}: {e}")
+            return pd.DataFrame()
+
+    def iter_jsonl_chunks(
+        self,
+        file_path,
+        chunksize=DEFAULT_JSONL_CHUNKSIZE,
+        sample_size=DEFAULT_SAMPLE_SIZE,
+        flatten=False,
+        schema=None,
+        encoding="utf-8",
+        columns=None,
+        filters=None,
+    ):
+        """
+        Lê um arquivo JSON Lines em blocos com schema fixo
+
+        Returns:
+            Iterador de DataFrames
+        """
+        path = self._resolve_path(file_path)
+        logger.info(f"Lendo JSON Lines em blocos: {path}")
+        return iter_jsonl_chunks(
+            path,
+            chunksize=chunksize,
+            schema=schema,
+            sample_size=sample_size,
+            flatten=flatten,
+            encoding=encoding,
+            columns=columns,
+            filters=normalize_filters(filters),
+        )
+
+    def find_files(self, pattern, include_compressed=True, recursive=False):
         """
         Encontra arquivos por padrão de busca
 
         Args:
             pattern: Padrão de busca (ex: "*.csv", "dados_*.xlsx")
+            include_compressed: Inclui variantes compactadas (ex: "*.csv.gz", "*.csv.zst")
+            recursive: Busca também nos subdiretórios
 
         Returns:
             Lista de caminhos dos arquivos encontrados
         """
-        search_path = self.data_dir / pattern
-        files = glob.glob(str(search_path))
+        patterns = [pattern] + (compressed_patterns(pattern) if include_compressed else [])
+        prefix = "**/" if recursive else ""
+        files = []
+        for search_pattern in patterns:
+            files.extend(
+                glob.glob(str(self.data_dir / f"{prefix}{search_pattern}"), recursive=True)
+            )
         logger.info(f"Arquivos encontrados com padrão '{pattern}': {len(files)}")
         return files
 
-    def extract_all_csv(self):
+    def partitioned_dataset(self, subdir=None, pattern="*.csv", include_compressed=True):
+        """
+        Abre uma árvore particionada no estilo Hive (ex: source=x/year=2026/month=10/*.csv)
+
+        Args:
+            subdir: Subdiretório raiz do dataset (None usa o diretório de dados)
+            pattern: Padrão dos arquivos de dados
+            include_compressed: Inclui variantes compactadas
+
+        Returns:
+            PartitionedDataset lido de forma preguiçosa, com poda de partições
+        """
+        root = self.data_dir / subdir if subdir else self.data_dir
+        return PartitionedDataset(
+            root, extractor=self, pattern=pattern, include_compressed=include_compressed
+        )
+
+    def extract_archive(self, file_path, pattern="*.csv", **kwargs):
+        """
+        Extrai cada membro de um pacote zip como um dataset separado
+
+        Args:
+            file_path: Caminho do arquivo .zip
+            pattern: Padrão dos membros a ler (ex: "*.csv")
+            **kwargs: Argumentos adicionais do pandas.read_csv
+
+        Returns:
+            Dicionário com nome do membro: DataFrame
+        """
+        dataframes = {}
+        try:
+            path = self._resolve_path(file_path)
+            logger.info(f"Lendo pacote zip: {path}")
+            for member, stream in iter_archive_members(path, pattern=pattern):
+                options = {"encoding": self.detect_encoding(stream), **kwargs}
+                dataframes[dataset_name(member)] = pd.read_csv(stream, **options)
+        except Exception as e:
+            logger.error(f"Erro ao ler pacote {file_path}: {e}")
+        logger.info(f"Extraídos {len(dataframes)} membros do pacote")
+        return dataframes
+
+    def extract_all_csv(self, incremental=False, state_manager=None):
         """
         Extrai todos os arquivos CSV do diretório
 
+        Args:
+            incremental: Se True, lê apenas arquivos novos ou alterados desde a última execução
+            state_manager: SQLiteManager que guarda o watermark (modo incremental)
+
         Returns:
             Dicionário com nome do arquivo: DataFrame
         """
+        if incremental:
+            from src.data.incremental_ingestion import IncrementalIngestor
+
+            result = IncrementalIngestor(self, manager=state_manager).run("*.csv")
+            return result.dataframes
+
         csv_files = self.find_files("*.csv")
         dataframes = {}
 
         for csv_file in csv_files:
-            name = Path(csv_file).stem
+            name = dataset_name(csv_file)
             dataframes[name] = self.extract_csv(csv_file)
 
+        # Single-file archives such as vendas.csv.zip were already read above.
+        read = set(csv_files)
+        for archive in self.find_files("*.zip", include_compressed=False):
+            if archive in read:
+                continue
+            for name, df in self.extract_archive(archive, pattern="*.csv").items():
+                dataframes[f"{dataset_name(archive)}/{name}"] = df
+
         logger.info(f"Extraídos {len(dataframes)} arquivos CSV")
         return dataframes
 
@@ -138,7 +664,9 @@ class FileExtractor:
         Returns:
             Dicionário com nome do arquivo: DataFrame
         """
-        excel_files = self.find_files("*.xlsx") + self.find_files("*.xls")
+        excel_files = self.find_files("*.xlsx", include_compressed=False) + self.find_files(
+            "*.xls", include_compressed=False
+        )
         dataframes = {}
 
         for excel_file in excel_files:
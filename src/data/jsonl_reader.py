@@ -0,0 +1,182 @@
+"""Streaming JSON Lines (NDJSON) reader with sampled schema inference."""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any
+
+import pandas as pd
+
+from src.data.compression import open_decompressed
+from src.data.predicates import Filter, iter_filtered
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_SIZE = 1_000
+DEFAULT_JSONL_CHUNKSIZE = 100_000
+
+
+@contextmanager
+def _open_text(path: str | Path, encoding: str) -> Iterator[IO[str]]:
+    with open_decompressed(path) as stream:
+        with io.TextIOWrapper(stream, encoding=encoding) as handle:
+            yield handle
+
+
+def _parse_records(lines: list[str]) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in lines if line.strip()]
+
+
+def _flatten_record(record: dict[str, Any], sep: str, prefix: str = "") -> dict[str, Any]:
+    flat: dict[str, Any] = {}
+    for key, value in record.items():
+        name = f"{prefix}{sep}{key}" if prefix else str(key)
+        if isinstance(value, dict) and value:
+            flat.update(_flatten_record(value, sep, name))
+        else:
+            flat[name] = value
+    return flat
+
+
+def _records_to_frame(
+    records: list[dict[str, Any]], flatten: bool, sep: str, dtype: str | None = None
+) -> pd.DataFrame:
+    if flatten:
+        records = [_flatten_record(record, sep) for record in records]
+    return pd.DataFrame(records, dtype=dtype)
+
+
+# Python value kinds (pandas.api.types.infer_dtype) mapped to explicit dtypes.
+INFERRED_DTYPES = {
+    "integer": "Int64",
+    "floating": "float64",
+    "mixed-integer-float": "float64",
+    "boolean": "boolean",
+}
+
+
+def infer_jsonl_schema(
+    path: str | Path,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    flatten: bool = False,
+    sep: str = ".",
+    encoding: str = "utf-8",
+) -> dict[str, str]:
+    """Infer column dtypes from the first ``sample_size`` records.
+
+    Integers map to nullable ``Int64`` so later chunks with missing values keep
+    their type; anything mixed or textual stays ``object``.
+    """
+    with _open_text(path, encoding) as handle:
+        records = _parse_records(list(islice(handle, sample_size)))
+    sample = _records_to_frame(records, flatten=flatten, sep=sep, dtype="object")
+    return {
+        str(column): INFERRED_DTYPES.get(pd.api.types.infer_dtype(sample[column]), "object")
+        for column in sample.columns
+    }
+
+
+def _apply_schema(chunk: pd.DataFrame, schema: dict[str, str]) -> pd.DataFrame:
+    extra = [column for column in chunk.columns if column not in schema]
+    chunk = chunk.reindex(columns=list(schema) + extra)
+    for column, dtype in schema.items():
+        if dtype == "object" or chunk[column].dtype == dtype:
+            continue
+        try:
+            chunk[column] = chunk[column].astype(dtype)
+        except (TypeError, ValueError):
+            logger.warning(
+                f"Coluna {column} fora do schema amostrado ({dtype}); mantida como object"
+            )
+            chunk[column] = chunk[column].astype("object")
+    return chunk
+
+
+def iter_jsonl_chunks(
+    path: str | Path,
+    chunksize: int = DEFAULT_JSONL_CHUNKSIZE,
+    schema: dict[str, str] | None = None,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    flatten: bool = False,
+    sep: str = ".",
+    encoding: str = "utf-8",
+    columns: list[str] | None = None,
+    filters: list[Filter] | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Yield a JSON Lines file as chunks with a fixed, sampled schema.
+
+    Only one chunk of raw lines is held in memory at a time. Flat records go
+    through pandas' C JSON parser; nested flattening parses line by line.
+    Fields missing from the sample are kept after the schema columns.
+    ``filters`` and ``columns`` are applied to each chunk as it is parsed.
+    """
+    schema = schema or infer_jsonl_schema(
+        path, sample_size=sample_size, flatten=flatten, sep=sep, encoding=encoding
+    )
+    chunks = _iter_schema_chunks(path, chunksize, schema, flatten, sep, encoding)
+    if filters or columns is not None:
+        chunks = iter_filtered(chunks, filters, columns)
+    yield from chunks
+
+
+def _iter_schema_chunks(
+    path: str | Path,
+    chunksize: int,
+    schema: dict[str, str],
+    flatten: bool,
+    sep: str,
+    encoding: str,
+) -> Iterator[pd.DataFrame]:
+    if not flatten:
+        with _open_text(path, encoding) as handle:
+            with pd.read_json(
+                handle, lines=True, chunksize=chunksize, dtype=False, convert_dates=False
+            ) as reader:
+                for chunk in reader:
+                    yield _apply_schema(chunk, schema)
+        return
+
+    with _open_text(path, encoding) as handle:
+        while True:
+            lines = list(islice(handle, chunksize))
+            if not lines:
+                break
+            records = _parse_records(lines)
+            if records:
+                yield _apply_schema(_records_to_frame(records, flatten=flatten, sep=sep), schema)
+
+
+def read_jsonl(
+    path: str | Path,
+    chunksize: int = DEFAULT_JSONL_CHUNKSIZE,
+    schema: dict[str, str] | None = None,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    flatten: bool = False,
+    sep: str = ".",
+    encoding: str = "utf-8",
+    columns: list[str] | None = None,
+    filters: list[Filter] | None = None,
+) -> pd.DataFrame:
+    """Read a whole JSON Lines file through the chunked reader."""
+    chunks = list(
+        iter_jsonl_chunks(
+            path,
+            chunksize=chunksize,
+            schema=schema,
+            sample_size=sample_size,
+            flatten=flatten,
+            sep=sep,
+            encoding=encoding,
+            columns=columns,
+            filters=filters,
+        )
+    )
+    if not chunks:
+        return pd.DataFrame(columns=list(columns if columns is not None else schema or {}))
+    return pd.concat(chunks, ignore_index=True)
@@ -0,0 +1,178 @@
+"""On-disk cache of parsed source files used by FileExtractor."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from config.settings import Settings
+from src.utils.fingerprint import compute_file_fingerprint, stable_key
+
+logger = logging.getLogger(__name__)
+
+try:  # pyarrow ships with streamlit, but the data layer must not depend on it.
+    import pyarrow  # noqa: F401
+
+    PARQUET_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    PARQUET_AVAILABLE = False
+
+# Reader options that change the shape of the result rather than its content.
+UNCACHEABLE_KWARGS = {"chunksize", "iterator", "nrows", "skiprows"}
+
+
+class ParsedFileCache:
+    """Cache parsed DataFrames keyed by source fingerprint and reader options.
+
+    Entries are stored as Parquet (memory-mapped on read) with a pickle fallback
+    for frames Arrow cannot represent. Eviction is least-recently-used by total
+    bytes on disk; every hit refreshes the entry's access time.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        max_bytes: int | None = None,
+        content_hash: bool = False,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else Settings.PARSE_CACHE_DIR
+        self.max_bytes = int(max_bytes if max_bytes is not None else Settings.PARSE_CACHE_MAX_BYTES)
+        self.content_hash = content_hash
+
+    def build_key(self, file_path: str | Path, reader: str, kwargs: dict[str, Any]) -> str:
+        fingerprint = compute_file_fingerprint(file_path, content_hash=self.content_hash)
+        return stable_key(fingerprint.to_dict(), reader, kwargs)
+
+    def is_cacheable(self, file_path: Any, kwargs: dict[str, Any]) -> bool:
+        if not isinstance(file_path, (str, Path)) or not Path(file_path).is_file():
+            return False
+        return not UNCACHEABLE_KWARGS.intersection(kwargs)
+
+    def get(
+        self, file_path: str | Path, reader: str, kwargs: dict[str, Any]
+    ) -> pd.DataFrame | None:
+        """Return the cached frame for this source and options, or None on a miss."""
+        key = self.build_key(file_path, reader, kwargs)
+        meta_path = self._meta_path(key)
+        if not meta_path.exists():
+            return None
+
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            data_path = self.cache_dir / meta["data_file"]
+            if meta["format"] == "parquet":
+                df = pd.read_parquet(data_path, memory_map=True)
+            else:
+                df = pd.read_pickle(data_path)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"Entrada de cache inválida {key}: {exc}")
+            self._remove_entry(key)
+            return None
+
+        os.utime(meta_path)
+        logger.info(f"Cache hit: {file_path} ({reader})")
+        return df
+
+    def put(
+        self, file_path: str | Path, reader: str, kwargs: dict[str, Any], df: pd.DataFrame
+    ) -> bool:
+        """Store a parsed frame; returns False when the frame could not be cached."""
+        key = self.build_key(file_path, reader, kwargs)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        data_format, data_path = self._write_data(key, df)
+        if data_path is None:
+            return False
+
+        meta = {
+            "key": key,
+            "source": str(Path(file_path).resolve()),
+            "reader": reader,
+            "format": data_format,
+            "data_file": data_path.name,
+            "bytes": data_path.stat().st_size,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        tmp_meta = self._meta_path(key).with_suffix(".tmp")
+        tmp_meta.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_meta, self._meta_path(key))
+
+        self.evict()
+        return True
+
+    def invalidate(self, file_path: str | Path | None = None) -> int:
+        """Drop entries for one source file, or every entry when no path is given."""
+        source = str(Path(file_path).resolve()) if file_path is not None else None
+        removed = 0
+        for key, meta in self._entries():
+            if source is None or meta.get("source") == source:
+                self._remove_entry(key)
+                removed += 1
+        if removed:
+            logger.info(f"Cache invalidado: {removed} entradas")
+        return removed
+
+    def total_bytes(self) -> int:
+        return sum(int(meta.get("bytes", 0)) for _, meta in self._entries())
+
+    def evict(self) -> int:
+        """Remove least-recently-used entries until the cache fits in max_bytes."""
+        entries = sorted(
+            self._entries(), key=lambda item: self._meta_path(item[0]).stat().st_mtime_ns
+        )
+        total = sum(int(meta.get("bytes", 0)) for _, meta in entries)
+        evicted = 0
+        for key, meta in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove_entry(key)
+            total -= int(meta.get("bytes", 0))
+            evicted += 1
+        return evicted
+
+    def _write_data(self, key: str, df: pd.DataFrame) -> tuple[str, Path | None]:
+        if PARQUET_AVAILABLE:
+            parquet_path = self.cache_dir / f"{key}.parquet"
+            tmp_path = parquet_path.with_suffix(".parquet.tmp")
+            try:
+                df.to_parquet(tmp_path, engine="pyarrow")
+                os.replace(tmp_path, parquet_path)
+                return "parquet", parquet_path
+            except Exception as exc:  # noqa: BLE001
+                tmp_path.unlink(missing_ok=True)
+                logger.debug(f"Parquet indisponível para {key}, usando pickle: {exc}")
+
+        pickle_path = self.cache_dir / f"{key}.pkl"
+        tmp_path = pickle_path.with_suffix(".pkl.tmp")
+        try:
+            df.to_pickle(tmp_path)
+            os.replace(tmp_path, pickle_path)
+            return "pickle", pickle_path
+        except Exception as exc:  # noqa: BLE001
+            tmp_path.unlink(missing_ok=True)
+            logger.warning(f"Não foi possível gravar cache {key}: {exc}")
+            return "", None
+
+    def _entries(self) -> list[tuple[str, dict[str, Any]]]:
+        if not self.cache_dir.exists():
+            return []
+        entries = []
+        for meta_path in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((meta_path.stem, json.loads(meta_path.read_text(encoding="utf-8"))))
+            except (OSError, ValueError):
+                continue
+        return entries
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _remove_entry(self, key: str) -> None:
+        for suffix in (".json", ".parquet", ".pkl"):
+            (self.cache_dir / f"{key}{suffix}").unlink(missing_ok=True)
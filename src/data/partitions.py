@@ -0,0 +1,248 @@
+"""Hive-style partitioned datasets (``source=x/year=2026/month=10/*.csv``)."""
+
+from __future__ import annotations
+
+import fnmatch
+import logging
+import os
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import unquote
+
+import pandas as pd
+
+from src.data.compression import compressed_patterns, strip_compression_suffix
+from src.data.dtype_planner import concat_chunks
+from src.data.predicates import Filter, build_mask, normalize_filters
+
+if TYPE_CHECKING:
+    from src.data.file_extractor import FileExtractor
+
+logger = logging.getLogger(__name__)
+
+HIVE_NULL = "__HIVE_DEFAULT_PARTITION__"
+DEFAULT_PARTITION_CHUNKSIZE = 100_000
+_INTEGER = re.compile(r"-?\d+")
+
+
+def parse_partition_value(raw: str) -> Any:
+    """Decode a path segment value; integer-looking values become ints."""
+    value = unquote(raw)
+    if value == HIVE_NULL:
+        return None
+    if _INTEGER.fullmatch(value):
+        return int(value)
+    return value
+
+
+def parse_partition_segment(segment: str) -> tuple[str, Any] | None:
+    """``year=2026`` -> ``("year", 2026)``; plain directory names -> None."""
+    key, sep, raw = segment.partition("=")
+    if not sep or not key:
+        return None
+    return unquote(key), parse_partition_value(raw)
+
+
+def parse_partitions(relative_path: str | Path) -> dict[str, Any]:
+    """Partition values encoded in the directories of a path relative to the root."""
+    partitions: dict[str, Any] = {}
+    for segment in Path(relative_path).parent.parts:
+        parsed = parse_partition_segment(segment)
+        if parsed:
+            partitions[parsed[0]] = parsed[1]
+    return partitions
+
+
+def _coerce_like(value: Any, like: Any) -> Any:
+    """A filter literal in the type of a parsed partition value (``"2026"`` -> ``2026``)."""
+    if isinstance(value, (list, tuple)):
+        return type(value)(_coerce_like(item, like) for item in value)
+    if isinstance(like, int) and isinstance(value, str) and _INTEGER.fullmatch(value.strip()):
+        return int(value)
+    if isinstance(like, str) and isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    return value
+
+
+def _matches(partitions: dict[str, Any], filters: list[Filter]) -> bool:
+    """Evaluate only the filters on keys already known from the path.
+
+    Filter values are compared in the type the path value was parsed to, so
+    ``("year", "==", "2026")`` selects ``year=2026``.
+    """
+    applicable = [
+        (key, op, _coerce_like(value, partitions[key]))
+        for key, op, value in filters
+        if key in partitions
+    ]
+    if not applicable:
+        return True
+    row = pd.DataFrame({key: [value] for key, value in partitions.items()})
+    return bool(build_mask(row, applicable).iloc[0])
+
+
+@dataclass
+class PartitionFile:
+    path: str
+    partitions: dict[str, Any] = field(default_factory=dict)
+
+
+def discover_partitions(
+    root: str | Path,
+    pattern: str = "*.csv",
+    filters: list[Filter] | None = None,
+    include_compressed: bool = True,
+) -> list[PartitionFile]:
+    """Walk ``root`` recursively and list data files with their partition values.
+
+    Directories whose ``key=value`` segment fails a filter on that key are not
+    descended into, so pruned partitions are never even listed.
+    """
+    root = Path(root)
+    filters = normalize_filters(filters)
+    patterns = [pattern] + (compressed_patterns(pattern) if include_compressed else [])
+    found: list[PartitionFile] = []
+
+    for directory, subdirs, filenames in os.walk(root):
+        relative = Path(directory).relative_to(root)
+        partitions = parse_partitions(relative / "_")
+        kept = []
+        for subdir in sorted(subdirs):
+            if subdir.startswith((".", "_")):
+                continue
+            parsed = parse_partition_segment(subdir)
+            if parsed and not _matches({**partitions, parsed[0]: parsed[1]}, filters):
+                continue
+            kept.append(subdir)
+        subdirs[:] = kept
+
+        for filename in sorted(filenames):
+            if filename.startswith((".", "_")):
+                continue
+            if any(fnmatch.fnmatch(filename, candidate) for candidate in patterns):
+                found.append(PartitionFile(str(Path(directory) / filename), dict(partitions)))
+    return found
+
+
+class PartitionedDataset:
+    """One logical dataset spread over a Hive-style directory tree.
+
+    Partition keys become virtual columns. Filters on those keys prune files
+    before any of them is opened; the remaining filters and the column
+    projection are pushed down to each file's reader.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        extractor: FileExtractor | None = None,
+        pattern: str = "*.csv",
+        include_compressed: bool = True,
+    ):
+        if extractor is None:
+            from src.data.file_extractor import FileExtractor
+
+            extractor = FileExtractor(data_dir=root)
+        self.root = Path(root)
+        self.extractor = extractor
+        self.pattern = pattern
+        self.include_compressed = include_compressed
+
+    @property
+    def files(self) -> list[PartitionFile]:
+        return self.prune()
+
+    @property
+    def partition_keys(self) -> list[str]:
+        keys: dict[str, None] = {}
+        for item in self.files:
+            keys.update(dict.fromkeys(item.partitions))
+        return list(keys)
+
+    def prune(self, filters: list[Filter] | None = None) -> list[PartitionFile]:
+        """Files whose partition values can satisfy the filters."""
+        filters = normalize_filters(filters)
+        files = discover_partitions(
+            self.root, self.pattern, filters=filters, include_compressed=self.include_compressed
+        )
+        selected = [item for item in files if _matches(item.partitions, filters)]
+        logger.info(
+            f"Dataset particionado {self.root}: {len(selected)} de {len(files)} arquivos "
+            f"após a poda de partições"
+        )
+        return selected
+
+    def partition_values(self, filters: list[Filter] | None = None) -> pd.DataFrame:
+        """One row per selected file with its partition values."""
+        return pd.DataFrame(
+            [{"path": item.path, **item.partitions} for item in self.prune(filters)]
+        )
+
+    def iter_chunks(
+        self,
+        columns: list[str] | None = None,
+        filters: list[Filter] | None = None,
+        chunksize: int = DEFAULT_PARTITION_CHUNKSIZE,
+    ) -> Iterator[pd.DataFrame]:
+        """Lazily yield filtered, projected chunks with the partition columns attached."""
+        filters = normalize_filters(filters)
+        for item in self.prune(filters):
+            keys = set(item.partitions)
+            data_filters = [entry for entry in filters if entry[0] not in keys]
+            data_columns = None if columns is None else [c for c in columns if c not in keys]
+            for chunk in self._iter_file_chunks(item.path, data_columns, data_filters, chunksize):
+                if chunk.empty:
+                    continue
+                yield self._attach_partitions(chunk, item.partitions, columns)
+
+    def to_frame(
+        self,
+        columns: list[str] | None = None,
+        filters: list[Filter] | None = None,
+        chunksize: int = DEFAULT_PARTITION_CHUNKSIZE,
+    ) -> pd.DataFrame:
+        """Materialize the selected partitions as a single DataFrame."""
+        chunks = list(self.iter_chunks(columns=columns, filters=filters, chunksize=chunksize))
+        if not chunks:
+            return pd.DataFrame(columns=list(columns or []))
+        return concat_chunks(chunks)
+
+    def _iter_file_chunks(
+        self,
+        path: str,
+        columns: list[str] | None,
+        filters: list[Filter],
+        chunksize: int,
+    ) -> Iterator[pd.DataFrame]:
+        suffix = Path(strip_compression_suffix(path)).suffix.lower()
+        if suffix == ".parquet":
+            yield self.extractor.extract_parquet(path, columns=columns, filters=filters)
+        elif suffix in {".jsonl", ".ndjson"}:
+            yield from self.extractor.iter_jsonl_chunks(
+                path, chunksize=chunksize, columns=columns, filters=filters
+            )
+        elif suffix in {".xlsx", ".xls"}:
+            yield self.extractor.extract_excel(path, columns=columns, filters=filters)
+        else:
+            yield from self.extractor.iter_csv_chunks(
+                path, columns=columns, filters=filters, chunksize=chunksize
+            )
+
+    @staticmethod
+    def _attach_partitions(
+        chunk: pd.DataFrame, partitions: dict[str, Any], columns: list[str] | None
+    ) -> pd.DataFrame:
+        chunk = chunk.copy(deep=False)
+        for key, value in partitions.items():
+            if key in chunk.columns or (columns is not None and key not in columns):
+                continue
+            if isinstance(value, str):
+                chunk[key] = pd.Categorical([value] * len(chunk))
+            else:
+                chunk[key] = value
+        if columns is not None:
+            chunk = chunk.loc[:, [column for column in columns if column in chunk.columns]]
+        return chunk
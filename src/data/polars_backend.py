@@ -0,0 +1,333 @@
+"""Polars execution backend for the curation steps of ``DataTransformer``.
+
+Polars runs column expressions on all cores and keeps text in Arrow buffers
+instead of Python objects. ``PolarsTransformer`` exposes the same methods and
+log entries as ``DataTransformer``: pandas inputs are converted at the
+boundary and returned as pandas (original index kept), Polars inputs stay in
+Polars. :meth:`PolarsTransformer.curate` converts only once for the whole
+chain. Type decisions come from the same sample-based ``TypeInferenceEngine``,
+and any column Polars cannot convert exactly like pandas is converted by the
+pandas path instead, so both backends produce the same frame.
+"""
+
+from __future__ import annotations
+
+import logging
+from importlib.util import find_spec
+from typing import Any
+
+import pandas as pd
+
+from config.settings import Settings
+from src.data.transformer import APPROX_STRATEGIES, DataTransformer, clean_column_name
+from src.data.type_inference import MIXED_DATE_FORMAT
+
+logger = logging.getLogger(__name__)
+
+POLARS_AVAILABLE = find_spec("polars") is not None
+BACKENDS = ("pandas", "polars")
+# Hidden column carrying the pandas row position through the Polars chain.
+ROW_COLUMN = "__row__"
+
+
+def resolve_backend(backend: str | None = None) -> str:
+    """Backend for this call: the argument, else ``Settings.TRANSFORM_BACKEND``.
+
+    Falls back to pandas (with a warning) when Polars is requested but missing.
+    """
+    backend = (backend or getattr(Settings, "TRANSFORM_BACKEND", "pandas")).lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend de transformação inválido: {backend} (use {BACKENDS})")
+    if backend == "polars" and not POLARS_AVAILABLE:
+        logger.warning("Backend polars solicitado, mas o pacote não está instalado; usando pandas")
+        return "pandas"
+    return backend
+
+
+def get_transformer(backend: str | None = None, **kwargs: Any) -> DataTransformer:
+    """DataTransformer for the resolved backend."""
+    if resolve_backend(backend) == "polars":
+        return PolarsTransformer(**kwargs)
+    return DataTransformer(**kwargs)
+
+
+def to_polars(df: pd.DataFrame, bool_objects_as_float: bool = False) -> Any:
+    """pandas -> Polars, with NaN read as null and the row position kept in ROW_COLUMN.
+
+    With ``bool_objects_as_float``, object columns of booleans with nulls
+    become Float64 (True -> 1.0), as pandas' ``convert_dtypes`` reads them;
+    Polars would otherwise see a Boolean column and never convert it.
+    """
+    import polars as pl
+
+    df = df.reset_index(drop=True)
+    if bool_objects_as_float:
+        for position in range(df.shape[1]):
+            column = df.iloc[:, position]
+            if (
+                column.dtype == object
+                and column.isna().any()
+                and pd.api.types.infer_dtype(column, skipna=True) == "boolean"
+            ):
+                df.isetitem(position, column.astype("float64"))
+    frame = pl.from_pandas(df, nan_to_null=True)
+    return frame.with_row_index(ROW_COLUMN)
+
+
+def _ns_dtype(dtype: Any) -> Any:
+    """The nanosecond version of a datetime dtype, None for every other dtype."""
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return None if dtype.unit == "ns" else pd.DatetimeTZDtype("ns", dtype.tz)
+    if pd.api.types.is_datetime64_dtype(dtype) and dtype != "datetime64[ns]":
+        return "datetime64[ns]"
+    return None
+
+
+def to_pandas(frame: Any, index: pd.Index | None = None) -> pd.DataFrame:
+    """Polars -> pandas; rows get back their original labels from ``index``.
+
+    Datetimes come back in nanoseconds like pandas' parsers return them,
+    whatever unit a Polars expression (e.g. a null fill) left them in.
+    """
+    rows = frame[ROW_COLUMN].to_numpy() if ROW_COLUMN in frame.columns else None
+    if rows is not None:
+        frame = frame.drop(ROW_COLUMN)
+    df = frame.to_pandas()
+    for position, dtype in enumerate(df.dtypes):
+        ns_dtype = _ns_dtype(dtype)
+        if ns_dtype is not None:
+            df.isetitem(position, df.iloc[:, position].astype(ns_dtype))
+    if index is not None and rows is not None:
+        df.index = index[rows]
+    return df
+
+
+def _data_columns(frame: Any) -> list[str]:
+    return [column for column in frame.columns if column != ROW_COLUMN]
+
+
+class PolarsTransformer(DataTransformer):
+    """``DataTransformer`` whose curation steps run on Polars.
+
+    ``optimize_memory`` and ``create_features`` keep the inherited pandas
+    implementation (the latter is already a single numpy pass). ``executor`` arguments are accepted
+    for interface parity and ignored: Polars already uses every core. The
+    ``approx_*`` fill strategies run exactly, since Polars medians and modes
+    are already cheap.
+    """
+
+    def __init__(self, copy=False, type_engine=None):
+        if not POLARS_AVAILABLE:
+            raise ImportError("Backend polars requer o pacote 'polars'")
+        super().__init__(copy=copy, type_engine=type_engine)
+
+    def _run(self, df, func, **conversion):
+        """Apply ``func`` to a Polars frame, converting pandas input at the boundary."""
+        if isinstance(df, pd.DataFrame):
+            return to_pandas(func(to_polars(df, **conversion)), df.index)
+        return func(df)
+
+    # -- steps -------------------------------------------------------------
+
+    def clean_column_names(self, df):
+        return self._run(df, self._clean_column_names)
+
+    def convert_dtypes(self, df, executor=None):
+        return self._run(df, self._convert_dtypes, bool_objects_as_float=True)
+
+    def handle_missing_values(self, df, strategy="auto", executor=None, sketch_error=None):
+        strategy = APPROX_STRATEGIES.get(strategy, strategy)
+        return self._run(df, lambda frame: self._handle_missing_values(frame, strategy))
+
+    def remove_duplicates(self, df, subset=None):
+        return self._run(df, lambda frame: self._remove_duplicates(frame, subset))
+
+    def create_features(self, df, date_column=None, **params):
+        # Calendar parts already come from one numpy pass; Polars frames round-trip.
+        if isinstance(df, pd.DataFrame):
+            return super().create_features(df, date_column=date_column, **params)
+        import polars as pl
+
+        featured = super().create_features(to_pandas(df), date_column=date_column, **params)
+        return pl.from_pandas(featured)
+
+    def curate(self, df, optimize_memory=False, date_features=False):
+        """Run the standard curation chain with a single conversion each way."""
+        try:
+            frame = to_polars(df, bool_objects_as_float=True)
+        except (TypeError, ValueError) as exc:  # object columns mixing types
+            logger.warning(f"Conversão para polars falhou ({exc}); usando pandas")
+            curated = super().clean_column_names(df)
+            curated = super().convert_dtypes(curated)
+            curated = super().handle_missing_values(curated, strategy="auto")
+            curated = super().remove_duplicates(curated)
+            return self._finish(curated, optimize_memory, date_features)
+        frame = self._clean_column_names(frame)
+        frame = self._convert_dtypes(frame)
+        frame = self._handle_missing_values(frame, "auto")
+        frame = self._remove_duplicates(frame, None)
+        return self._finish(to_pandas(frame, df.index), optimize_memory, date_features)
+
+    def _finish(self, curated, optimize_memory, date_features):
+        """Pandas-side tail of the chain: date features, then memory optimization."""
+        if date_features:
+            curated = self.create_features(curated)
+        if optimize_memory:
+            curated = self.optimize_memory(curated)
+        return curated
+
+    # -- Polars implementations --------------------------------------------
+
+    def _clean_column_names(self, frame):
+        original = _data_columns(frame)
+        frame = frame.rename({column: clean_column_name(column) for column in original})
+        self._log_transformation(
+            "clean_column_names", {"original": original, "new": _data_columns(frame)}
+        )
+        return frame
+
+    def _sample(self, column):
+        import polars as pl
+
+        values = column.drop_nulls()
+        positions = self.type_engine.sample_positions(len(values))
+        if positions is not None:
+            values = values.gather(pl.Series(positions))
+        return pd.Series(values.to_list(), dtype=object)
+
+    def _convert_column(self, column):
+        """Convert one text column; None when the pandas path must do it."""
+        import polars as pl
+
+        inference = self.type_engine.infer(self._sample(column))
+        try:
+            if inference.kind == "datetime" and inference.date_format != MIXED_DATE_FORMAT:
+                values = column.str.strptime(pl.Datetime("ns"), inference.date_format, strict=True)
+                return values, inference
+            if inference.kind == "numeric":
+                try:
+                    return column.cast(pl.Int64, strict=True), inference
+                except pl.exceptions.PolarsError:
+                    values = column.cast(pl.Float64, strict=True).fill_nan(None)
+                    return values, inference
+        except pl.exceptions.PolarsError:
+            return None
+        if inference.kind == "text":
+            return column, inference
+        return None
+
+    def _convert_dtypes(self, frame):
+        import polars as pl
+
+        conversion_stats = {
+            "datetime_converted": [],
+            "numeric_converted": [],
+            "datetime_failed": [],
+            "numeric_failed": [],
+            "date_formats": {},
+        }
+        replacements = []
+        for name in _data_columns(frame):
+            column = frame[name]
+            if column.dtype != pl.String:
+                continue
+            converted = self._convert_column(column)
+            if converted is None:
+                # Mixed date formats or values pandas parses differently.
+                result = self.type_engine.convert(column.to_pandas().astype(object))
+                values = pl.from_pandas(result.values, nan_to_null=True).alias(name)
+            else:
+                values, result = converted
+            replacements.append(values.alias(name))
+
+            if result.datetime_error:
+                conversion_stats["datetime_failed"].append(
+                    {"column": name, "error": result.datetime_error}
+                )
+            if result.kind == "datetime":
+                conversion_stats["datetime_converted"].append(name)
+                conversion_stats["date_formats"][name] = result.date_format
+            elif result.kind == "numeric":
+                conversion_stats["numeric_converted"].append(name)
+            elif result.numeric_error:
+                conversion_stats["numeric_failed"].append(
+                    {"column": name, "error": result.numeric_error}
+                )
+        if replacements:
+            frame = frame.with_columns(replacements)
+
+        self._log_transformation(
+            "convert_dtypes",
+            {
+                "dtypes": {name: str(frame[name].dtype) for name in _data_columns(frame)},
+                "conversion_stats": conversion_stats,
+            },
+        )
+        return frame
+
+    def _fill_value(self, column):
+        if column.dtype.is_numeric():
+            return column.median()
+        modes = column.drop_nulls().mode()
+        if modes.is_empty():
+            return "Unknown"
+        return modes.sort()[0]
+
+    def _handle_missing_values(self, frame, strategy):
+        import polars as pl
+
+        columns = _data_columns(frame)
+        null_counts = frame.select(columns).null_count().row(0)
+        missing_before = int(sum(null_counts))
+        if missing_before == 0:
+            logger.info("Nenhum valor faltante encontrado")
+            return frame
+        missing = [name for name, count in zip(columns, null_counts, strict=True) if count]
+
+        if strategy == "drop":
+            frame = frame.drop_nulls(subset=columns)
+        elif strategy in {"fill_mean", "fill_median"}:
+            aggregate = "mean" if strategy == "fill_mean" else "median"
+            numeric = [name for name in missing if frame[name].dtype.is_numeric()]
+            frame = frame.with_columns(
+                pl.col(name).cast(pl.Float64).fill_null(getattr(pl.col(name), aggregate)())
+                for name in numeric
+            )
+        elif strategy in {"fill_mode", "auto"}:
+            fills = []
+            for name in missing:
+                column = frame[name]
+                if strategy == "fill_mode" and column.dtype != pl.String:
+                    continue
+                if column.dtype == pl.Null:
+                    column = column.cast(pl.String)
+                value = self._fill_value(column)
+                if value is None:
+                    continue  # all-null numeric column: the median is null as well
+                if column.dtype.is_numeric():
+                    column = column.cast(pl.Float64)
+                elif value == "Unknown" and column.dtype != pl.String:
+                    continue
+                fills.append(column.fill_null(value).alias(name))
+            frame = frame.with_columns(fills)
+
+        missing_after = int(sum(frame.select(columns).null_count().row(0)))
+        self._log_transformation(
+            "handle_missing_values",
+            {"missing_before": missing_before, "missing_after": missing_after},
+        )
+        return frame
+
+    def _remove_duplicates(self, frame, subset):
+        before = frame.height
+        frame = frame.unique(
+            subset=subset or _data_columns(frame), keep="first", maintain_order=True
+        )
+        after = frame.height
+        removed = before - after
+        if removed > 0:
+            logger.info(f"Removidas {removed} linhas duplicadas")
+        self._log_transformation(
+            "remove_duplicates", {"before": before, "after": after, "removed": removed}
+        )
+        return frame
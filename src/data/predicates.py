@@ -0,0 +1,181 @@
+"""Column projection and simple row predicates shared by the file readers.
+
+Filters are a list of ``(column, op, value)`` tuples combined with AND, in the
+same shape pyarrow accepts. Supported operators: ``==``, ``!=``, ``<``,
+``<=``, ``>``, ``>=``, ``in``, ``not in`` and ``between`` (inclusive, value is
+a ``(low, high)`` pair). Pass ``date``/``Timestamp`` values for date windows;
+text columns are parsed as dates only for the comparison.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+Filter = tuple[str, str, Any]
+
+COMPARISON_OPS = {"==", "=", "!=", "<", "<=", ">", ">="}
+SUPPORTED_OPS = COMPARISON_OPS | {"in", "not in", "between"}
+
+
+def normalize_filters(filters: Iterable[Sequence[Any]] | None) -> list[Filter]:
+    """Validate filters and return them as a list of ``(column, op, value)`` tuples."""
+    normalized: list[Filter] = []
+    for item in filters or []:
+        if len(item) != 3:
+            raise ValueError(f"Filtro inválido (esperado coluna, operador, valor): {item!r}")
+        column, op, value = item
+        op = str(op).lower()
+        if op not in SUPPORTED_OPS:
+            raise ValueError(f"Operador de filtro não suportado: {op}")
+        if op == "between" and (not isinstance(value, (list, tuple)) or len(value) != 2):
+            raise ValueError(f"'between' exige um par (inicio, fim): {value!r}")
+        normalized.append((column, "==" if op == "=" else op, value))
+    return normalized
+
+
+def filter_columns(filters: Iterable[Filter] | None) -> list[str]:
+    """Columns referenced by the filters, in first-use order."""
+    return list(dict.fromkeys(column for column, _, _ in filters or []))
+
+
+def read_columns(
+    columns: Sequence[str] | None, filters: Iterable[Filter] | None
+) -> list[str] | None:
+    """Columns a reader must load: the projection plus any filter-only columns."""
+    if columns is None:
+        return None
+    return list(dict.fromkeys([*columns, *filter_columns(filters)]))
+
+
+def _is_datelike(value: Any) -> bool:
+    return isinstance(value, (dt.date, np.datetime64, pd.Timestamp))
+
+
+def _comparable(series: pd.Series, value: Any) -> tuple[pd.Series, Any]:
+    values = value if isinstance(value, (list, tuple, set, frozenset)) else [value]
+    if pd.api.types.is_datetime64_any_dtype(series) or any(_is_datelike(v) for v in values):
+        if not pd.api.types.is_datetime64_any_dtype(series):
+            series = pd.to_datetime(series, errors="coerce")
+        tz = getattr(series.dt, "tz", None)
+
+        def to_timestamp(item: Any) -> pd.Timestamp:
+            stamp = pd.Timestamp(item)
+            if tz is not None and stamp.tzinfo is None:
+                stamp = stamp.tz_localize(tz)
+            return stamp
+
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return series, type(value)(to_timestamp(item) for item in value)
+        return series, to_timestamp(value)
+    return series, value
+
+
+def build_mask(df: pd.DataFrame, filters: Iterable[Filter]) -> pd.Series:
+    """Boolean mask of the rows satisfying every filter (missing values never match)."""
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in normalize_filters(filters):
+        if column not in df.columns:
+            raise KeyError(f"Coluna do filtro não encontrada: {column}")
+        series, value = _comparable(df[column], value)
+        if op == "==":
+            condition = series == value
+        elif op == "!=":
+            condition = (series != value) & series.notna()
+        elif op == "<":
+            condition = series < value
+        elif op == "<=":
+            condition = series <= value
+        elif op == ">":
+            condition = series > value
+        elif op == ">=":
+            condition = series >= value
+        elif op == "in":
+            condition = series.isin(list(value))
+        elif op == "not in":
+            condition = ~series.isin(list(value)) & series.notna()
+        else:
+            low, high = value
+            condition = (series >= low) & (series <= high)
+        mask &= condition.fillna(False).astype(bool)
+    return mask
+
+
+def apply_filters(
+    df: pd.DataFrame,
+    filters: Iterable[Filter] | None,
+    columns: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """Keep matching rows, then narrow to the requested columns."""
+    filters = normalize_filters(filters)
+    if filters:
+        df = df.loc[build_mask(df, filters)]
+    if columns is not None:
+        df = df.loc[:, [column for column in columns if column in df.columns]]
+    return df
+
+
+def iter_filtered(
+    chunks: Iterable[pd.DataFrame],
+    filters: Iterable[Filter] | None,
+    columns: Sequence[str] | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Apply filters and projection chunk by chunk.
+
+    Chunks left empty are dropped; if nothing matches at all, a single empty
+    chunk is yielded so callers still see the projected schema.
+    """
+    filters = normalize_filters(filters)
+    first_empty: pd.DataFrame | None = None
+    yielded = False
+    for chunk in chunks:
+        chunk = apply_filters(chunk, filters, columns)
+        if chunk.empty:
+            if first_empty is None:
+                first_empty = chunk
+            continue
+        yielded = True
+        yield chunk
+    if not yielded and first_empty is not None:
+        yield first_empty
+
+
+def _arrow_value(value: Any, field_type: Any) -> Any:
+    import pyarrow as pa
+
+    if field_type is None:
+        return value
+    if pa.types.is_timestamp(field_type):
+        stamp = pd.Timestamp(value)
+        if field_type.tz is not None and stamp.tzinfo is None:
+            stamp = stamp.tz_localize(field_type.tz)
+        return stamp
+    if pa.types.is_date(field_type):
+        return pd.Timestamp(value).date()
+    return value
+
+
+def to_arrow_filters(filters: Iterable[Filter] | None, schema: Any = None) -> list[tuple] | None:
+    """Translate filters to pyarrow's DNF form, coercing date values to the file schema.
+
+    pyarrow uses these to skip whole row groups from their min/max statistics
+    before decoding, then filters the surviving rows exactly.
+    """
+    translated: list[tuple] = []
+    for column, op, value in normalize_filters(filters):
+        field_type = None
+        if schema is not None and column in schema.names:
+            field_type = schema.field(column).type
+        if op == "between":
+            low, high = value
+            translated.append((column, ">=", _arrow_value(low, field_type)))
+            translated.append((column, "<=", _arrow_value(high, field_type)))
+        elif op in {"in", "not in"}:
+            translated.append((column, op, [_arrow_value(item, field_type) for item in value]))
+        else:
+            translated.append((column, op, _arrow_value(value, field_type)))
+    return translated or None
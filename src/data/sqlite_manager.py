@@ -6,6 +6,7 @@ import json
 import logging
 import shutil
 import sqlite3
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -19,7 +20,13 @@ logger = logging.getLogger(__name__)
 class SQLiteManager:
     """Manage SQLite reads, writes, and dataset governance metadata."""
 
-    SYSTEM_TABLES = {"dataset_registry", "dataset_audit_log", "sqlite_sequence"}
+    SYSTEM_TABLES = {
+        "dataset_registry",
+        "dataset_audit_log",
+        "ingestion_watermark",
+        "dataset_profiles",
+        "sqlite_sequence",
+    }
 
     def __init__(self, db_path: str | None = None):
         self.db_path = db_path or Settings.SQLITE_PATH
@@ -48,13 +55,18 @@ class SQLiteManager:
         if_exists: str = "replace",
         metadata: dict[str, Any] | None = None,
     ) -> bool:
-        """Persist a DataFrame and register its governance metadata."""
+        """Persist a DataFrame and register its governance metadata.
+
+        Any stored profile payload of the table is dropped, since it no longer
+        describes the rows (see ``src.app.profile_store`` to keep one).
+        """
         conn = self.connect()
         if not conn:
             return False
 
         try:
             df.to_sql(table_name, conn, if_exists=if_exists, index=False)
+            self._drop_profile_payload(conn, table_name)
             self._register_dataset(conn, table_name, df, metadata or {})
             logger.info(f"DataFrame salvo em '{table_name}' ({len(df)} linhas)")
             return True
@@ -64,6 +76,43 @@ class SQLiteManager:
         finally:
             self.disconnect()
 
+    def df_chunks_to_sql(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        table_name: str,
+        if_exists: str = "replace",
+        metadata: dict[str, Any] | None = None,
+    ) -> bool:
+        """Persist a stream of chunks on one connection and register the dataset once.
+
+        As with :meth:`df_to_sql`, a stored profile payload of the table is dropped.
+        """
+        conn = self.connect()
+        if not conn:
+            return False
+
+        try:
+            rows = 0
+            schema: pd.DataFrame | None = None
+            for chunk in chunks:
+                mode = if_exists if schema is None else "append"
+                chunk.to_sql(table_name, conn, if_exists=mode, index=False)
+                if schema is None:
+                    schema = chunk.iloc[:0]
+                rows += len(chunk)
+            if schema is None:
+                logger.warning(f"Nenhum bloco recebido para '{table_name}'")
+                return False
+            self._drop_profile_payload(conn, table_name)
+            self._register_dataset(conn, table_name, schema, metadata or {}, row_count=rows)
+            logger.info(f"Blocos salvos em '{table_name}' ({rows} linhas)")
+            return True
+        except Exception as exc:  # noqa: BLE001
+            logger.error(f"Erro ao salvar blocos: {exc}")
+            return False
+        finally:
+            self.disconnect()
+
     def sql_to_df(self, query: str, params: tuple[Any, ...] | None = None) -> pd.DataFrame:
         """Execute a SQL query and return a DataFrame."""
         conn = self.connect()
@@ -247,6 +296,7 @@ class SQLiteManager:
                     ),
                 )
                 cursor.execute("DELETE FROM dataset_registry WHERE table_name = ?", (table_name,))
+                cursor.execute("DELETE FROM dataset_profiles WHERE table_name = ?", (table_name,))
                 purged += 1
 
             conn.commit()
@@ -293,6 +343,108 @@ class SQLiteManager:
         finally:
             self.disconnect()
 
+    def get_ingestion_watermark(self, source_key: str) -> dict[str, dict[str, Any]]:
+        """Return the files already ingested for a source, keyed by resolved path."""
+        rows = self.fetch_all(
+            """
+            SELECT file_path, size_bytes, mtime_ns, content_hash, ingested_at
+            FROM ingestion_watermark
+            WHERE source_key = ?
+            """,
+            params=(source_key,),
+        )
+        return {
+            row[0]: {
+                "size": int(row[1]),
+                "mtime_ns": int(row[2]),
+                "content_hash": row[3],
+                "ingested_at": row[4],
+            }
+            for row in rows
+        }
+
+    def record_ingested_files(self, source_key: str, files: list[dict[str, Any]]) -> int:
+        """Upsert watermark rows for files processed in an ingestion run."""
+        if not files:
+            return 0
+        conn = self.connect()
+        if not conn:
+            return 0
+
+        try:
+            ingested_at = datetime.now().isoformat(timespec="seconds")
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO ingestion_watermark (
+                    source_key, file_path, size_bytes, mtime_ns, content_hash, ingested_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        source_key,
+                        item["path"],
+                        int(item["size"]),
+                        int(item["mtime_ns"]),
+                        item.get("content_hash"),
+                        ingested_at,
+                    )
+                    for item in files
+                ],
+            )
+            conn.commit()
+            return len(files)
+        except Exception as exc:  # noqa: BLE001
+            logger.error(f"Erro ao registrar watermark de ingestão: {exc}")
+            return 0
+        finally:
+            self.disconnect()
+
+    def reset_ingestion_watermark(self, source_key: str) -> int:
+        """Forget ingested files so the next run reprocesses the whole source."""
+        return (
+            self.execute_query(
+                "DELETE FROM ingestion_watermark WHERE source_key = ?", params=(source_key,)
+            )
+            or 0
+        )
+
+    def get_profile_payload(self, table_name: str) -> str | None:
+        """Serialized profile state stored for a table, if any."""
+        return self.fetch_scalar(
+            "SELECT state_json FROM dataset_profiles WHERE table_name = ?", params=(table_name,)
+        )
+
+    def store_profile_payload(self, table_name: str, row_count: int, payload: str | None) -> bool:
+        """Store (or, with ``payload=None``, drop) the serialized profile state of a table."""
+        conn = self.connect()
+        if not conn:
+            return False
+
+        try:
+            if payload is None:
+                self._drop_profile_payload(conn, table_name)
+            else:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO dataset_profiles
+                        (table_name, updated_at, row_count, state_json)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    (table_name, datetime.now().isoformat(timespec="seconds"), row_count, payload),
+                )
+            conn.commit()
+            return True
+        except Exception as exc:  # noqa: BLE001
+            logger.error(f"Erro ao salvar perfil de '{table_name}': {exc}")
+            return False
+        finally:
+            self.disconnect()
+
+    @staticmethod
+    def _drop_profile_payload(conn: sqlite3.Connection, table_name: str) -> None:
+        conn.execute("DELETE FROM dataset_profiles WHERE table_name = ?", (table_name,))
+
     def _ensure_system_tables(self, conn: sqlite3.Connection) -> None:
         conn.execute("""
             CREATE TABLE IF NOT EXISTS dataset_registry (
@@ -319,6 +471,25 @@ class SQLiteManager:
                 metadata_json TEXT NOT NULL
             )
             """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS ingestion_watermark (
+                source_key TEXT NOT NULL,
+                file_path TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                content_hash TEXT,
+                ingested_at TEXT NOT NULL,
+                PRIMARY KEY (source_key, file_path)
+            )
+            """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS dataset_profiles (
+                table_name TEXT PRIMARY KEY,
+                updated_at TEXT NOT NULL,
+                row_count INTEGER NOT NULL,
+                state_json TEXT NOT NULL
+            )
+            """)
 
     def _register_dataset(
         self,
@@ -326,6 +497,7 @@ class SQLiteManager:
         table_name: str,
         df: pd.DataFrame,
         metadata: dict[str, Any],
+        row_count: int | None = None,
     ) -> None:
         persisted_at = datetime.now().isoformat(timespec="seconds")
         retention_days = int(metadata.get("retention_days", 90))
@@ -368,7 +540,7 @@ class SQLiteManager:
                 int(bool(metadata.get("legal_basis_acknowledged", False))),
                 str(metadata.get("privacy_risk_level", "Minimal")),
                 int(df.shape[1]),
-                int(df.shape[0]),
+                int(df.shape[0] if row_count is None else row_count),
                 json.dumps(registry_payload, ensure_ascii=False),
             ),
         )
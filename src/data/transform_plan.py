@@ -0,0 +1,359 @@
+"""Declarative transformation plans: optimized first, executed lazily, cached per step prefix."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any
+
+import pandas as pd
+
+from src.data.transformer import DataTransformer, clean_column_name
+from src.utils.fingerprint import frame_fingerprint, stable_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PLAN_CACHE_ENTRIES = 16
+DEFAULT_PLAN_CACHE_BYTES = 512 * 1024**2
+
+# DataTransformer methods a plan may call, with the parameters they accept.
+PLAN_OPERATIONS = {
+    "clean_column_names": set(),
+    "convert_dtypes": set(),
+    "handle_missing_values": {"strategy", "sketch_error"},
+    "remove_duplicates": {"subset"},
+    "optimize_memory": {"category_max_ratio", "category_max_unique"},
+    "create_features": {
+        "date_column",
+        "date_columns",
+        "features",
+        "fiscal_year_start",
+        "holidays",
+    },
+    "rename_columns": {"mapping"},
+    "cast_columns": {"dtypes"},
+    "fill_columns": {"values"},
+    "drop_columns": {"columns"},
+}
+# Steps that give the same result when applied twice in a row with equal parameters.
+IDEMPOTENT_OPERATIONS = {
+    "clean_column_names",
+    "convert_dtypes",
+    "remove_duplicates",
+    "optimize_memory",
+}
+# Steps that accept an executor at run time (never part of the cache key).
+EXECUTOR_OPERATIONS = {"convert_dtypes", "handle_missing_values"}
+
+
+@dataclass(frozen=True)
+class TransformStep:
+    operation: str
+    params: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        allowed = PLAN_OPERATIONS.get(self.operation)
+        if allowed is None:
+            raise ValueError(f"Operação de plano desconhecida: {self.operation}")
+        unknown = set(self.params) - allowed
+        if unknown:
+            raise ValueError(f"Parâmetros inválidos para {self.operation}: {sorted(unknown)}")
+
+    @property
+    def key(self) -> str:
+        return stable_key(self.operation, self.params)
+
+    def describe(self) -> str:
+        params = ", ".join(f"{name}={value!r}" for name, value in self.params.items())
+        return f"{self.operation}({params})"
+
+
+def _merge_steps(first: TransformStep, second: TransformStep) -> TransformStep | None:
+    """Fuse two adjacent steps into one when the result is provably the same."""
+    if first.operation != second.operation:
+        return None
+    operation = first.operation
+    if operation in IDEMPOTENT_OPERATIONS and first.params == second.params:
+        return first
+    if operation == "rename_columns":
+        before, after = first.params["mapping"], second.params["mapping"]
+        mapping = {old: after.get(new, new) for old, new in before.items()}
+        for old, new in after.items():
+            if old not in before and old not in before.values():
+                mapping[old] = new
+        return TransformStep(operation, {"mapping": mapping})
+    if operation == "fill_columns":
+        # The first fill wins: after it, that column has no nulls left to fill.
+        return TransformStep(
+            operation, {"values": {**second.params["values"], **first.params["values"]}}
+        )
+    if operation == "cast_columns":
+        if set(first.params["dtypes"]) & set(second.params["dtypes"]):
+            return None  # chained casts (e.g. float -> int -> str) are not one cast
+        return TransformStep(
+            operation, {"dtypes": {**first.params["dtypes"], **second.params["dtypes"]}}
+        )
+    if operation == "drop_columns":
+        columns = list(dict.fromkeys([*first.params["columns"], *second.params["columns"]]))
+        return TransformStep(operation, {"columns": columns})
+    return None
+
+
+def _null_columns_after(step: TransformStep, null_columns: set[str] | None) -> set[str] | None:
+    """Columns that may hold nulls after ``step``; None when unknown.
+
+    Any step that may introduce nulls (type conversion and casts turn blanks
+    and unparseable values into NaN/NaT, features may add nullable columns)
+    makes the set unknown.
+    """
+    if null_columns is None:
+        return None
+    operation, params = step.operation, step.params
+    if operation == "clean_column_names":
+        return {clean_column_name(column) for column in null_columns}
+    if operation == "rename_columns":
+        return {params["mapping"].get(column, column) for column in null_columns}
+    if operation == "drop_columns":
+        return null_columns - set(params["columns"])
+    if operation == "fill_columns":
+        filled = {column for column, value in params["values"].items() if value is not None}
+        return null_columns - filled
+    if operation == "handle_missing_values":
+        # Only 'drop' is guaranteed to leave no nulls (all-null columns keep theirs on fill).
+        return set() if params.get("strategy", "auto") == "drop" else None
+    if operation == "remove_duplicates":
+        return null_columns
+    return None
+
+
+def _without_noops(step: TransformStep, null_columns: set[str] | None) -> TransformStep | None:
+    """Drop a step, or the part of it, that cannot change the frame."""
+    operation, params = step.operation, step.params
+    if operation == "handle_missing_values" and null_columns == set():
+        return None
+    if operation == "fill_columns":
+        values = params["values"]
+        if null_columns is not None:
+            values = {column: value for column, value in values.items() if column in null_columns}
+        return TransformStep(operation, {"values": values}) if values else None
+    if operation == "rename_columns":
+        mapping = {old: new for old, new in params["mapping"].items() if old != new}
+        return TransformStep(operation, {"mapping": mapping}) if mapping else None
+    if operation in {"cast_columns", "drop_columns"} and not next(iter(params.values())):
+        return None
+    return step
+
+
+@dataclass
+class PlanResult:
+    frame: pd.DataFrame
+    transform_log: list[dict[str, Any]]
+    steps: list[TransformStep]
+    reused_steps: int = 0
+
+    @property
+    def executed_steps(self) -> int:
+        return len(self.steps) - self.reused_steps
+
+
+class PlanCache:
+    """LRU of intermediate frames keyed by (input fingerprint, optimized step prefix).
+
+    Entries keep the frame and the log entries produced up to that step, so a
+    hit replays the log without re-running anything. Plans run in pipeline
+    mode, which never mutates its input, so cached frames share unchanged
+    columns with each other; each entry is sized with its full deep memory
+    usage, so shared columns are counted once per entry and the byte bound
+    is conservative.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_PLAN_CACHE_ENTRIES,
+        max_bytes: int = DEFAULT_PLAN_CACHE_BYTES,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[pd.DataFrame, tuple, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> tuple[pd.DataFrame, tuple] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0], entry[1]
+
+    def put(self, key: str, frame: pd.DataFrame, log: tuple) -> None:
+        size = int(frame.memory_usage(index=True, deep=True).sum())
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+            self._entries[key] = (frame, log, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+
+class TransformPlan:
+    """Immutable list of DataTransformer steps, built declaratively.
+
+    Nothing runs while the plan is built. :meth:`execute` first optimizes the
+    steps against the input (adjacent column-wise steps fused, idempotent
+    repeats and no-op fills dropped), then resumes from the longest cached
+    step prefix for that input, so re-running a plan or changing only its
+    tail recomputes only the steps after the last shared one.
+    """
+
+    def __init__(self, steps: Iterable[TransformStep] = ()):
+        self.steps: tuple[TransformStep, ...] = tuple(steps)
+
+    def __repr__(self) -> str:
+        return f"TransformPlan({[step.describe() for step in self.steps]})"
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def then(self, operation: str, **params: Any) -> TransformPlan:
+        return TransformPlan([*self.steps, TransformStep(operation, params)])
+
+    def clean_column_names(self) -> TransformPlan:
+        return self.then("clean_column_names")
+
+    def convert_dtypes(self) -> TransformPlan:
+        return self.then("convert_dtypes")
+
+    def handle_missing_values(self, strategy: str = "auto", **params: Any) -> TransformPlan:
+        return self.then("handle_missing_values", strategy=strategy, **params)
+
+    def remove_duplicates(self, subset: list[str] | None = None) -> TransformPlan:
+        return self.then("remove_duplicates", subset=subset)
+
+    def optimize_memory(self, **params: Any) -> TransformPlan:
+        return self.then("optimize_memory", **params)
+
+    def create_features(self, date_column: str | None = None, **params: Any) -> TransformPlan:
+        return self.then("create_features", date_column=date_column, **params)
+
+    def rename_columns(self, mapping: dict[str, str]) -> TransformPlan:
+        return self.then("rename_columns", mapping=dict(mapping))
+
+    def cast_columns(self, dtypes: dict[str, Any]) -> TransformPlan:
+        return self.then("cast_columns", dtypes=dict(dtypes))
+
+    def fill_columns(self, values: dict[str, Any]) -> TransformPlan:
+        return self.then("fill_columns", values=dict(values))
+
+    def drop_columns(self, columns: list[str]) -> TransformPlan:
+        return self.then("drop_columns", columns=list(columns))
+
+    def optimize(self, df: pd.DataFrame | None = None) -> list[TransformStep]:
+        """Optimized steps; with ``df``, no-op missing-value steps are dropped too."""
+        merged: list[TransformStep] = []
+        for step in self.steps:
+            fused = _merge_steps(merged[-1], step) if merged else None
+            if fused is None:
+                merged.append(step)
+            else:
+                merged[-1] = fused
+
+        null_columns = None
+        if df is not None:
+            null_columns = {str(column) for column in df.columns[df.isnull().any().to_numpy()]}
+        optimized: list[TransformStep] = []
+        for step in merged:
+            kept = _without_noops(step, null_columns)
+            if kept is not None:
+                optimized.append(kept)
+                null_columns = _null_columns_after(kept, null_columns)
+        return optimized
+
+    def explain(self, df: pd.DataFrame | None = None) -> list[str]:
+        return [step.describe() for step in self.optimize(df)]
+
+    def execute(
+        self,
+        df: pd.DataFrame,
+        cache: PlanCache | None = None,
+        executor: Executor | None = None,
+        transformer: DataTransformer | None = None,
+    ) -> PlanResult:
+        """Run the optimized plan, resuming from the longest cached prefix.
+
+        Nothing is cached unless a ``cache`` is given, so intermediate frames
+        of a dataset live only as long as the caller keeps that cache. With
+        one, the result is a deep copy: cached frames are never handed out.
+        """
+        transformer = transformer or DataTransformer(copy=False)
+        steps = self.optimize(df)
+        keys: list[str | None] = [None] * len(steps)
+        frame, log, start = df, (), 0
+        if cache is not None:
+            fingerprint = frame_fingerprint(df, include_index=True)
+            keys = [
+                stable_key(fingerprint, [step.key for step in steps[: i + 1]])
+                for i in range(len(steps))
+            ]
+            for index in range(len(steps) - 1, -1, -1):
+                cached = cache.get(keys[index])
+                if cached is not None:
+                    (frame, log), start = cached, index + 1
+                    break
+
+        for index in range(start, len(steps)):
+            step = steps[index]
+            options = dict(step.params)
+            if executor is not None and step.operation in EXECUTOR_OPERATIONS:
+                options["executor"] = executor
+            logged = len(transformer.transformations_log)
+            frame = getattr(transformer, step.operation)(frame, **options)
+            log = log + tuple(transformer.transformations_log[logged:])
+            if cache is not None:
+                cache.put(keys[index], frame, log)
+
+        if start:
+            logger.info(f"Plano reaproveitou {start} de {len(steps)} etapas do cache")
+        return PlanResult(
+            frame=frame if cache is None else frame.copy(),
+            transform_log=list(log),
+            steps=steps,
+            reused_steps=start,
+        )
+
+
+def curation_plan(optimize_memory: bool = False, date_features: bool = False) -> TransformPlan:
+    """The standard curation chain used by ``curate_dataset``."""
+    plan = (
+        TransformPlan()
+        .clean_column_names()
+        .convert_dtypes()
+        .handle_missing_values("auto")
+        .remove_duplicates()
+    )
+    if date_features:
+        plan = plan.create_features()
+    return plan.optimize_memory() if optimize_memory else plan
@@ -7,6 +7,71 @@ import pandas as pd
 import numpy as np
 from loguru import logger
 import re
+from functools import partial
+from src.data.date_features import DEFAULT_DATE_FEATURES, add_date_features
+from src.data.dtype_planner import downcast_numeric
+from src.data.type_inference import default_type_engine
+from src.utils.parallel import run_column_batches
+from src.utils.sketches import DEFAULT_SKETCH_ERROR, approximate_median, approximate_mode
+
+# Estratégias aproximadas e a estratégia exata equivalente
+APPROX_STRATEGIES = {
+    "approx_median": "fill_median",
+    "approx_mode": "fill_mode",
+    "approx_auto": "auto",
+}
+
+
+def clean_column_name(name):
+    """Padroniza um nome de coluna: minúsculas, sem pontuação, espaços viram '_'"""
+    name = str(name).lower().strip()
+    name = re.sub(r"[^\w\s]", "", name)
+    name = re.sub(r"\s+", "_", name)
+    return name
+
+
+def _auto_fill_value(series, sketch_error=None):
+    """
+    Valor do modo auto: mediana para numéricas, moda (ou 'Unknown') para as demais
+
+    Com sketch_error, mediana e moda são estimadas numa amostra de tamanho fixo
+    (erro de rank/frequência até sketch_error), em tempo e memória constantes.
+    """
+    numeric = pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+    if sketch_error is not None:
+        if numeric:
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            median = approximate_median(values, epsilon=sketch_error)
+            return np.nan if median is None else median
+        mode = approximate_mode(series, epsilon=sketch_error)
+        return "Unknown" if mode is None else mode
+    if numeric:
+        return series.median()
+    mode = series.mode()
+    return mode[0] if not mode.empty else "Unknown"
+
+
+def _fill_missing(series, fill_value):
+    """
+    fillna com o valor do modo auto/mediana
+
+    Inteiros anuláveis (Int64) passam a float64 antes, como as colunas int64 com
+    faltantes lidas de CSV: a mediana pode ser fracionária (p.ex. 1.5).
+    """
+    if pd.api.types.is_integer_dtype(series) and pd.api.types.is_extension_array_dtype(series):
+        series = series.astype("float64")
+    return series.fillna(fill_value)
+
+
+def _auto_fill_values_batch(columns, sketch_error=None):
+    """Worker: calcula os valores de preenchimento de um lote de colunas"""
+    return {name: _auto_fill_value(series, sketch_error) for name, series in columns.items()}
+
+
+def _convert_columns_batch(columns, type_engine=None):
+    """Worker: converte um lote de colunas texto com o motor de inferência"""
+    engine = type_engine or default_type_engine()
+    return {name: engine.convert(series) for name, series in columns.items()}
 
 
 class DataTransformer:
@@ -14,24 +79,32 @@ class DataTransformer:
     Transforma e limpa dados
     """
 
-    def __init__(self):
+    def __init__(self, copy=True, type_engine=None):
+        """
+        Args:
+            copy: Se True, cada método trabalha sobre uma cópia completa do DataFrame.
+                Se False (modo pipeline), usa cópias rasas e só aloca as colunas
+                alteradas; o DataFrame de entrada nunca é modificado, mas o
+                resultado compartilha memória com ele nas colunas intactas.
+            type_engine: TypeInferenceEngine usado em convert_dtypes (padrão: compartilhado)
+        """
+        self.copy = copy
+        self.type_engine = type_engine or default_type_engine()
         self.transformations_log = []
-        logger.info("DataTransformer inicializado")
+        logger.info(f"DataTransformer inicializado (modo {'cópia' if copy else 'pipeline'})")
+
+    def _working_frame(self, df):
+        """Cópia profunda no modo padrão; cópia rasa (só metadados) no modo pipeline"""
+        return df.copy() if self.copy else df.copy(deep=False)
 
     def clean_column_names(self, df):
         """
         Padroniza nomes das colunas
         """
-        df = df.copy()
-
-        def clean_name(name):
-            name = str(name).lower().strip()
-            name = re.sub(r"[^\w\s]", "", name)
-            name = re.sub(r"\s+", "_", name)
-            return name
+        df = self._working_frame(df)
 
         original_columns = df.columns.tolist()
-        df.columns = [clean_name(col) for col in df.columns]
+        df.columns = [clean_column_name(col) for col in df.columns]
 
         self._log_transformation(
             "clean_column_names",
@@ -41,21 +114,30 @@ class DataTransformer:
         logger.debug("Nomes de colunas padronizados")
         return df
 
-    def handle_missing_values(self, df, strategy="auto"):
+    def handle_missing_values(
+        self, df, strategy="auto", executor=None, sketch_error=DEFAULT_SKETCH_ERROR
+    ):
         """
         Trata valores faltantes
 
         Args:
             df: DataFrame
-            strategy: 'auto', 'drop', 'fill_mean', 'fill_median', 'fill_mode'
+            strategy: 'auto', 'drop', 'fill_mean', 'fill_median', 'fill_mode' ou as
+                variantes aproximadas 'approx_median', 'approx_mode', 'approx_auto'
+            executor: Executor para calcular os preenchimentos do modo auto em paralelo
+            sketch_error: Erro máximo de rank/frequência das estratégias aproximadas
         """
-        df = df.copy()
+        df = self._working_frame(df)
         missing_before = df.isnull().sum().sum()
 
         if missing_before == 0:
             logger.info("Nenhum valor faltante encontrado")
             return df
 
+        approximate = strategy in APPROX_STRATEGIES
+        error = sketch_error if approximate else None
+        strategy = APPROX_STRATEGIES.get(strategy, strategy)
+
         if strategy == "drop":
             df = df.dropna()
             logger.info(f"Linhas removidas: {missing_before}")
@@ -67,24 +149,23 @@ class DataTransformer:
 
         elif strategy == "fill_median":
             for col in df.select_dtypes(include=[np.number]).columns:
-                df[col] = df[col].fillna(df[col].median())
+                if df[col].isnull().any():
+                    df[col] = _fill_missing(df[col], _auto_fill_value(df[col], error))
             logger.info("Valores faltantes preenchidos com mediana")
 
         elif strategy == "fill_mode":
             for col in df.columns:
-                if df[col].dtype == "object":
-                    fill_value = df[col].mode()[0] if not df[col].mode().empty else "Unknown"
-                    df[col] = df[col].fillna(fill_value)
+                if df[col].dtype == "object" and df[col].isnull().any():
+                    df[col] = df[col].fillna(_auto_fill_value(df[col], error))
             logger.info("Valores faltantes preenchidos com moda")
 
         elif strategy == "auto":
-            for col in df.columns:
-                if df[col].isnull().sum() > 0:
-                    if df[col].dtype in ["int64", "float64"]:
-                        df[col] = df[col].fillna(df[col].median())
-                    else:
-                        fill_value = df[col].mode()[0] if not df[col].mode().empty else "Unknown"
-                        df[col] = df[col].fillna(fill_value)
+            missing_columns = {col: df[col] for col in df.columns if df[col].isnull().any()}
+            fill_values = run_column_batches(
+                partial(_auto_fill_values_batch, sketch_error=error), missing_columns, executor
+            )
+            for col, fill_value in fill_values.items():
+                df[col] = _fill_missing(df[col], fill_value)
             logger.info("Valores faltantes tratados automaticamente")
 
         missing_after = df.isnull().sum().sum()
@@ -99,9 +180,11 @@ class DataTransformer:
         """
         Remove linhas duplicadas
         """
-        df = df.copy()
+        df = self._working_frame(df)
         before = len(df)
-        df = df.drop_duplicates(subset=subset)
+        duplicated = df.duplicated(subset=subset)
+        if duplicated.any():
+            df = df.loc[~duplicated]
         after = len(df)
 
         removed = before - after
@@ -114,36 +197,49 @@ class DataTransformer:
 
         return df
 
-    def convert_dtypes(self, df):
+    def convert_dtypes(self, df, executor=None):
         """
         Converte tipos de dados automaticamente
+
+        Args:
+            df: DataFrame
+            executor: Executor (ex: ProcessPoolExecutor) para converter lotes de colunas
+                em paralelo; o resultado e o log são iguais aos da execução em série
         """
-        df = df.copy()
+        df = self._working_frame(df)
         conversion_stats = {
             "datetime_converted": [],
             "numeric_converted": [],
             "datetime_failed": [],
             "numeric_failed": [],
+            "date_formats": {},
         }
 
-        for col in df.columns:
-            # Tenta converter para datetime
-            if df[col].dtype == "object":
-                try:
-                    df[col] = pd.to_datetime(df[col], format="mixed")
-                    conversion_stats["datetime_converted"].append(col)
-                    logger.debug(f"Coluna {col} convertida para datetime")
-                    continue
-                except (ValueError, TypeError, OverflowError) as exc:
-                    conversion_stats["datetime_failed"].append({"column": col, "error": str(exc)})
-
-                # Tenta converter para numérico
-                try:
-                    df[col] = pd.to_numeric(df[col])
-                    conversion_stats["numeric_converted"].append(col)
-                    logger.debug(f"Coluna {col} convertida para numérico")
-                except (ValueError, TypeError) as exc:
-                    conversion_stats["numeric_failed"].append({"column": col, "error": str(exc)})
+        # Tipo decidido numa amostra; a coluna inteira é convertida uma única vez
+        object_columns = {col: df[col] for col in df.columns if df[col].dtype == "object"}
+        results = run_column_batches(
+            partial(_convert_columns_batch, type_engine=self.type_engine),
+            object_columns,
+            executor,
+        )
+        for col, result in results.items():
+            if result.datetime_error:
+                conversion_stats["datetime_failed"].append(
+                    {"column": col, "error": result.datetime_error}
+                )
+            if result.kind == "datetime":
+                df[col] = result.values
+                conversion_stats["datetime_converted"].append(col)
+                conversion_stats["date_formats"][col] = result.date_format
+                logger.debug(f"Coluna {col} convertida para datetime ({result.date_format})")
+            elif result.kind == "numeric":
+                df[col] = result.values
+                conversion_stats["numeric_converted"].append(col)
+                logger.debug(f"Coluna {col} convertida para numérico")
+            elif result.numeric_error:
+                conversion_stats["numeric_failed"].append(
+                    {"column": col, "error": result.numeric_error}
+                )
 
         if conversion_stats["datetime_failed"] or conversion_stats["numeric_failed"]:
             logger.info(
@@ -160,27 +256,169 @@ class DataTransformer:
 
         return df
 
-    def create_features(self, df, date_column=None):
+    def optimize_memory(self, df, category_max_ratio=0.5, category_max_unique=1_000):
         """
-        Cria features adicionais
+        Reduz o uso de memória do DataFrame
+
+        Numéricas são reduzidas ao menor dtype que guarda os valores sem perda;
+        textos de baixa cardinalidade viram category.
+
+        Args:
+            df: DataFrame
+            category_max_ratio: Proporção máxima de valores distintos para virar category
+            category_max_unique: Quantidade máxima de valores distintos para virar category
         """
-        df = df.copy()
+        df = self._working_frame(df)
+        memory_before = int(df.memory_usage(deep=True).sum())
+        downcast, categorical = [], []
 
-        if date_column and date_column in df.columns:
-            # Garante que é datetime
-            if not pd.api.types.is_datetime64_any_dtype(df[date_column]):
-                df[date_column] = pd.to_datetime(df[date_column])
+        for col in df.columns:
+            series = df[col]
+            if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                narrowed = downcast_numeric(series)
+                if narrowed.dtype != series.dtype:
+                    df[col] = narrowed
+                    downcast.append(col)
+            elif pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+                non_null = int(series.notna().sum())
+                n_unique = series.nunique(dropna=True)
+                if (
+                    non_null
+                    and n_unique <= category_max_unique
+                    and n_unique <= non_null * category_max_ratio
+                ):
+                    df[col] = series.astype("category")
+                    categorical.append(col)
+
+        memory_after = int(df.memory_usage(deep=True).sum())
+        logger.info(
+            f"Memória otimizada: {memory_before / 1024**2:.2f} MB -> "
+            f"{memory_after / 1024**2:.2f} MB"
+        )
+        self._log_transformation(
+            "optimize_memory",
+            {
+                "memory_before": memory_before,
+                "memory_after": memory_after,
+                "downcast": downcast,
+                "categorical": categorical,
+            },
+        )
 
-            # Cria features de data
-            df[f"{date_column}_year"] = df[date_column].dt.year
-            df[f"{date_column}_month"] = df[date_column].dt.month
-            df[f"{date_column}_day"] = df[date_column].dt.day
-            df[f"{date_column}_dayofweek"] = df[date_column].dt.dayofweek
-            df[f"{date_column}_quarter"] = df[date_column].dt.quarter
+        return df
+
+    def rename_columns(self, df, mapping):
+        """
+        Renomeia colunas; nomes ausentes no DataFrame são ignorados
 
-            logger.info(f"Features de data criadas a partir de {date_column}")
+        Args:
+            df: DataFrame
+            mapping: Dicionário nome_atual: novo_nome
+        """
+        df = self._working_frame(df)
+        df.columns = [mapping.get(col, col) for col in df.columns]
+        self._log_transformation("rename_columns", {"mapping": dict(mapping)})
+        return df
+
+    def cast_columns(self, df, dtypes):
+        """
+        Converte colunas para dtypes explícitos
+
+        Args:
+            df: DataFrame
+            dtypes: Dicionário coluna: dtype
+        """
+        df = self._working_frame(df)
+        dtypes = {col: dtype for col, dtype in dtypes.items() if col in df.columns}
+        for col, dtype in dtypes.items():
+            df[col] = df[col].astype(dtype)
+        self._log_transformation(
+            "cast_columns", {"dtypes": {col: str(dtype) for col, dtype in dtypes.items()}}
+        )
+        return df
+
+    def fill_columns(self, df, values):
+        """
+        Preenche valores faltantes com um valor fixo por coluna
+
+        Args:
+            df: DataFrame
+            values: Dicionário coluna: valor de preenchimento
+        """
+        df = self._working_frame(df)
+        values = {col: value for col, value in values.items() if col in df.columns}
+        filled = 0
+        for col, value in values.items():
+            missing = int(df[col].isnull().sum())
+            if missing:
+                df[col] = df[col].fillna(value)
+                filled += missing
+        self._log_transformation("fill_columns", {"values": values, "filled": filled})
+        return df
+
+    def drop_columns(self, df, columns):
+        """
+        Remove colunas; nomes ausentes no DataFrame são ignorados
+
+        Args:
+            df: DataFrame
+            columns: Lista de colunas a remover
+        """
+        df = self._working_frame(df)
+        for col in columns:
+            if col in df.columns:
+                del df[col]
+        self._log_transformation("drop_columns", {"columns": list(columns)})
+        return df
+
+    def create_features(
+        self,
+        df,
+        date_column=None,
+        date_columns=None,
+        features=DEFAULT_DATE_FEATURES,
+        fiscal_year_start=1,
+        holidays=None,
+    ):
+        """
+        Cria features de calendário para colunas de data
+
+        Todas as partes são extraídas numa única passada vetorizada sobre os
+        valores int64 de cada coluna, em dtypes compactos (int8/int16/bool).
+
+        Args:
+            df: DataFrame
+            date_column: Coluna de data única (compatibilidade)
+            date_columns: Lista de colunas de data; padrão: todas as colunas datetime
+            features: Features a gerar (ver src.data.date_features.DATE_FEATURES)
+            fiscal_year_start: Mês de início do ano fiscal (1 = ano civil)
+            holidays: Datas de feriados; padrão: tabela local config/holidays.csv
+        """
+        df = self._working_frame(df)
+
+        if date_column is not None:
+            date_columns = [date_column]
+        if date_columns is not None:
+            date_columns = [col for col in date_columns if col in df.columns]
+            for col in date_columns:
+                # Garante que é datetime; o formato é detectado numa amostra
+                if not pd.api.types.is_datetime64_any_dtype(df[col]):
+                    result = self.type_engine.convert(df[col])
+                    df[col] = (
+                        result.values if result.kind == "datetime" else pd.to_datetime(df[col])
+                    )
+
+        df, new_columns = add_date_features(
+            df,
+            date_columns=date_columns,
+            features=features,
+            fiscal_year_start=fiscal_year_start,
+            holidays=holidays,
+        )
+        if new_columns:
+            logger.info(f"{len(new_columns)} features de data criadas")
 
-        self._log_transformation("create_features", {"new_columns": list(df.columns)})
+        self._log_transformation("create_features", {"new_columns": new_columns})
 
         return df
 
@@ -0,0 +1,180 @@
+"""Sample-based type inference for text columns, cached by sample fingerprint."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from src.data.dtype_planner import COMMON_DATE_FORMATS, detect_date_format
+from src.utils.fingerprint import frame_fingerprint
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INFERENCE_SAMPLE = 500
+DEFAULT_INFERENCE_CACHE_SIZE = 1_024
+MIXED_DATE_FORMAT = "mixed"
+
+
+@dataclass(frozen=True)
+class ColumnInference:
+    """Type decided for a column from its sample: ``datetime``, ``numeric`` or ``text``."""
+
+    kind: str
+    date_format: str | None = None
+    datetime_error: str | None = None
+    numeric_error: str | None = None
+
+
+@dataclass
+class ConversionResult:
+    values: pd.Series
+    kind: str
+    date_format: str | None = None
+    datetime_error: str | None = None
+    numeric_error: str | None = None
+
+
+class TypeInferenceEngine:
+    """Decide a column's type on a small sample, then convert the full column once.
+
+    Any sampled value that fails a candidate type rejects it for the whole
+    column, so rejections are exact. Acceptance is confirmed by the single
+    full conversion; if a value outside the sample breaks the detected date
+    format, the column falls back to pandas' mixed-format parser.
+    Inference only depends on the sample, so results are cached by its
+    fingerprint and repeated uploads of the same export skip the tests.
+    """
+
+    def __init__(
+        self,
+        sample_size: int = DEFAULT_INFERENCE_SAMPLE,
+        date_formats: tuple[str, ...] = COMMON_DATE_FORMATS,
+        cache_size: int = DEFAULT_INFERENCE_CACHE_SIZE,
+    ):
+        self.sample_size = sample_size
+        self.date_formats = date_formats
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, ColumnInference] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self) -> dict:
+        # Locks do not pickle; process-pool workers get their own.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def sample_positions(self, length: int) -> np.ndarray | None:
+        """Positions sampled from ``length`` non-null values; None when all are kept."""
+        if length <= self.sample_size:
+            return None
+        head = self.sample_size // 2
+        spread = np.linspace(head, length - 1, self.sample_size - head).astype(np.int64)
+        return np.concatenate([np.arange(head), spread])
+
+    def sample(self, series: pd.Series) -> pd.Series:
+        """Deterministic sample of non-null values: the head plus evenly spaced rows."""
+        values = series.dropna()
+        positions = self.sample_positions(len(values))
+        if positions is None:
+            return values.reset_index(drop=True)
+        return values.iloc[positions].reset_index(drop=True)
+
+    def infer(self, series: pd.Series) -> ColumnInference:
+        sample = self.sample(series).rename(None)
+        if sample.empty:
+            return ColumnInference("text")
+
+        key = frame_fingerprint(sample)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        inference = self._infer_sample(sample)
+        with self._lock:
+            self._cache[key] = inference
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return inference
+
+    def _infer_sample(self, sample: pd.Series) -> ColumnInference:
+        datetime_error = None
+        if pd.to_numeric(sample, errors="coerce").notna().all():
+            datetime_error = "amostra numérica; conversão para datetime ignorada"
+        else:
+            date_format = detect_date_format(sample, self.date_formats)
+            if date_format:
+                return ColumnInference("datetime", date_format=date_format)
+            try:
+                pd.to_datetime(sample, format=MIXED_DATE_FORMAT)
+                return ColumnInference("datetime", date_format=MIXED_DATE_FORMAT)
+            except (ValueError, TypeError, OverflowError) as exc:
+                datetime_error = str(exc)
+
+        try:
+            pd.to_numeric(sample)
+            return ColumnInference("numeric", datetime_error=datetime_error)
+        except (ValueError, TypeError) as exc:
+            return ColumnInference("text", datetime_error=datetime_error, numeric_error=str(exc))
+
+    def convert(self, series: pd.Series) -> ConversionResult:
+        """Convert a column with its inferred type in one full pass."""
+        inference = self.infer(series)
+        datetime_error = inference.datetime_error
+        kind = inference.kind
+
+        if kind == "datetime":
+            formats = [inference.date_format]
+            if inference.date_format != MIXED_DATE_FORMAT:
+                formats.append(MIXED_DATE_FORMAT)
+            for date_format in formats:
+                try:
+                    values = pd.to_datetime(series, format=date_format)
+                    return ConversionResult(values, "datetime", date_format=date_format)
+                except (ValueError, TypeError, OverflowError) as exc:
+                    datetime_error = str(exc)
+            logger.debug(f"Coluna {series.name} rejeitou datetime fora da amostra")
+            kind = "numeric"
+
+        if kind == "numeric":
+            try:
+                values = pd.to_numeric(series)
+                return ConversionResult(values, "numeric", datetime_error=datetime_error)
+            except (ValueError, TypeError) as exc:
+                return ConversionResult(
+                    series, "text", datetime_error=datetime_error, numeric_error=str(exc)
+                )
+
+        return ConversionResult(
+            series,
+            "text",
+            datetime_error=datetime_error,
+            numeric_error=inference.numeric_error,
+        )
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+@lru_cache(maxsize=1)
+def default_type_engine() -> TypeInferenceEngine:
+    """Process-wide engine so the inference cache survives across transformers."""
+    return TypeInferenceEngine()
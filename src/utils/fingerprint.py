@@ -0,0 +1,71 @@
+"""Stable fingerprints for source files and in-memory frames used as cache keys."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    path: str
+    size: int
+    mtime_ns: int
+    content_hash: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def hash_file(path: str | Path, block_size: int = HASH_BLOCK_SIZE) -> str:
+    """Return the BLAKE2b digest of a file, read in fixed-size blocks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with Path(path).open("rb") as handle:
+        for block in iter(lambda: handle.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def compute_file_fingerprint(path: str | Path, content_hash: bool = False) -> FileFingerprint:
+    """Identify a file by resolved path, size, mtime and optionally its content hash."""
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    return FileFingerprint(
+        path=str(resolved),
+        size=int(stat.st_size),
+        mtime_ns=int(stat.st_mtime_ns),
+        content_hash=hash_file(resolved) if content_hash else None,
+    )
+
+
+def stable_key(*parts: Any) -> str:
+    """Hash arbitrary JSON-like parts into a short, order-sensitive key."""
+    payload = json.dumps(parts, sort_keys=True, default=repr, ensure_ascii=False)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def frame_fingerprint(obj: pd.Series | pd.DataFrame, include_index: bool = False) -> str:
+    """Content hash of a Series/DataFrame: values, dtypes and labels, vectorized."""
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(obj, pd.Series):
+        labels: Any = [str(obj.name), str(obj.dtype)]
+    else:
+        labels = [[str(column), str(dtype)] for column, dtype in obj.dtypes.items()]
+    digest.update(json.dumps(labels, ensure_ascii=False).encode("utf-8"))
+    digest.update(str(len(obj)).encode("ascii"))
+    if len(obj) and (isinstance(obj, pd.Series) or obj.shape[1]):
+        try:
+            hashed = pd.util.hash_pandas_object(obj, index=include_index, categorize=False)
+        except TypeError:  # unhashable cells (lists, dicts) are hashed by their repr
+            hashed = pd.util.hash_pandas_object(
+                obj.astype(str), index=include_index, categorize=False
+            )
+        digest.update(hashed.to_numpy().tobytes())
+    return digest.hexdigest()
@@ -0,0 +1,39 @@
+"""Column-batch fan-out shared by the transformer, the profiler and the privacy scan."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Mapping
+from concurrent.futures import Executor
+from typing import Any
+
+import pandas as pd
+
+# Colunas enviadas por tarefa no modo paralelo
+COLUMN_BATCH_SIZE = 16
+
+
+def run_column_batches(
+    func: Callable[[dict[Hashable, pd.Series]], dict[Hashable, Any]],
+    columns: Mapping[Hashable, pd.Series],
+    executor: Executor | None = None,
+    batch_size: int = COLUMN_BATCH_SIZE,
+) -> dict[Hashable, Any]:
+    """Run ``func`` over batches of columns, serially or on ``executor``.
+
+    ``func`` maps ``{key: Series}`` to ``{key: result}`` and must be picklable
+    for process pools (a module-level function or a ``functools.partial`` of
+    one). Results come back in the original column order whatever order the
+    batches finish in, so parallel and serial runs are identical.
+    """
+    if executor is None or len(columns) <= 1:
+        return func(dict(columns))
+
+    keys = list(columns)
+    futures = [
+        executor.submit(func, {key: columns[key] for key in keys[start : start + batch_size]})
+        for start in range(0, len(keys), batch_size)
+    ]
+    merged: dict[Hashable, Any] = {}
+    for future in futures:
+        merged.update(future.result())
+    return {key: merged[key] for key in keys}
@@ -0,0 +1,570 @@
+"""Small mergeable sketches for streaming statistics."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import math
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_QUANTILE_K = 1_024
+DEFAULT_FREQUENT_CAPACITY = 256
+DEFAULT_SKETCH_ERROR = 0.01
+DEFAULT_SKETCH_CONFIDENCE = 0.99
+DEFAULT_HLL_PRECISION = 12
+DEFAULT_HLL_EXACT_LIMIT = 4_096
+
+
+def sample_size_for_error(
+    epsilon: float = DEFAULT_SKETCH_ERROR, confidence: float = DEFAULT_SKETCH_CONFIDENCE
+) -> int:
+    """Uniform sample size whose empirical CDF is within ``epsilon`` of the true one.
+
+    Dvoretzky-Kiefer-Wolfowitz: ``P(sup |F_m - F| > eps) <= 2 exp(-2 m eps^2)``.
+    The bound does not depend on the column length, so large columns are
+    summarized in constant time and memory.
+    """
+    if not 0 < epsilon < 1 or not 0 < confidence < 1:
+        raise ValueError("epsilon e confidence devem estar entre 0 e 1")
+    return math.ceil(math.log(2 / (1 - confidence)) / (2 * epsilon**2))
+
+
+def _sample_present(values: np.ndarray, missing: np.ndarray, size: int, seed: int) -> np.ndarray:
+    """Uniform sample (with replacement) of ``size`` non-missing values, or all of them."""
+    present = values.size - int(missing.sum())
+    if present <= size:
+        return values[~missing]
+    rng = np.random.default_rng(seed)
+    draws = math.ceil(size * values.size / present * 1.1) + 16
+    positions = rng.integers(0, values.size, draws)
+    positions = positions[~missing[positions]][:size]
+    while positions.size < size:  # pragma: no cover - only on very unlucky draws
+        extra = rng.integers(0, values.size, draws)
+        positions = np.concatenate([positions, extra[~missing[extra]]])[:size]
+    return values[positions]
+
+
+def approximate_quantile(
+    values: Any,
+    q: float,
+    epsilon: float = DEFAULT_SKETCH_ERROR,
+    confidence: float = DEFAULT_SKETCH_CONFIDENCE,
+    seed: int = 0,
+) -> float | None:
+    """Quantile with rank error at most ``epsilon`` (with the given confidence).
+
+    Exact when the non-null values fit in the sample.
+    """
+    array = np.asarray(values, dtype=np.float64).ravel()
+    sample = _sample_present(
+        array, np.isnan(array), sample_size_for_error(epsilon, confidence), seed
+    )
+    if not sample.size:
+        return None
+    return float(np.quantile(sample, q))
+
+
+def approximate_median(values: Any, **options: Any) -> float | None:
+    return approximate_quantile(values, 0.5, **options)
+
+
+def approximate_mode(
+    series: pd.Series,
+    epsilon: float = DEFAULT_SKETCH_ERROR,
+    confidence: float = DEFAULT_SKETCH_CONFIDENCE,
+    seed: int = 0,
+) -> Any:
+    """Most frequent value of a uniform sample: its true frequency is within
+    ``2 * epsilon`` of the top frequency (with the given confidence).
+
+    Ties resolve to the smallest value, as ``Series.mode()`` does.
+    """
+    series = pd.Series(series)
+    sample = _sample_present(
+        series.to_numpy(),
+        series.isna().to_numpy(),
+        sample_size_for_error(epsilon, confidence),
+        seed,
+    )
+    if not sample.size:
+        return None
+    counts = pd.Series(sample).value_counts(sort=False)
+    top = counts[counts == counts.max()].index
+    try:
+        return sorted(top)[0]
+    except TypeError:  # values of incomparable types
+        return top[0]
+
+
+def _encode_array(array: np.ndarray) -> dict[str, str]:
+    return {"dtype": array.dtype.str, "data": base64.b64encode(array.tobytes()).decode("ascii")}
+
+
+def _decode_array(payload: dict[str, str]) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(payload["data"]), dtype=payload["dtype"]).copy()
+
+
+class MomentAccumulator:
+    """Mergeable count, mean, central moments (M2..M4), min and max.
+
+    Batches are reduced with a two-pass computation and combined with the
+    pairwise update of Chan et al. / Pébay, so merging chunk accumulators
+    gives the same moments as one pass over all values (up to rounding).
+    Skewness and kurtosis use the bias corrections of ``Series.skew`` and
+    ``Series.kurtosis``.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    @classmethod
+    def from_values(cls, values: Any) -> MomentAccumulator:
+        accumulator = cls()
+        accumulator.update(values)
+        return accumulator
+
+    def update(self, values: Any) -> None:
+        array = np.asarray(values, dtype=np.float64).ravel()
+        array = array[~np.isnan(array)]
+        if not array.size:
+            return
+        batch = MomentAccumulator()
+        batch.count = int(array.size)
+        batch.mean = float(array.mean())
+        centered = array - batch.mean
+        squared = centered * centered
+        batch.m2 = float(squared.sum())
+        batch.m3 = float((squared * centered).sum())
+        batch.m4 = float((squared * squared).sum())
+        batch.min, batch.max = float(array.min()), float(array.max())
+        self.merge(batch)
+
+    def merge(self, other: MomentAccumulator) -> MomentAccumulator:
+        if not other.count:
+            return self
+        if not self.count:
+            self.__dict__.update(other.__dict__)
+            return self
+        na, nb = self.count, other.count
+        n = na + nb
+        delta = other.mean - self.mean
+        m2 = self.m2 + other.m2 + delta**2 * na * nb / n
+        m3 = (
+            self.m3
+            + other.m3
+            + delta**3 * na * nb * (na - nb) / n**2
+            + 3 * delta * (na * other.m2 - nb * self.m2) / n
+        )
+        m4 = (
+            self.m4
+            + other.m4
+            + delta**4 * na * nb * (na * na - na * nb + nb * nb) / n**3
+            + 6 * delta**2 * (na * na * other.m2 + nb * nb * self.m2) / n**2
+            + 4 * delta * (na * other.m3 - nb * self.m3) / n
+        )
+        self.count, self.mean = n, self.mean + delta * nb / n
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def _constant(self) -> bool:
+        # Round-off below this scale is treated as a constant column (as pandas does).
+        return self.m2 <= 1e-14 * max(1.0, self.mean * self.mean) * self.count
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+
+    @property
+    def skewness(self) -> float:
+        n = self.count
+        if n < 3:
+            return np.nan
+        if self._constant():
+            return 0.0
+        return n * (n - 1) ** 0.5 / (n - 2) * (self.m3 / self.m2**1.5)
+
+    @property
+    def kurtosis(self) -> float:
+        n = self.count
+        if n < 4:
+            return np.nan
+        if self._constant():
+            return 0.0
+        numerator = n * (n + 1) * (n - 1) * self.m4
+        denominator = (n - 2) * (n - 3) * self.m2 * self.m2
+        return numerator / denominator - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+
+    def to_dict(self) -> dict[str, Any]:
+        return dict(self.__dict__)
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> MomentAccumulator:
+        accumulator = cls()
+        accumulator.__dict__.update(payload)
+        return accumulator
+
+
+# XORed into the hashes of non-integral numbers so they never meet an integer's bits.
+_FLOAT_HASH_TAG = np.uint64(0x9E3779B97F4A7C15)
+_NAN_BITS = np.array([np.nan]).view(np.uint64)[0]
+
+
+def _key_salt(hash_key: str | None) -> np.uint64:
+    if hash_key is None:
+        return np.uint64(0)
+    digest = hashlib.blake2b(hash_key.encode("utf-8"), digest_size=8).digest()
+    return np.uint64(int.from_bytes(digest, "little"))
+
+
+def _hash_numbers(values: pd.Series, salt: np.uint64) -> np.ndarray:
+    """Lossless value hashes: integers by their int64 bits, other floats by theirs.
+
+    Integral floats take the integer path, so ``3``, ``3.0`` and ``Int64(3)``
+    agree while distinct int64 values (even above 2**53) never collide.
+    """
+    missing = values.isna().to_numpy()
+    if pd.api.types.is_integer_dtype(values.dtype):
+        unsigned = pd.api.types.is_unsigned_integer_dtype(values.dtype)
+        bits = values.to_numpy(dtype=np.uint64 if unsigned else np.int64, na_value=0)
+        bits = bits.view(np.uint64)
+        integral = ~missing
+    else:
+        floats = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        with np.errstate(invalid="ignore"):
+            integral = (np.floor(floats) == floats) & (np.abs(floats) < 2.0**63)
+        bits = floats.view(np.uint64).copy()
+        bits[integral] = floats[integral].astype(np.int64).view(np.uint64)
+    bits[missing] = _NAN_BITS
+    hashes = pd.util.hash_array(bits ^ salt)
+    hashes[~integral] ^= _FLOAT_HASH_TAG
+    return hashes
+
+
+def hash_values(
+    values: pd.Series, distinct: bool = False, hash_key: str | None = None
+) -> np.ndarray:
+    """64-bit hash per value (nulls included); numbers hash by value, so
+    chunks read as int64, float64 or Int64 agree, and integers hash
+    losslessly. Pass ``distinct=True`` when the values are already unique to
+    skip the factorize pandas runs before hashing objects (the hashes are the
+    same), and a 16-character ``hash_key`` for an independent second hash."""
+    values = pd.Series(values)
+    if pd.api.types.is_integer_dtype(values.dtype) or pd.api.types.is_float_dtype(values.dtype):
+        return _hash_numbers(values, _key_salt(hash_key))
+    options = {} if hash_key is None else {"hash_key": hash_key}
+    return pd.util.hash_pandas_object(
+        values, index=False, categorize=not distinct, **options
+    ).to_numpy()
+
+
+def _sorted_unique(values: np.ndarray) -> np.ndarray:
+    # Sort-based: much faster than np.unique's hash path on random 64-bit hashes.
+    values = np.sort(values)
+    if values.size < 2:
+        return values
+    return values[np.concatenate(([True], values[1:] != values[:-1]))]
+
+
+# Bit lengths of 2**0 .. 2**63, for a vectorized leading-zero count.
+_POWERS_OF_TWO = np.left_shift(np.uint64(1), np.arange(64, dtype=np.uint64))
+
+
+class HyperLogLog:
+    """HyperLogLog distinct counter over 64-bit hashes (relative error ~1.04/sqrt(2**p)).
+
+    Keeps the exact set of hashes while it has at most ``exact_limit``
+    entries, so small cardinalities are counted exactly. Registers merge by
+    element-wise maximum, so chunk counters combine into the counter of the
+    union.
+    """
+
+    def __init__(
+        self, precision: int = DEFAULT_HLL_PRECISION, exact_limit: int = DEFAULT_HLL_EXACT_LIMIT
+    ):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision do HyperLogLog deve estar entre 4 e 18")
+        self.precision = precision
+        self.exact_limit = exact_limit
+        self.registers = np.zeros(2**precision, dtype=np.uint8)
+        self.exact: np.ndarray | None = np.empty(0, dtype=np.uint64)
+
+    def update(self, values: pd.Series) -> None:
+        self.update_hashes(hash_values(pd.Series(values).dropna()))
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        if not hashes.size:
+            return
+        hashes = hashes.astype(np.uint64, copy=False)
+        width = 64 - self.precision
+        index = (hashes >> np.uint64(width)).astype(np.intp)
+        rest = hashes & np.uint64((1 << width) - 1)
+        rank = (width + 1 - np.searchsorted(_POWERS_OF_TWO, rest, side="right")).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+        if self.exact is not None:
+            self._keep_exact(_sorted_unique(np.concatenate([self.exact, hashes])))
+
+    def _keep_exact(self, hashes: np.ndarray | None) -> None:
+        self.exact = hashes if hashes is not None and hashes.size <= self.exact_limit else None
+
+    def merge(self, other: HyperLogLog) -> HyperLogLog:
+        if other.precision != self.precision:
+            raise ValueError("HyperLogLogs com precisões diferentes não podem ser combinados")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        if self.exact is not None and other.exact is not None:
+            self._keep_exact(_sorted_unique(np.concatenate([self.exact, other.exact])))
+        else:
+            self.exact = None
+        return self
+
+    @property
+    def is_exact(self) -> bool:
+        return self.exact is not None
+
+    def count(self) -> int:
+        if self.exact is not None:
+            return int(self.exact.size)
+        m = self.registers.size
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / float(np.sum(np.ldexp(1.0, -self.registers.astype(np.int64))))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)  # linear counting for small ranges
+        return int(round(estimate))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "precision": self.precision,
+            "exact_limit": self.exact_limit,
+            "registers": _encode_array(self.registers),
+            "exact": None if self.exact is None else _encode_array(self.exact),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> HyperLogLog:
+        sketch = cls(payload["precision"], payload["exact_limit"])
+        sketch.registers = _decode_array(payload["registers"])
+        sketch.exact = None if payload["exact"] is None else _decode_array(payload["exact"])
+        return sketch
+
+
+class QuantileSketch:
+    """KLL-style quantile sketch: compacted levels of sorted samples.
+
+    Every level holds at most ``k`` values; a full level is sorted and every
+    other value (random offset) is promoted to the next level with twice the
+    weight. Results are exact (interpolated like pandas) until more than ``k``
+    values have been seen. Sketches built on separate chunks merge into the
+    same summary. :attr:`rank_error` is a guaranteed bound on the normalized
+    rank error accumulated by the compactions so far.
+    """
+
+    def __init__(self, k: int = DEFAULT_QUANTILE_K, seed: int = 0):
+        self.k = k
+        self.count = 0
+        self.min: float | None = None
+        self.max: float | None = None
+        self.levels: list[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+        self._error = 0
+
+    @classmethod
+    def for_error(cls, epsilon: float = DEFAULT_SKETCH_ERROR, seed: int = 0) -> QuantileSketch:
+        """Sketch sized for a target normalized rank error (typical, not worst case)."""
+        return cls(k=max(64, math.ceil(4 / epsilon)), seed=seed)
+
+    @property
+    def rank_error(self) -> float:
+        return self._error / self.count if self.count else 0.0
+
+    def update(self, values: Any) -> None:
+        array = np.asarray(values, dtype=np.float64).ravel()
+        array = array[~np.isnan(array)]
+        if not array.size:
+            return
+        self.count += int(array.size)
+        low, high = float(array.min()), float(array.max())
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+        if array.size > 2 * self.k:
+            # Large batch: sort once and keep every 2**level-th value directly,
+            # which is what repeated compaction of this batch would keep.
+            array = np.sort(array)
+            level = int(math.log2(array.size / self.k))
+            step = 2**level
+            self._add(level, array[int(self._rng.integers(step)) :: step])
+            self._error += step
+        else:
+            self.levels[0] = np.concatenate([self.levels[0], array])
+        self._compress()
+
+    def _add(self, level: int, values: np.ndarray) -> None:
+        while len(self.levels) <= level:
+            self.levels.append(np.empty(0))
+        self.levels[level] = np.concatenate([self.levels[level], values])
+
+    def merge(self, other: QuantileSketch) -> QuantileSketch:
+        for index, values in enumerate(other.levels):
+            self._add(index, values)
+        self.count += other.count
+        self._error += other._error
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        self._compress()
+        return self
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            values = self.levels[level]
+            if values.size > self.k:
+                values = np.sort(values)
+                carry = values[-1:] if values.size % 2 else values[:0]
+                pairs = values[: values.size - carry.size]
+                promoted = pairs[int(self._rng.integers(2)) :: 2]
+                self.levels[level] = carry
+                self._add(level + 1, promoted)
+                self._error += 2**level
+            level += 1
+
+    def quantile(self, q: float) -> float | None:
+        if not self.count:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        if self.is_exact:
+            return float(np.quantile(self.levels[0], q))
+        values = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [
+                np.full(level.size, 2**index, dtype=np.float64)
+                for index, level in enumerate(self.levels)
+            ]
+        )
+        order = np.argsort(values, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        position = int(np.searchsorted(cumulative, q * cumulative[-1]))
+        return float(values[order][min(position, len(order) - 1)])
+
+    def median(self) -> float | None:
+        return self.quantile(0.5)
+
+    @property
+    def is_exact(self) -> bool:
+        return len(self.levels) == 1
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "k": self.k,
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "error": self._error,
+            "levels": [_encode_array(level) for level in self.levels],
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> QuantileSketch:
+        sketch = cls(k=payload["k"])
+        sketch.count, sketch._error = payload["count"], payload["error"]
+        sketch.min, sketch.max = payload["min"], payload["max"]
+        sketch.levels = [_decode_array(level) for level in payload["levels"]]
+        return sketch
+
+
+class FrequentItemsSketch:
+    """Misra-Gries frequent-items summary with vectorized batch updates.
+
+    Keeps at most ``capacity`` counters (the Space-Saving summary up to an
+    offset). Each stored count is a lower bound; the true count is at most
+    ``count + error``, where ``error`` never exceeds ``total / (capacity + 1)``.
+    """
+
+    @classmethod
+    def for_error(cls, epsilon: float = DEFAULT_SKETCH_ERROR) -> FrequentItemsSketch:
+        """Sketch whose count error stays below ``epsilon * total``."""
+        return cls(capacity=math.ceil(1 / epsilon))
+
+    def __init__(self, capacity: int = DEFAULT_FREQUENT_CAPACITY):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=np.int64)
+        self.error = 0
+        self.total = 0
+
+    def update(self, values: pd.Series) -> None:
+        self.update_counts(pd.Series(values).value_counts(dropna=True))
+
+    def update_counts(self, counts: pd.Series) -> None:
+        counts = counts[counts > 0]
+        if isinstance(counts.index, pd.CategoricalIndex):
+            counts.index = counts.index.astype(object)
+        if counts.empty:
+            return
+        self.total += int(counts.sum())
+        # Reducing the batch first keeps the combined summary small; the two
+        # subtracted thresholds still bound the error (mergeable summaries).
+        counts = self._reduce(counts.astype(np.int64))
+        if self.counts.empty:
+            combined = counts
+        else:
+            combined = pd.concat([self.counts, counts]).groupby(level=0, sort=False).sum()
+        self.counts = self._reduce(combined).astype(np.int64)
+
+    def _reduce(self, counts: pd.Series) -> pd.Series:
+        """Subtract the (capacity + 1)-th largest count and drop what reaches zero."""
+        if len(counts) <= self.capacity:
+            return counts
+        values = counts.to_numpy()
+        threshold = int(np.partition(values, values.size - self.capacity - 1)[-self.capacity - 1])
+        self.error += threshold
+        kept = values > threshold
+        return pd.Series(values[kept] - threshold, index=counts.index[kept], dtype=np.int64)
+
+    def merge(self, other: FrequentItemsSketch) -> FrequentItemsSketch:
+        total = self.total + other.total
+        prior_error = self.error + other.error
+        self.error = 0
+        self.update_counts(other.counts)
+        self.error += prior_error
+        self.total = total
+        return self
+
+    def top(self, n: int = 10) -> pd.Series:
+        return self.counts.nlargest(n)
+
+    def mode(self) -> Any:
+        if self.counts.empty:
+            return None
+        return self.counts.idxmax()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "values": self.counts.index.tolist(),
+            "counts": self.counts.tolist(),
+            "error": self.error,
+            "total": self.total,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> FrequentItemsSketch:
+        sketch = cls(payload["capacity"])
+        sketch.counts = pd.Series(
+            payload["counts"], index=pd.Index(payload["values"], dtype=object), dtype=np.int64
+        )
+        sketch.error = payload["error"]
+        sketch.total = payload["total"]
+        return sketch
@@ -0,0 +1,92 @@
+import bz2
+import gzip
+import io
+import json
+import lzma
+import zipfile
+
+import pandas as pd
+import pytest
+
+from src.data.compression import dataset_name, detect_compression, open_decompressed
+from src.data.file_extractor import FileExtractor
+
+CSV_BYTES = b"id,segmento\n1,A\n2,B\n3,A\n"
+
+
+def test_detect_compression_by_suffix_and_magic_bytes(tmp_path):
+    gz_path = tmp_path / "vendas.csv.gz"
+    gz_path.write_bytes(gzip.compress(CSV_BYTES))
+    disguised = tmp_path / "export_sem_extensao"
+    disguised.write_bytes(bz2.compress(CSV_BYTES))
+
+    assert detect_compression(gz_path) == "gzip"
+    assert detect_compression(disguised) == "bz2"
+    assert detect_compression(io.BytesIO(CSV_BYTES), name="vendas.csv") is None
+    assert dataset_name("raw/vendas.csv.gz") == "vendas"
+
+
+def test_excel_workbooks_are_not_taken_for_zip_archives(tmp_path):
+    workbook = tmp_path / "vendas.xlsx"
+    pd.DataFrame({"id": [1, 2]}).to_excel(workbook, index=False)
+    bundle = tmp_path / "vendas_sem_extensao"
+    bundle.write_bytes(workbook.read_bytes())
+
+    assert detect_compression(workbook) is None
+    assert detect_compression(io.BytesIO(workbook.read_bytes()), name="vendas.xlsx") is None
+    assert detect_compression(bundle) == "zip"
+
+
+@pytest.mark.parametrize(
+    ("suffix", "compress"),
+    [(".gz", gzip.compress), (".bz2", bz2.compress), (".xz", lzma.compress)],
+)
+def test_find_and_extract_compressed_csv(tmp_path, suffix, compress):
+    (tmp_path / f"vendas.csv{suffix}").write_bytes(compress(CSV_BYTES))
+
+    extractor = FileExtractor(data_dir=tmp_path)
+    all_csv = extractor.extract_all_csv()
+    planned = extractor.extract_csv(f"vendas.csv{suffix}", optimize_dtypes=True)
+
+    assert extractor.find_files("*.csv") == [str(tmp_path / f"vendas.csv{suffix}")]
+    assert all_csv["vendas"].shape == (3, 2)
+    assert planned["id"].tolist() == [1, 2, 3]
+
+
+def test_extract_zstd_csv_and_jsonl(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    compressor = zstandard.ZstdCompressor()
+    (tmp_path / "vendas.csv.zst").write_bytes(compressor.compress(CSV_BYTES))
+    events = "\n".join(json.dumps({"id": i}) for i in range(3)).encode("utf-8")
+    (tmp_path / "eventos.jsonl.zst").write_bytes(compressor.compress(events))
+
+    extractor = FileExtractor(data_dir=tmp_path)
+
+    assert extractor.extract_csv("vendas.csv.zst").shape == (3, 2)
+    assert extractor.extract_jsonl("eventos.jsonl.zst")["id"].tolist() == [0, 1, 2]
+
+
+def test_multi_member_zip_is_exploded_into_datasets(tmp_path):
+    with zipfile.ZipFile(tmp_path / "lote.zip", "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+        bundle.writestr("norte.csv", CSV_BYTES)
+        bundle.writestr("dados/sul.csv", CSV_BYTES)
+        bundle.writestr("LEIAME.txt", b"ignorar")
+
+    extractor = FileExtractor(data_dir=tmp_path)
+    datasets = extractor.extract_all_csv()
+
+    assert sorted(datasets) == ["lote/norte", "lote/sul"]
+    assert extractor.extract_csv("lote.zip").empty
+    with pytest.raises(ValueError):
+        with open_decompressed(tmp_path / "lote.zip"):
+            pass
+
+
+def test_single_file_zip_is_ingested_once(tmp_path):
+    with zipfile.ZipFile(tmp_path / "vendas.csv.zip", "w") as bundle:
+        bundle.writestr("vendas.csv", CSV_BYTES)
+
+    datasets = FileExtractor(data_dir=tmp_path).extract_all_csv()
+
+    assert list(datasets) == ["vendas"]
+    assert datasets["vendas"].shape == (3, 2)
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard.utils.analytics import summarize_correlation_pairs
+from src.analysis.correlation import (
+    CorrelationCache,
+    compute_correlations,
+    correlation_matrix,
+)
+from src.analysis.exploratory import ExploratoryAnalyzer
+
+
+@pytest.fixture
+def medidas():
+    rng = np.random.default_rng(12)
+    rows = 2_000
+    base = rng.normal(size=(rows, 4))
+    values = base @ rng.normal(size=(4, 30)) + rng.normal(size=(rows, 30)) + 1e4
+    df = pd.DataFrame(values, columns=[f"m{i}" for i in range(30)])
+    df["constante"] = 3.0
+    df["estoque"] = pd.array(rng.integers(0, 50, rows), dtype="Int64")
+    return df
+
+
+def test_blocked_pearson_matches_pandas_with_pairwise_nulls(medidas):
+    with_nulls = medidas.mask(np.random.default_rng(1).random(medidas.shape) < 0.15)
+
+    for frame in (medidas, with_nulls):
+        expected = frame.astype(float).corr()
+        result = correlation_matrix(frame, block_size=7)
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-9)
+    assert correlation_matrix(with_nulls)["constante"].isna().all()
+
+    sparse = pd.DataFrame({"a": [1, 2, None, 4], "b": [1, None, 3, 4.0], "c": [1, 1, 1, 2]})
+    pd.testing.assert_frame_equal(
+        correlation_matrix(sparse, min_periods=3), sparse.corr(min_periods=3)
+    )
+
+
+def test_spearman_matches_pandas_without_nulls(medidas):
+    frame = medidas.iloc[:300, :8]
+
+    np.testing.assert_allclose(
+        correlation_matrix(frame, method="spearman").to_numpy(),
+        frame.corr(method="spearman").to_numpy(),
+        atol=1e-12,
+    )
+    with pytest.raises(ValueError):
+        correlation_matrix(frame, method="kendall")
+
+
+def test_pair_views_come_from_the_upper_triangle(medidas):
+    result = compute_correlations(medidas, cache=CorrelationCache())
+    matrix = medidas.astype(float).corr()
+    upper = matrix.where(np.triu(np.ones(matrix.shape, dtype=bool), k=1)).stack()
+    expected = upper.abs().sort_values(ascending=False)
+
+    top = result.top_pairs(5)
+    strong = result.strong_pairs(0.7)
+
+    assert list(zip(top["left"], top["right"], strict=True)) == list(expected.index[:5])
+    assert len(strong) == int((upper.abs() > 0.7).sum())
+    assert strong == sorted(
+        strong, key=lambda pair: (matrix.index.get_loc(pair[0]), matrix.columns.get_loc(pair[1]))
+    )
+
+
+def test_results_are_cached_by_content_and_shared_by_consumers(medidas):
+    cache = CorrelationCache()
+    first = compute_correlations(medidas, cache=cache)
+    again = compute_correlations(medidas.copy(), cache=cache)
+    changed = compute_correlations(medidas.assign(m0=medidas["m0"] * -1), cache=cache)
+
+    assert again is first and changed is not first
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    pairs = summarize_correlation_pairs(medidas, top_n=3, correlations=first)
+    analysis = ExploratoryAnalyzer().analyze_dataframe(medidas, correlations=first)
+    assert list(pairs.columns) == ["left", "right", "correlation", "strength"]
+    assert pairs["correlation"].abs().is_monotonic_decreasing
+    assert any(insight.startswith("🔗") for insight in analysis["insights"])
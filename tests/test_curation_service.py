@@ -1,6 +1,8 @@
+import numpy as np
 import pandas as pd
 
 from src.app.curation_service import curate_dataset
+from src.data.transform_plan import PlanCache
 
 
 def test_curate_dataset_returns_curated_artifacts():
@@ -26,6 +28,8 @@ def test_curate_dataset_returns_curated_artifacts():
     assert len(artifacts.priority_actions) >= 1
     assert "categoria" in artifacts.masked_curated_df.columns
     assert "risk_level" in artifacts.privacy_snapshot
+    assert artifacts.profile.describes(artifacts.curated_df)
+    assert artifacts.profile.duplicate_count == 0
 
 
 def test_curate_dataset_exposes_backward_compatible_snapshot_alias():
@@ -42,3 +46,88 @@ def test_curate_dataset_exposes_backward_compatible_snapshot_alias():
     artifacts = curate_dataset(raw_df)
 
     assert artifacts.executive_snapshot == artifacts.business_snapshot
+
+
+def test_curate_dataset_avoids_copying_the_raw_frame_unless_asked():
+    raw_df = pd.DataFrame({"Categoria": ["A", "B"], "Valor Total": [100.0, 250.0]})
+
+    shared = curate_dataset(raw_df)
+    isolated = curate_dataset(raw_df, keep_original_copy=True)
+
+    assert shared.raw_df is raw_df
+    assert isolated.raw_df is not raw_df
+    pd.testing.assert_frame_equal(isolated.raw_df, raw_df)
+
+
+def test_curate_dataset_can_optimize_memory():
+    raw_df = pd.DataFrame(
+        {
+            "Categoria": ["A", "B", "A", "A"],
+            "Regiao": ["Sul", "Norte", "Sul", "Sul"],
+            "Valor Total": [100.0, 250.0, 180.0, 40.0],
+            "Quantidade": [1, 2, 3, 4],
+        }
+    )
+
+    artifacts = curate_dataset(raw_df, optimize_memory=True)
+
+    assert isinstance(artifacts.curated_df["categoria"].dtype, pd.CategoricalDtype)
+    assert artifacts.transform_log[-1]["operation"] == "optimize_memory"
+    assert artifacts.business_snapshot["top_category"] == "A"
+    assert artifacts.business_snapshot["revenue"] == 570.0
+
+
+def test_curate_dataset_reuses_cached_steps_on_rerun():
+    raw_df = pd.DataFrame({"Categoria": ["A", None, "A"], "Valor Total": [1.0, 2.0, 1.0]})
+    cache = PlanCache()
+
+    first = curate_dataset(raw_df, plan_cache=cache)
+    misses = cache.misses
+    second = curate_dataset(raw_df, plan_cache=cache, optimize_memory=True)
+
+    assert cache.misses == misses + 1
+    assert first.transform_log == second.transform_log[:-1]
+    assert second.transform_log[-1]["operation"] == "optimize_memory"
+
+
+def test_curate_dataset_adds_date_features_by_default():
+    raw_df = pd.DataFrame({"Data Venda": ["2025-01-01", "2025-04-02"], "Valor": [1.0, 2.0]})
+
+    featured = curate_dataset(raw_df).curated_df
+    plain = curate_dataset(raw_df, date_features=False).curated_df
+
+    assert featured["data_venda_quarter"].tolist() == [1, 2]
+    assert featured["data_venda_year"].dtype == "int16"
+    assert "data_venda_quarter" not in plain.columns
+
+
+def test_curated_frames_are_never_the_cached_objects():
+    raw_df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    cache = PlanCache()
+
+    first = curate_dataset(raw_df, plan_cache=cache)
+    second = curate_dataset(raw_df, plan_cache=cache)
+    first.curated_df.loc[0, "a"] = 999
+    third = curate_dataset(raw_df.copy(), plan_cache=cache)
+
+    assert first.curated_df is not second.curated_df
+    assert second.curated_df.loc[0, "a"] == 1
+    assert third.curated_df.loc[0, "a"] == 1
+
+
+def test_generated_date_features_stay_out_of_correlations_and_insights():
+    rng = np.random.default_rng(5)
+    raw_df = pd.DataFrame(
+        {
+            "d": pd.date_range("2023-01-01", periods=400, freq="D").astype(str),
+            "valor": rng.normal(100, 10, 400),
+        }
+    )
+
+    artifacts = curate_dataset(raw_df)
+
+    assert "d_quarter" in artifacts.profile.numeric_columns
+    assert list(artifacts.correlations.matrix.columns) == ["valor"]
+    assert not any("Correlações fortes" in item for item in artifacts.analysis["insights"])
+    with_only_dates = curate_dataset(raw_df[["d"]])
+    assert with_only_dates.correlations.matrix.empty
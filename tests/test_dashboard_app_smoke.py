@@ -1,3 +1,7 @@
+import gzip
+from io import BytesIO
+
+import pandas as pd
 from streamlit.testing.v1 import AppTest
 
 
@@ -11,3 +15,14 @@ def test_dashboard_pages_render_without_exceptions():
         app.run()
         assert len(app.exception) == 0
         assert len(app.error) == 0
+
+
+def test_excel_uploads_are_read_as_workbooks():
+    from dashboard.app import dataframe_to_excel_bytes, read_uploaded_table
+
+    df = pd.DataFrame({"regiao": ["Sul", "Norte"], "valor": [10.5, 20.0]})
+    workbook = dataframe_to_excel_bytes(df)
+
+    pd.testing.assert_frame_equal(read_uploaded_table(BytesIO(workbook), "vendas.xlsx"), df)
+    compressed = BytesIO(gzip.compress(workbook))
+    pd.testing.assert_frame_equal(read_uploaded_table(compressed, "vendas.xlsx"), df)
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from src.data.transformer import DataTransformer
@@ -26,3 +27,131 @@ def test_handle_missing_values_auto_fills_numeric_and_categorical():
     assert filled["valor"].isna().sum() == 0
     assert filled["segmento"].isna().sum() == 0
     assert filled.loc[1, "segmento"] == "A"
+
+
+def test_auto_fill_handles_nullable_integers_with_a_fractional_median():
+    transformer = DataTransformer()
+    raw = pd.DataFrame({"itens": pd.array([1, 2, None], dtype="Int64")})
+
+    auto = transformer.handle_missing_values(raw, strategy="auto")
+    median = transformer.handle_missing_values(raw, strategy="fill_median")
+
+    assert auto["itens"].tolist() == median["itens"].tolist() == [1.0, 2.0, 1.5]
+    assert auto["itens"].dtype == "float64"
+
+
+def test_pipeline_mode_leaves_input_intact_and_shares_untouched_columns():
+    transformer = DataTransformer(copy=False)
+    raw = pd.DataFrame(
+        {
+            "Valor": [10.0, None, 30.0],
+            "Quantidade": [1, 2, 3],
+            "Data": ["2025-01-01", "2025-01-02", "2025-01-03"],
+        }
+    )
+    snapshot = raw.copy()
+
+    result = transformer.clean_column_names(raw)
+    result = transformer.convert_dtypes(result)
+    result = transformer.handle_missing_values(result, strategy="auto")
+    result = transformer.remove_duplicates(result)
+
+    pd.testing.assert_frame_equal(raw, snapshot)
+    assert result["valor"].isna().sum() == 0
+    assert pd.api.types.is_datetime64_any_dtype(result["data"])
+    assert np.shares_memory(result["quantidade"].to_numpy(), raw["Quantidade"].to_numpy())
+
+
+def test_copy_mode_returns_independent_frames():
+    transformer = DataTransformer()
+    raw = pd.DataFrame({"Quantidade": [1, 2, 3]})
+
+    result = transformer.clean_column_names(raw)
+
+    assert not np.shares_memory(result["quantidade"].to_numpy(), raw["Quantidade"].to_numpy())
+
+
+def _wide_frame(n_columns=40, rows=200):
+    rng = np.random.default_rng(0)
+    data = {}
+    for index in range(n_columns):
+        kind = index % 4
+        if kind == 0:
+            values = rng.normal(size=rows).round(2).astype(str).astype(object)
+        elif kind == 1:
+            values = pd.date_range("2026-01-01", periods=rows).strftime("%d/%m/%Y").to_numpy()
+        elif kind == 2:
+            values = rng.choice(["Sul", "Norte", "Leste"], size=rows).astype(object)
+        else:
+            values = rng.integers(0, 100, size=rows).astype(float)
+        values = pd.Series(values)
+        values.iloc[index % rows] = None
+        data[f"col_{index}"] = values
+    return pd.DataFrame(data)
+
+
+def test_parallel_column_execution_matches_serial_results_and_log():
+    from concurrent.futures import ProcessPoolExecutor
+
+    raw = _wide_frame()
+    serial = DataTransformer(copy=False)
+    parallel = DataTransformer(copy=False)
+
+    expected = serial.handle_missing_values(serial.convert_dtypes(raw), strategy="auto")
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        result = parallel.convert_dtypes(raw, executor=executor)
+        result = parallel.handle_missing_values(result, strategy="auto", executor=executor)
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert str(parallel.get_transformation_log()) == str(serial.get_transformation_log())
+
+
+def test_optimize_memory_downcasts_and_categorizes_low_cardinality_text():
+    transformer = DataTransformer(copy=False)
+    rows = 1_000
+    raw = pd.DataFrame(
+        {
+            "regiao": np.resize(["Sul", "Norte", "Leste", "Oeste"], rows).astype(object),
+            "cliente": [f"cliente_{index}" for index in range(rows)],
+            "quantidade": np.resize([1, 2, 3], rows).astype("int64"),
+            "desconto": np.resize([0.0, 5.0, 10.0], rows),
+            "valor": np.linspace(0.1, 999.9, rows),
+        }
+    )
+
+    optimized = transformer.optimize_memory(raw)
+    details = transformer.get_transformation_log()[-1]["details"]
+
+    assert isinstance(optimized["regiao"].dtype, pd.CategoricalDtype)
+    assert optimized["cliente"].dtype == object
+    assert optimized["quantidade"].dtype == np.int8
+    assert optimized["desconto"].dtype == np.float32
+    assert optimized["valor"].dtype == np.float64
+    assert details["memory_after"] < details["memory_before"]
+    assert details["categorical"] == ["regiao"]
+    pd.testing.assert_frame_equal(optimized.astype(raw.dtypes), raw)
+
+
+def test_approximate_fill_strategies_are_close_to_the_exact_ones():
+    rng = np.random.default_rng(4)
+    rows = 200_000
+    df = pd.DataFrame(
+        {
+            "valor": rng.normal(50, 10, rows),
+            "canal": rng.choice(["loja", "site", "app"], rows, p=[0.6, 0.3, 0.1]).astype(object),
+        }
+    )
+    df.loc[::5, "valor"] = np.nan
+    df.loc[::9, "canal"] = None
+    transformer = DataTransformer()
+
+    approx = transformer.handle_missing_values(df, strategy="approx_auto", sketch_error=0.01)
+    exact = transformer.handle_missing_values(df, strategy="auto")
+    median_only = transformer.handle_missing_values(df, strategy="approx_median")
+    mode_only = transformer.handle_missing_values(df, strategy="approx_mode")
+
+    assert approx.isnull().sum().sum() == 0
+    assert abs(approx.loc[0, "valor"] - exact.loc[0, "valor"]) < 0.5
+    assert approx.loc[0, "canal"] == exact.loc[0, "canal"] == "loja"
+    assert median_only["canal"].isnull().any() and not median_only["valor"].isnull().any()
+    assert mode_only["valor"].isnull().any() and not mode_only["canal"].isnull().any()
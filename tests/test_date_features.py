@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.date_features import DATE_FEATURES, add_date_features, date_feature_frame
+from src.data.transformer import DataTransformer
+
+
+@pytest.fixture
+def datas():
+    rng = np.random.default_rng(5)
+    offsets = pd.to_timedelta(rng.integers(0, 60_000, 5_000), unit="D")
+    values = pd.Series(pd.Timestamp("1901-01-01") + offsets, name="data")
+    values.iloc[[3, 40]] = pd.NaT
+    return values
+
+
+def test_calendar_parts_match_the_dt_accessor(datas):
+    features = date_feature_frame(datas, features=DATE_FEATURES[:-1])
+    present = datas.notna()
+    expected = {
+        "year": datas.dt.year,
+        "month": datas.dt.month,
+        "day": datas.dt.day,
+        "dayofweek": datas.dt.dayofweek,
+        "quarter": datas.dt.quarter,
+        "dayofyear": datas.dt.dayofyear,
+        "isoweek": datas.dt.isocalendar().week,
+        "is_month_start": datas.dt.is_month_start,
+        "is_month_end": datas.dt.is_month_end,
+    }
+
+    for name, values in expected.items():
+        got = features[f"data_{name}"][present].astype(int).to_numpy()
+        assert (got == values[present].astype(int).to_numpy()).all(), name
+    assert features.loc[3].isna().all()
+
+
+def test_features_use_compact_dtypes():
+    dates = pd.Series(pd.to_datetime(["2025-12-31", "2026-01-01"]), name="d")
+
+    features = date_feature_frame(dates, features=("year", "month", "is_month_end"))
+
+    assert features.dtypes.to_dict() == {
+        "d_year": np.dtype("int16"),
+        "d_month": np.dtype("int8"),
+        "d_is_month_end": np.dtype("bool"),
+    }
+    assert features["d_is_month_end"].tolist() == [True, False]
+
+
+def test_fiscal_period_and_holidays():
+    dates = pd.Series(pd.to_datetime(["2025-03-31", "2025-04-01", "2025-12-25"]), name="d")
+
+    features = date_feature_frame(
+        dates,
+        features=("fiscal_year", "fiscal_quarter", "is_holiday"),
+        fiscal_year_start=4,
+    )
+    custom = date_feature_frame(dates, features=("is_holiday",), holidays=["2025-04-01"])
+
+    assert features["d_fiscal_year"].tolist() == [2025, 2026, 2026]
+    assert features["d_fiscal_quarter"].tolist() == [4, 1, 3]
+    assert features["d_is_holiday"].tolist() == [False, False, True]
+    assert custom["d_is_holiday"].tolist() == [False, True, False]
+    with pytest.raises(ValueError):
+        date_feature_frame(dates, features=("weekofmonth",))
+
+
+def test_add_date_features_covers_every_datetime_column_without_copying():
+    df = pd.DataFrame(
+        {
+            "pedido": pd.to_datetime(["2025-01-06", "2025-02-10"]),
+            "entrega": pd.to_datetime(["2025-01-09", "2025-02-14"]),
+            "valor": [10.0, 20.0],
+        }
+    )
+
+    featured, new_columns = add_date_features(df)
+
+    assert len(new_columns) == 10
+    assert featured["entrega_dayofweek"].tolist() == [3, 4]
+    assert np.shares_memory(featured["valor"].to_numpy(), df["valor"].to_numpy())
+    assert list(df.columns) == ["pedido", "entrega", "valor"]
+
+
+def test_transformer_parses_text_date_columns_and_logs_new_columns():
+    transformer = DataTransformer()
+    df = pd.DataFrame({"data_ref": ["25/01/2026", "26/01/2026"], "valor": [1, 2]})
+
+    featured = transformer.create_features(df, date_column="data_ref", features=("day",))
+
+    assert featured["data_ref_day"].tolist() == [25, 26]
+    assert transformer.get_transformation_log()[-1]["details"]["new_columns"] == ["data_ref_day"]
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard.utils.analytics import build_data_quality_summary
+from src.data.dedup import ChunkedDeduplicator, count_duplicates, row_hashes
+
+
+@pytest.fixture
+def pedidos():
+    rng = np.random.default_rng(7)
+    return pd.DataFrame(
+        {
+            "pedido": rng.integers(0, 300, 2_000),
+            "loja": rng.choice(["A", "B"], 2_000),
+            "valor": rng.integers(0, 5, 2_000).astype(float),
+        }
+    )
+
+
+def _chunks(df, size=250):
+    return (df.iloc[start : start + size] for start in range(0, len(df), size))
+
+
+def test_row_hashes_support_64_and_128_bits(pedidos):
+    assert row_hashes(pedidos).shape == (len(pedidos),)
+    assert row_hashes(pedidos, bits=128).shape == (len(pedidos), 2)
+    with pytest.raises(ValueError):
+        row_hashes(pedidos, bits=32)
+
+
+def test_count_duplicates_matches_pandas(pedidos):
+    assert count_duplicates(pedidos) == int(pedidos.duplicated().sum())
+    assert count_duplicates(pedidos, subset=["pedido"], bits=128) == int(
+        pedidos.duplicated(subset=["pedido"]).sum()
+    )
+
+
+def test_chunked_deduplicator_removes_duplicates_across_chunks(pedidos, tmp_path):
+    with ChunkedDeduplicator(n_partitions=8, spill_dir=tmp_path) as deduplicator:
+        report = deduplicator.scan(_chunks(pedidos))
+        result = pd.concat(deduplicator.iter_unique(_chunks(pedidos)))
+
+    pd.testing.assert_frame_equal(result, pedidos.drop_duplicates())
+    assert report.duplicate_count == int(pedidos.duplicated().sum())
+    assert report.unique_rows == len(result)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_deduplicate_runs_both_passes_from_a_chunk_source(pedidos):
+    deduplicator = ChunkedDeduplicator(subset=["pedido", "loja"], bits=128)
+
+    result = pd.concat(deduplicator.deduplicate(lambda: _chunks(pedidos, size=333)))
+
+    pd.testing.assert_frame_equal(result, pedidos.drop_duplicates(subset=["pedido", "loja"]))
+    assert deduplicator.report.duplicate_pct > 0
+
+
+@pytest.mark.parametrize("bits", [64, 128])
+def test_rows_match_across_chunks_read_with_different_numeric_dtypes(bits):
+    inteiros = pd.DataFrame({"pedido": [1, 2, 3], "valor": [10, 20, 30]})
+    decimais = pd.DataFrame({"pedido": [3.0, 4.0], "valor": [30.0, 40.0]})
+    anulaveis = pd.DataFrame({"pedido": pd.array([1, 5], "Int64"), "valor": [10.0, 50.0]})
+    chunks = [inteiros, decimais, anulaveis]
+
+    with ChunkedDeduplicator(bits=bits, n_partitions=4) as deduplicator:
+        report = deduplicator.scan(chunks)
+        result = pd.concat(deduplicator.iter_unique(chunks))
+
+    assert report.duplicate_count == 2
+    assert result["valor"].tolist() == [10, 20, 30, 40, 50]
+
+
+def test_large_integer_ids_are_hashed_without_precision_loss():
+    ids = [2**53, 2**53 + 1, 1234567890123456789, 1234567890123456788]
+    eventos = pd.DataFrame({"event_id": ids, "tipo": ["a"] * 4})
+    chunks = [eventos.iloc[:2], eventos.iloc[2:]]
+
+    with ChunkedDeduplicator(n_partitions=4) as deduplicator:
+        report = deduplicator.scan(chunks)
+        result = pd.concat(deduplicator.iter_unique(chunks))
+
+    assert count_duplicates(eventos) == int(eventos.duplicated().sum()) == 0
+    assert report.duplicate_count == 0
+    assert result["event_id"].tolist() == ids
+
+
+def test_quality_summary_reuses_a_known_duplicate_count(pedidos, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("duplicated() should not run")
+
+    monkeypatch.setattr(pd.DataFrame, "duplicated", fail)
+    summary = build_data_quality_summary(pedidos, duplicate_count=12)
+
+    assert summary["duplicate_count"] == 12
@@ -0,0 +1,73 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+from src.app.curation_service import curate_dataset
+from src.data.dtype_planner import (
+    downcast_numeric,
+    infer_dtype_plan,
+    read_csv_with_dtype_plan,
+)
+from src.data.file_extractor import FileExtractor
+
+
+def _sales_frame(rows=600):
+    rng = np.random.default_rng(7)
+    return pd.DataFrame(
+        {
+            "pedido": np.arange(rows),
+            "regiao": rng.choice(["Norte", "Sul", "Leste"], size=rows),
+            "valor": np.round(rng.uniform(10, 500, size=rows), 2),
+            "desconto": rng.choice([0.0, 0.5, np.nan], size=rows),
+            "data": pd.date_range("2026-01-01", periods=rows, freq="h").strftime(
+                "%d/%m/%Y %H:%M:%S"
+            ),
+            "obs": [f"nota {i}" for i in range(rows)],
+        }
+    )
+
+
+def test_infer_dtype_plan_picks_compact_targets(tmp_path):
+    csv_path = tmp_path / "vendas.csv"
+    _sales_frame().to_csv(csv_path, index=False)
+
+    plan = infer_dtype_plan(csv_path, sample_rows=100, n_offsets=3)
+
+    assert plan.numeric == ["pedido", "valor", "desconto"]
+    assert plan.categorical == ["regiao"]
+    assert plan.date_formats == {"data": "%d/%m/%Y %H:%M:%S"}
+    assert plan.sampled_rows > 100
+
+
+def test_read_csv_with_dtype_plan_matches_values_with_less_memory(tmp_path):
+    csv_path = tmp_path / "vendas.csv"
+    _sales_frame().to_csv(csv_path, index=False)
+    baseline = pd.read_csv(csv_path)
+
+    extractor = FileExtractor(data_dir=tmp_path)
+    planned = extractor.extract_csv("vendas.csv", optimize_dtypes=True, chunksize=128)
+
+    assert planned["pedido"].dtype == np.int16
+    assert isinstance(planned["regiao"].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_datetime64_any_dtype(planned["data"])
+    assert planned["regiao"].astype(str).tolist() == baseline["regiao"].tolist()
+    np.testing.assert_array_equal(planned["pedido"].to_numpy(), baseline["pedido"].to_numpy())
+    assert planned.memory_usage(deep=True).sum() < baseline.memory_usage(deep=True).sum() / 2
+
+
+def test_downcast_numeric_only_narrows_losslessly():
+    assert downcast_numeric(pd.Series([1, 2, 300])).dtype == np.int16
+    assert downcast_numeric(pd.Series([0.5, np.nan])).dtype == np.float32
+    assert downcast_numeric(pd.Series([0.1, 0.2])).dtype == np.float64
+
+
+def test_planned_upload_buffer_curates_like_default_read():
+    buffer = io.BytesIO(_sales_frame(50).to_csv(index=False).encode("utf-8"))
+
+    planned = read_csv_with_dtype_plan(buffer, encoding="utf-8")
+    artifacts = curate_dataset(planned)
+
+    assert buffer.tell() == 0
+    assert artifacts.curated_df["desconto"].isna().sum() == 0
+    assert artifacts.privacy_snapshot["risk_level"]
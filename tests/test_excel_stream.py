@@ -0,0 +1,88 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from src.data import excel_stream
+from src.data.file_extractor import FileExtractor
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "financeiro.xlsx"
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        pd.DataFrame({"id": range(7), "valor": [float(i) * 1.5 for i in range(7)]}).to_excel(
+            writer, sheet_name="receitas", index=False
+        )
+        pd.DataFrame({"conta": ["a", "b"], "saldo": [10, 20]}).to_excel(
+            writer, sheet_name="contas", index=False
+        )
+    return path
+
+
+@pytest.mark.parametrize("use_calamine", [False, True])
+def test_iter_excel_chunks_streams_rows(workbook, monkeypatch, use_calamine):
+    if use_calamine and not excel_stream.CALAMINE_AVAILABLE:
+        pytest.skip("python-calamine not installed")
+    monkeypatch.setattr(excel_stream, "CALAMINE_AVAILABLE", use_calamine)
+
+    extractor = FileExtractor(data_dir=workbook.parent)
+    chunks = list(
+        extractor.iter_excel_chunks("financeiro.xlsx", sheet_name="receitas", chunksize=3)
+    )
+
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    combined = pd.concat(chunks, ignore_index=True)
+    assert combined.columns.tolist() == ["id", "valor"]
+    assert combined["valor"].sum() == pytest.approx(31.5)
+
+
+def test_extract_excel_sheets_loads_every_sheet_in_order(workbook):
+    extractor = FileExtractor(data_dir=workbook.parent)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        sheets = extractor.extract_excel_sheets("financeiro.xlsx", executor=executor)
+
+    assert list(sheets) == ["receitas", "contas"]
+    assert sheets["receitas"].shape == (7, 2)
+    pd.testing.assert_frame_equal(
+        sheets["contas"], pd.read_excel(workbook, sheet_name="contas"), check_dtype=False
+    )
+
+
+def test_extract_excel_sheets_default_process_pool(workbook):
+    sheets = FileExtractor(data_dir=workbook.parent).extract_excel_sheets(
+        "financeiro.xlsx", sheet_names=["contas"], max_workers=1
+    )
+
+    assert sheets["contas"]["saldo"].tolist() == [10, 20]
+
+
+@pytest.mark.parametrize("use_calamine", [False, True])
+def test_streaming_reader_matches_read_excel_on_blank_rows_and_repeated_headers(
+    tmp_path, monkeypatch, use_calamine
+):
+    if use_calamine and not excel_stream.CALAMINE_AVAILABLE:
+        pytest.skip("python-calamine not installed")
+    monkeypatch.setattr(excel_stream, "CALAMINE_AVAILABLE", use_calamine)
+    openpyxl = pytest.importorskip("openpyxl")
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    for row in [
+        ["x", "x", None, "x.1", "y"],
+        [1, 2, 3, 4, "a"],
+        [None] * 5,
+        [5, 6, 7, 8, "b"],
+        [None] * 5,
+        [None] * 5,
+    ]:
+        sheet.append(row)
+    path = tmp_path / "lancamentos.xlsx"
+    workbook.save(path)
+
+    chunks = list(excel_stream.iter_excel_chunks(path, chunksize=2))
+
+    expected = pd.read_excel(path)
+    assert expected.columns.tolist() == ["x", "x.2", "Unnamed: 2", "x.1", "y"]
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    pd.testing.assert_frame_equal(excel_stream.read_excel_streaming(path), expected)
@@ -1,6 +1,10 @@
+import codecs
+
 import pandas as pd
+import pytest
 
-from src.data.file_extractor import FileExtractor
+from src.data import file_extractor
+from src.data.file_extractor import FileExtractor, sniff_encoding
 
 
 def test_extract_csv_reads_file(tmp_path):
@@ -20,3 +24,130 @@ def test_extract_csv_returns_empty_for_invalid_path(tmp_path):
 
     assert isinstance(df, pd.DataFrame)
     assert df.empty
+
+
+def test_sniff_encoding_handles_bom_utf8_and_legacy_bytes():
+    text = "região,preço\nSão Paulo,10\n"
+
+    assert sniff_encoding(codecs.BOM_UTF8 + text.encode("utf-8")) == "utf-8-sig"
+    assert sniff_encoding(text.encode("utf-8")) == "utf-8"
+    assert sniff_encoding(text.encode("utf-8")[:4]) == "utf-8"
+    assert sniff_encoding(text.encode("latin-1"), complete=True) == "latin-1"
+    assert sniff_encoding("“aspas” – travessão".encode("cp1252"), complete=True) == "cp1252"
+
+
+def test_extract_csv_parses_latin1_file_once(tmp_path, monkeypatch):
+    csv_path = tmp_path / "clientes.csv"
+    csv_path.write_bytes("cidade,valor\nSão Paulo,10\nJundiaí,20\n".encode("latin-1"))
+    calls = []
+    original_read_csv = pd.read_csv
+
+    def counting_read_csv(*args, **kwargs):
+        calls.append(kwargs.get("encoding"))
+        return original_read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_csv", counting_read_csv)
+    df = FileExtractor(data_dir=tmp_path).extract_csv("clientes.csv")
+
+    assert calls == ["latin-1"]
+    assert df["cidade"].tolist() == ["São Paulo", "Jundiaí"]
+
+
+def test_extract_csv_falls_back_when_invalid_bytes_follow_the_prefix(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_extractor, "ENCODING_SNIFF_BYTES", 16)
+    csv_path = tmp_path / "tardio.csv"
+    csv_path.write_bytes(b"cidade,valor\nRio,1\n" + "Goiânia,2\n".encode("latin-1"))
+
+    calls = []
+    original_read_csv = pd.read_csv
+
+    def counting_read_csv(*args, **kwargs):
+        calls.append(kwargs.get("encoding"))
+        return original_read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_csv", counting_read_csv)
+    extractor = FileExtractor(data_dir=tmp_path)
+    df = extractor.extract_csv("tardio.csv")
+
+    assert calls == ["utf-8", "latin-1"]
+    assert df["cidade"].tolist() == ["Rio", "Goiânia"]
+
+
+def _wide_export(path, rows=2_000):
+    data = {f"col_{index}": range(rows) for index in range(30)}
+    data["loja"] = ["A", "B"] * (rows // 2)
+    data["data"] = pd.date_range("2026-08-01", periods=rows, freq="2h").strftime("%Y-%m-%d")
+    pd.DataFrame(data).to_csv(path, index=False)
+
+
+def test_extract_csv_pushes_columns_and_filters_into_the_read(tmp_path, monkeypatch):
+    _wide_export(tmp_path / "export.csv")
+    monkeypatch.setattr(file_extractor, "FILTER_CHUNKSIZE", 100)
+    usecols = []
+    original_read_csv = pd.read_csv
+
+    def recording_read_csv(*args, **kwargs):
+        usecols.append(kwargs.get("usecols"))
+        return original_read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_csv", recording_read_csv)
+    october = (pd.Timestamp("2026-10-01"), pd.Timestamp("2026-10-31"))
+    df = FileExtractor(data_dir=tmp_path).extract_csv(
+        "export.csv",
+        columns=["col_1", "loja"],
+        filters=[("data", "between", october), ("loja", "==", "A")],
+    )
+
+    assert usecols == [["col_1", "loja", "data"]]
+    assert df.columns.tolist() == ["col_1", "loja"]
+    assert set(df["loja"]) == {"A"}
+    assert len(df) == 6 * 31
+    assert df.index.tolist() == list(range(len(df)))
+
+
+def test_extract_csv_with_dtype_plan_applies_filters_per_chunk(tmp_path):
+    _wide_export(tmp_path / "export.csv")
+
+    df = FileExtractor(data_dir=tmp_path).extract_csv(
+        "export.csv",
+        optimize_dtypes=True,
+        columns=["col_2", "data"],
+        filters=[("data", ">=", pd.Timestamp("2026-10-01"))],
+    )
+
+    assert df.columns.tolist() == ["col_2", "data"]
+    assert pd.api.types.is_datetime64_any_dtype(df["data"])
+    assert df["data"].min() == pd.Timestamp("2026-10-01")
+
+
+def test_iter_csv_chunks_yields_only_matching_rows(tmp_path):
+    _wide_export(tmp_path / "export.csv")
+
+    chunks = list(
+        FileExtractor(data_dir=tmp_path).iter_csv_chunks(
+            "export.csv", columns=["col_0"], filters=[("col_0", "<", 250)], chunksize=100
+        )
+    )
+
+    assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+
+
+def test_extract_parquet_uses_arrow_filters(tmp_path):
+    pytest.importorskip("pyarrow")
+    frame = pd.DataFrame(
+        {
+            "data": pd.date_range("2026-01-01", periods=365, freq="D"),
+            "valor": range(365),
+            "extra": ["x"] * 365,
+        }
+    )
+    frame.to_parquet(tmp_path / "vendas.parquet", row_group_size=31)
+
+    df = FileExtractor(data_dir=tmp_path).extract_parquet(
+        "vendas.parquet",
+        columns=["valor"],
+        filters=[("data", "between", ("2026-10-01", "2026-10-31"))],
+    )
+
+    assert df.columns.tolist() == ["valor"]
+    assert df["valor"].tolist() == list(range(273, 304))
@@ -0,0 +1,88 @@
+import os
+
+import pandas as pd
+
+from src.data.file_extractor import FileExtractor
+from src.data.incremental_ingestion import IncrementalIngestor
+from src.data.sqlite_manager import SQLiteManager
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_incremental_run_only_reads_new_or_changed_files(tmp_path):
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    pd.DataFrame({"a": [1]}).to_csv(raw_dir / "d1.csv", index=False)
+    pd.DataFrame({"a": [2]}).to_csv(raw_dir / "d2.csv", index=False)
+
+    ingestor = IncrementalIngestor(
+        FileExtractor(data_dir=raw_dir), manager=SQLiteManager(db_path=tmp_path / "state.db")
+    )
+
+    first = ingestor.run("*.csv")
+    assert sorted(first.dataframes) == ["d1", "d2"]
+
+    second = ingestor.run("*.csv")
+    assert second.dataframes == {}
+    assert second.unchanged == 2
+
+    pd.DataFrame({"a": [3]}).to_csv(raw_dir / "d3.csv", index=False)
+    pd.DataFrame({"a": [20, 21]}).to_csv(raw_dir / "d2.csv", index=False)
+    _bump_mtime(raw_dir / "d2.csv")
+
+    third = ingestor.run("*.csv")
+    assert sorted(third.dataframes) == ["d2", "d3"]
+    assert len(third.dataframes["d2"]) == 2
+
+
+def test_content_hash_skips_touched_but_identical_files(tmp_path):
+    pd.DataFrame({"a": [1]}).to_csv(tmp_path / "d1.csv", index=False)
+    manager = SQLiteManager(db_path=tmp_path / "state.db")
+    ingestor = IncrementalIngestor(
+        FileExtractor(data_dir=tmp_path), manager=manager, content_hash=True
+    )
+
+    ingestor.run("*.csv")
+    _bump_mtime(tmp_path / "d1.csv")
+
+    assert ingestor.pending_files("*.csv") == []
+    assert "ingestion_watermark" not in manager.list_tables()
+
+    ingestor.reset()
+    assert len(ingestor.pending_files("*.csv")) == 1
+
+
+def test_watch_polls_and_extract_all_csv_incremental(tmp_path):
+    pd.DataFrame({"a": [1]}).to_csv(tmp_path / "d1.csv", index=False)
+    manager = SQLiteManager(db_path=tmp_path / "state.db")
+    extractor = FileExtractor(data_dir=tmp_path)
+    batches = []
+
+    iterations = IncrementalIngestor(extractor, manager=manager).watch(
+        batches.append, interval_seconds=0, max_iterations=2
+    )
+
+    assert iterations == 2
+    assert len(batches) == 1
+    assert extractor.extract_all_csv(incremental=True, state_manager=manager) == {}
+
+
+def test_empty_files_are_watermarked_while_unreadable_ones_are_retried(tmp_path):
+    (tmp_path / "vazio.csv").write_bytes(b"")
+    (tmp_path / "cabecalho.csv").write_text("id,valor\n")
+    (tmp_path / "corrompido.csv.gz").write_bytes(b"\x1f\x8bnot really gzip")
+    pd.DataFrame({"a": [1]}).to_csv(tmp_path / "d1.csv", index=False)
+    ingestor = IncrementalIngestor(
+        FileExtractor(data_dir=tmp_path), manager=SQLiteManager(db_path=tmp_path / "state.db")
+    )
+
+    first = ingestor.run("*.csv")
+
+    assert list(first.dataframes) == ["d1"]
+    assert sorted(os.path.basename(path) for path in first.empty) == ["cabecalho.csv", "vazio.csv"]
+    assert [os.path.basename(path) for path in first.failed] == ["corrompido.csv.gz"]
+    pending = [os.path.basename(item.path) for item in ingestor.pending_files("*.csv")]
+    assert pending == ["corrompido.csv.gz"]
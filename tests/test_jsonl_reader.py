@@ -0,0 +1,72 @@
+import json
+
+import pandas as pd
+
+from src.data.file_extractor import FileExtractor
+from src.data.jsonl_reader import infer_jsonl_schema
+
+
+def _write_events(path, records):
+    path.write_text("\n".join(json.dumps(record) for record in records) + "\n", encoding="utf-8")
+
+
+def test_infer_jsonl_schema_uses_explicit_dtypes(tmp_path):
+    path = tmp_path / "eventos.jsonl"
+    _write_events(
+        path,
+        [
+            {"id": 1, "valor": 10.5, "ativo": True, "tipo": "click"},
+            {"id": 2, "valor": 3, "ativo": None, "tipo": "view"},
+        ],
+    )
+
+    schema = infer_jsonl_schema(path)
+
+    assert schema == {"id": "Int64", "valor": "float64", "ativo": "boolean", "tipo": "object"}
+
+
+def test_extract_jsonl_reads_in_chunks_and_keeps_schema(tmp_path):
+    path = tmp_path / "eventos.ndjson"
+    records = [{"id": i, "valor": float(i), "tipo": "view"} for i in range(10)]
+    records[7]["id"] = None
+    _write_events(path, records)
+
+    extractor = FileExtractor(data_dir=tmp_path)
+    chunks = list(extractor.iter_jsonl_chunks("eventos.ndjson", chunksize=4, sample_size=3))
+    df = extractor.extract_jsonl("eventos.ndjson", chunksize=4, sample_size=3)
+
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert all(str(chunk["id"].dtype) == "Int64" for chunk in chunks)
+    assert df.shape == (10, 3)
+    assert df["id"].isna().sum() == 1
+
+
+def test_extract_jsonl_flattens_nested_fields(tmp_path):
+    path = tmp_path / "eventos.jsonl"
+    _write_events(
+        path,
+        [
+            {"id": 1, "cliente": {"uf": "SP", "score": 7}},
+            {"id": 2, "cliente": {"uf": "RJ", "score": 9}, "origem": "app"},
+        ],
+    )
+
+    df = FileExtractor(data_dir=tmp_path).extract_jsonl(
+        "eventos.jsonl", flatten=True, sample_size=1
+    )
+
+    assert df.columns.tolist() == ["id", "cliente.uf", "cliente.score", "origem"]
+    assert str(df["cliente.score"].dtype) == "Int64"
+    assert pd.isna(df.loc[0, "origem"])
+
+
+def test_extract_jsonl_filters_and_projects_each_chunk(tmp_path):
+    path = tmp_path / "eventos.jsonl"
+    _write_events(path, [{"id": i, "tipo": "click" if i % 2 else "view"} for i in range(20)])
+
+    df = FileExtractor(data_dir=tmp_path).extract_jsonl(
+        "eventos.jsonl", chunksize=4, columns=["id"], filters=[("tipo", "==", "click")]
+    )
+
+    assert df.columns.tolist() == ["id"]
+    assert df["id"].tolist() == list(range(1, 20, 2))
@@ -0,0 +1,68 @@
+import os
+
+import pandas as pd
+
+from src.data.file_extractor import FileExtractor
+from src.data.parse_cache import ParsedFileCache
+
+
+def _write_csv(path, rows):
+    pd.DataFrame({"id": list(range(rows)), "segmento": ["A"] * rows}).to_csv(path, index=False)
+
+
+def test_extract_csv_reuses_cached_parse(tmp_path, monkeypatch):
+    _write_csv(tmp_path / "vendas.csv", 3)
+    cache = ParsedFileCache(cache_dir=tmp_path / "cache")
+    extractor = FileExtractor(data_dir=tmp_path, cache=cache)
+
+    first = extractor.extract_csv("vendas.csv")
+
+    def fail_read_csv(*args, **kwargs):
+        raise AssertionError("cached file should not be parsed again")
+
+    monkeypatch.setattr(pd, "read_csv", fail_read_csv)
+    second = extractor.extract_csv("vendas.csv")
+
+    pd.testing.assert_frame_equal(first, second)
+    assert cache.total_bytes() > 0
+
+
+def test_cache_key_tracks_file_changes_and_reader_kwargs(tmp_path):
+    csv_path = tmp_path / "vendas.csv"
+    _write_csv(csv_path, 3)
+    cache = ParsedFileCache(cache_dir=tmp_path / "cache")
+    extractor = FileExtractor(data_dir=tmp_path, cache=cache)
+
+    extractor.extract_csv("vendas.csv")
+    assert cache.get(csv_path, "csv", {"sep": ";"}) is None
+
+    _write_csv(csv_path, 5)
+    stat = csv_path.stat()
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert cache.get(csv_path, "csv", {}) is None
+    assert len(extractor.extract_csv("vendas.csv")) == 5
+
+
+def test_invalidate_and_lru_eviction(tmp_path):
+    cache = ParsedFileCache(cache_dir=tmp_path / "cache")
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.csv"
+        _write_csv(path, 50)
+        cache.put(path, "csv", {}, pd.read_csv(path))
+        paths.append(path)
+
+    entry_size = cache.total_bytes() // 3
+    cache.get(paths[0], "csv", {})
+    cache.max_bytes = entry_size * 2
+    cache.evict()
+
+    assert cache.get(paths[1], "csv", {}) is None
+    assert cache.get(paths[0], "csv", {}) is not None
+
+    extractor = FileExtractor(data_dir=tmp_path, cache=cache)
+    assert extractor.invalidate_cache("a.csv") == 1
+    assert cache.get(paths[0], "csv", {}) is None
+    assert extractor.invalidate_cache() == 1
+    assert cache.total_bytes() == 0
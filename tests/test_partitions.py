@@ -0,0 +1,88 @@
+import pandas as pd
+
+from src.data.file_extractor import FileExtractor
+from src.data.partitions import discover_partitions, parse_partitions
+
+
+def _write_lake(root):
+    for source in ["erp", "crm"]:
+        for year, month in [(2025, 12), (2026, 9), (2026, 10)]:
+            folder = root / f"source={source}" / f"year={year}" / f"month={month:02d}"
+            folder.mkdir(parents=True)
+            pd.DataFrame(
+                {"pedido": range(3), "valor": [10.0, 20.0, 30.0], "canal": ["web", "loja", "web"]}
+            ).to_csv(folder / "part-0.csv", index=False)
+
+
+def test_parse_partitions_reads_key_value_segments():
+    assert parse_partitions("source=erp/year=2026/month=10/part-0.csv") == {
+        "source": "erp",
+        "year": 2026,
+        "month": 10,
+    }
+    assert parse_partitions("plain/dir/file.csv") == {}
+
+
+def test_discovery_prunes_directories_before_listing_files(tmp_path, monkeypatch):
+    _write_lake(tmp_path)
+    listed = []
+    original_walk = __import__("os").walk
+
+    def recording_walk(top, *args, **kwargs):
+        for directory, subdirs, files in original_walk(top, *args, **kwargs):
+            listed.append(directory)
+            yield directory, subdirs, files
+
+    monkeypatch.setattr("src.data.partitions.os.walk", recording_walk)
+    files = discover_partitions(tmp_path, filters=[("year", "==", 2026), ("month", "==", 10)])
+
+    assert len(files) == 2
+    assert not any("year=2025" in directory for directory in listed)
+    assert not any("month=09" in directory for directory in listed)
+
+
+def test_partition_filters_compare_in_the_parsed_value_type(tmp_path):
+    _write_lake(tmp_path)
+
+    by_text = discover_partitions(
+        tmp_path, filters=[("year", "==", "2026"), ("month", "in", ["09"])]
+    )
+    by_number = discover_partitions(tmp_path, filters=[("year", "==", 2026), ("month", "in", [9])])
+
+    assert [item.path for item in by_text] == [item.path for item in by_number]
+    assert len(by_text) == 2
+
+
+def test_partitioned_dataset_reads_one_month_with_virtual_columns(tmp_path):
+    _write_lake(tmp_path)
+    dataset = FileExtractor(data_dir=tmp_path).partitioned_dataset()
+
+    df = dataset.to_frame(
+        columns=["source", "month", "valor"],
+        filters=[("year", "==", 2026), ("month", "==", 10), ("canal", "==", "web")],
+    )
+
+    assert df.columns.tolist() == ["source", "month", "valor"]
+    assert len(df) == 4
+    assert set(df["source"]) == {"erp", "crm"}
+    assert isinstance(df["source"].dtype, pd.CategoricalDtype)
+    assert set(df["month"]) == {10}
+    assert sorted(dataset.partition_keys) == ["month", "source", "year"]
+
+
+def test_partitioned_dataset_iterates_chunk_by_chunk(tmp_path):
+    _write_lake(tmp_path)
+    dataset = FileExtractor(data_dir=tmp_path).partitioned_dataset()
+
+    chunks = list(dataset.iter_chunks(filters=[("source", "==", "erp")], chunksize=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1] * 3
+    assert all(set(chunk["source"]) == {"erp"} for chunk in chunks)
+
+
+def test_find_files_can_search_recursively(tmp_path):
+    _write_lake(tmp_path)
+    extractor = FileExtractor(data_dir=tmp_path)
+
+    assert extractor.find_files("*.csv") == []
+    assert len(extractor.find_files("*.csv", recursive=True)) == 6
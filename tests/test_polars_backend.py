@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from config.settings import Settings
+from src.app.curation_service import curate_dataset
+from src.data import polars_backend
+from src.data.polars_backend import get_transformer, resolve_backend
+from src.data.transformer import DataTransformer
+
+pl = pytest.importorskip("polars")
+
+
+@pytest.fixture
+def vendas():
+    rng = np.random.default_rng(3)
+    rows = 3_000
+    df = pd.DataFrame(
+        {
+            "Data Venda": pd.date_range("2025-01-01", periods=rows, freq="h").strftime("%d/%m/%Y"),
+            "Categoria": rng.choice(["A", "B", None], rows),
+            "Valor Total": rng.integers(1, 100, rows).astype(float),
+            "Quantidade": rng.integers(1, 5, rows).astype(str),
+            "Preco": np.round(rng.random(rows) * 10, 2).astype(str),
+            "Ativo": rng.choice(np.array([True, False, None], dtype=object), rows),
+            "Periodo": rng.choice(["2025-01-01", "01/02/2025"], rows),
+        },
+        index=pd.RangeIndex(100, 100 + rows),
+    )
+    df.loc[df.index[::9], "Valor Total"] = np.nan
+    df.loc[df.index[::11], "Data Venda"] = None
+    return pd.concat([df, df.iloc[:50]])
+
+
+def _pandas_curation(df):
+    transformer = DataTransformer(copy=False)
+    curated = transformer.clean_column_names(df)
+    curated = transformer.convert_dtypes(curated)
+    curated = transformer.handle_missing_values(curated, strategy="auto")
+    return transformer.remove_duplicates(curated), transformer.get_transformation_log()
+
+
+def test_polars_curation_matches_pandas(vendas):
+    expected, expected_log = _pandas_curation(vendas)
+
+    transformer = get_transformer("polars")
+    curated = transformer.curate(vendas)
+
+    pd.testing.assert_frame_equal(curated, expected)
+    log = transformer.get_transformation_log()
+    assert [item["operation"] for item in log] == [item["operation"] for item in expected_log]
+    assert log[1]["details"]["conversion_stats"]["date_formats"] == {
+        "data_venda": "%d/%m/%Y",
+        "periodo": "mixed",
+    }
+    assert log[-1]["details"]["removed"] == expected_log[-1]["details"]["removed"]
+
+
+def test_polars_steps_accept_pandas_and_polars_frames(vendas):
+    transformer = get_transformer("polars")
+
+    from_pandas = transformer.create_features(
+        transformer.convert_dtypes(transformer.clean_column_names(vendas)), "data_venda"
+    )
+    expected = DataTransformer().create_features(
+        DataTransformer().convert_dtypes(DataTransformer().clean_column_names(vendas)),
+        "data_venda",
+    )
+    pd.testing.assert_frame_equal(from_pandas, expected)
+
+    frame = pl.DataFrame({"a": [1, None, 1], "b": ["x", None, "x"]})
+    filled = transformer.handle_missing_values(frame, strategy="auto")
+    assert isinstance(filled, pl.DataFrame)
+    assert transformer.remove_duplicates(filled).height == 1
+
+
+def test_curate_dataset_backend_is_selectable_per_call_and_by_settings(vendas, monkeypatch):
+    pandas_artifacts = curate_dataset(vendas)
+    polars_artifacts = curate_dataset(vendas, backend="polars")
+    pd.testing.assert_frame_equal(polars_artifacts.curated_df, pandas_artifacts.curated_df)
+    assert polars_artifacts.quality_summary == pandas_artifacts.quality_summary
+
+    monkeypatch.setattr(Settings, "TRANSFORM_BACKEND", "polars")
+    assert resolve_backend() == "polars"
+    assert resolve_backend("pandas") == "pandas"
+
+
+def test_polars_curation_falls_back_for_mixed_object_columns():
+    df = pd.DataFrame({"Codigo": [1, "x", 1], "Valor": [1.0, None, 1.0]})
+
+    curated = get_transformer("polars").curate(df)
+
+    pd.testing.assert_frame_equal(curated, _pandas_curation(df)[0])
+
+
+def test_resolve_backend_validates_and_falls_back_without_polars(monkeypatch):
+    with pytest.raises(ValueError):
+        resolve_backend("spark")
+
+    monkeypatch.setattr(polars_backend, "POLARS_AVAILABLE", False)
+    assert resolve_backend("polars") == "pandas"
+    assert type(get_transformer("polars")) is DataTransformer
@@ -0,0 +1,80 @@
+import datetime as dt
+
+import pandas as pd
+import pytest
+
+from src.data.predicates import (
+    apply_filters,
+    iter_filtered,
+    normalize_filters,
+    read_columns,
+    to_arrow_filters,
+)
+
+
+@pytest.fixture
+def vendas():
+    return pd.DataFrame(
+        {
+            "loja": ["A", "B", "A", None],
+            "valor": [10.0, 25.0, 40.0, 5.0],
+            "data": ["2026-09-30", "2026-10-01", "2026-10-31", "2026-11-01"],
+        }
+    )
+
+
+def test_normalize_filters_rejects_unknown_operators_and_bad_ranges():
+    assert normalize_filters([("a", "=", 1)]) == [("a", "==", 1)]
+    with pytest.raises(ValueError):
+        normalize_filters([("a", "like", "x")])
+    with pytest.raises(ValueError):
+        normalize_filters([("a", "between", 1)])
+
+
+def test_apply_filters_combines_predicates_and_projects(vendas):
+    result = apply_filters(vendas, [("loja", "==", "A"), ("valor", ">", 20)], columns=["valor"])
+
+    assert result.columns.tolist() == ["valor"]
+    assert result["valor"].tolist() == [40.0]
+
+
+def test_missing_values_never_match_negative_predicates(vendas):
+    result = apply_filters(vendas, [("loja", "not in", ["B"])])
+
+    assert result["loja"].tolist() == ["A", "A"]
+
+
+def test_date_window_parses_text_columns_for_the_comparison(vendas):
+    window = (dt.date(2026, 10, 1), dt.date(2026, 10, 31))
+    result = apply_filters(vendas, [("data", "between", window)])
+
+    assert result["data"].tolist() == ["2026-10-01", "2026-10-31"]
+    assert result["data"].dtype == object
+
+
+def test_iter_filtered_keeps_schema_when_nothing_matches(vendas):
+    chunks = list(
+        iter_filtered([vendas.iloc[:2], vendas.iloc[2:]], [("valor", ">", 100)], ["loja"])
+    )
+
+    assert len(chunks) == 1
+    assert chunks[0].empty
+    assert chunks[0].columns.tolist() == ["loja"]
+
+
+def test_read_columns_adds_filter_only_columns():
+    assert read_columns(["valor"], [("data", ">=", "2026-10-01")]) == ["valor", "data"]
+    assert read_columns(None, [("data", ">=", "2026-10-01")]) is None
+
+
+def test_to_arrow_filters_expands_between_and_coerces_dates():
+    pa = pytest.importorskip("pyarrow")
+    schema = pa.schema([("data", pa.timestamp("ns")), ("valor", pa.float64())])
+
+    translated = to_arrow_filters([("data", "between", ("2026-10-01", "2026-10-31"))], schema)
+
+    assert translated == [
+        ("data", ">=", pd.Timestamp("2026-10-01")),
+        ("data", "<=", pd.Timestamp("2026-10-31")),
+    ]
+    assert to_arrow_filters(None) is None
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 
 from src.app.privacy_guard import build_privacy_snapshot, detect_sensitive_columns
@@ -37,3 +39,25 @@ def test_build_privacy_snapshot_masks_detected_personal_columns():
     assert snapshot["risk_level"] == "Medium"
     assert snapshot["safe_persistence_default"] is True
     assert snapshot["masked_preview"].iloc[0]["email"] != "ana@example.com"
+
+
+def test_content_scan_runs_in_column_batches_and_skips_leading_nulls():
+    rows = 1_000
+    df = pd.DataFrame(
+        {
+            f"contato_{index}": [None] * 500 + [f"pessoa{i}@example.com" for i in range(500)]
+            for index in range(20)
+        }
+    )
+    df["observacao"] = ["sem dados pessoais"] * rows
+    df["telefone_raw"] = ["+55 (11) 98765-4321"] * rows
+
+    serial = detect_sensitive_columns(df)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        parallel = detect_sensitive_columns(df, executor=executor)
+
+    assert parallel == serial
+    assert serial["direct_identifiers"] == sorted(
+        [f"contato_{i}" for i in range(20)] + ["telefone_raw"]
+    )
+    assert "observacao" not in serial["personal_columns"]
@@ -0,0 +1,44 @@
+import pandas as pd
+
+from src.app.profile_store import (
+    load_dataset_profile,
+    save_chunks_with_profile,
+    save_with_profile,
+)
+from src.data.sqlite_manager import SQLiteManager
+
+
+def test_appends_merge_a_profile_of_only_the_new_rows(tmp_path):
+    manager = SQLiteManager(db_path=tmp_path / "analytics_test.db")
+    first = pd.DataFrame({"id": [1, 2, 3], "valor": [10.0, None, 30.0], "uf": ["SP", "RJ", "SP"]})
+    second = pd.DataFrame({"id": [3, 4], "valor": [30.0, 50.0], "uf": ["SP", None]})
+
+    assert save_with_profile(manager, first, "vendas")
+    assert save_with_profile(manager, second, "vendas", if_exists="append")
+    profile = load_dataset_profile(manager, "vendas")
+
+    full = pd.concat([first, second], ignore_index=True)
+    assert profile.rows == 5 and profile.duplicate_count == 1
+    assert profile.missing_counts.to_dict() == full.isna().sum().to_dict()
+    assert profile.column("valor").mean == full["valor"].mean()
+    assert profile.column("uf").n_unique == 2
+
+    # An append the profile cannot absorb drops it rather than leaving a partial one.
+    assert save_with_profile(manager, pd.DataFrame({"id": ["x"]}), "vendas", if_exists="append")
+    assert load_dataset_profile(manager, "vendas") is None
+    # Rows appended while untracked cannot be recovered from the delta alone.
+    assert manager.df_to_sql(first, "legado")
+    assert save_with_profile(manager, second, "legado", if_exists="append")
+    assert load_dataset_profile(manager, "legado") is None
+
+
+def test_first_append_to_a_new_table_is_profiled(tmp_path):
+    manager = SQLiteManager(db_path=tmp_path / "analytics_test.db")
+    chunks = (pd.DataFrame({"id": range(start, start + 5)}) for start in range(0, 15, 5))
+
+    assert save_with_profile(manager, pd.DataFrame({"id": [1, 1]}), "nova", if_exists="append")
+    assert save_chunks_with_profile(manager, chunks, "eventos", if_exists="append")
+
+    assert load_dataset_profile(manager, "nova").duplicate_count == 1
+    eventos = load_dataset_profile(manager, "eventos")
+    assert eventos.rows == 15 and eventos.column("id").n_unique == 15
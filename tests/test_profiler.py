@@ -0,0 +1,233 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from config.settings import Settings
+from dashboard.utils.analytics import build_data_quality_summary
+from src.analysis.exploratory import ExploratoryAnalyzer
+from src.analysis.profiler import (
+    ProfileState,
+    profile_column,
+    profile_dataframe,
+    resolve_distinct_mode,
+)
+
+
+@pytest.fixture
+def vendas():
+    rng = np.random.default_rng(8)
+    rows = 5_000
+    df = pd.DataFrame(
+        {
+            "valor": rng.exponential(120, rows),
+            "quantidade": rng.integers(1, 6, rows),
+            "estoque": pd.array(rng.integers(0, 40, rows), dtype="Int64"),
+            "categoria": rng.choice(["A", "B", "C", None], rows),
+            "segmento": pd.Categorical(rng.choice(["varejo", "atacado"], rows)),
+            "data": pd.date_range("2025-01-01", periods=rows, freq="h"),
+            "ativo": rng.choice([True, False], rows),
+        }
+    )
+    df.loc[::6, "valor"] = np.nan
+    df.loc[::9, "estoque"] = pd.NA
+    return pd.concat([df, df.iloc[:25]], ignore_index=True)
+
+
+def test_profile_matches_pandas_statistics(vendas):
+    profile = profile_dataframe(vendas)
+    numeric = vendas.select_dtypes(include=[np.number])
+
+    pd.testing.assert_frame_equal(profile.describe_frame(), numeric.describe().T.astype(float))
+    for column in numeric.columns:
+        assert profile.column(column).skewness == pytest.approx(numeric[column].skew())
+        assert profile.column(column).kurtosis == pytest.approx(numeric[column].kurtosis())
+    assert [column.n_unique for column in profile.columns] == vendas.nunique().tolist()
+    assert profile.missing_counts.equals(vendas.isna().sum())
+    assert profile.duplicate_count == int(vendas.duplicated().sum()) == 25
+    assert profile.memory_bytes == int(vendas.memory_usage(deep=True).sum())
+    assert profile.numeric_columns == ["valor", "quantidade", "estoque"]
+    assert profile.categorical_columns == ["categoria", "segmento"]
+    assert profile.datetime_columns == ["data"]
+
+
+def test_profile_column_edge_cases():
+    constant = profile_column(pd.Series([2.0, 2.0, 2.0, 2.0], name="c"))
+    empty = profile_column(pd.Series([np.nan, np.nan], name="e"))
+
+    assert (constant.skewness, constant.kurtosis, constant.n_unique) == (0.0, 0.0, 1)
+    assert constant.sample == [2.0]
+    assert empty.count == 0 and empty.missing == 2 and empty.n_unique == 0
+    assert np.isnan(empty.describe()["min"])
+
+
+def test_integer_distinct_and_top_values_are_counted_without_float_rounding():
+    ids = [2**53, 2**53 + 1, 1234567890123456789, 1234567890123456788, 2**53 + 1]
+    column = profile_column(pd.Series(ids, name="event_id"))
+    nullable = profile_column(pd.Series(pd.array(ids + [None], dtype="Int64"), name="e"))
+
+    assert column.n_unique == nullable.n_unique == pd.Series(ids).nunique() == 4
+    assert column.top_values[0] == nullable.top_values[0] == (2**53 + 1, 2)
+    assert {value for value, _ in column.top_values} == set(ids)
+    assert nullable.missing == 1 and nullable.count == 5
+
+
+def test_consumers_share_one_profile(vendas, monkeypatch):
+    expected_analysis = ExploratoryAnalyzer().analyze_dataframe(vendas)
+    expected_summary = build_data_quality_summary(vendas)
+    profile = profile_dataframe(vendas)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("frame scanned again")
+
+    monkeypatch.setattr(pd.DataFrame, "isnull", fail)
+    monkeypatch.setattr(pd.DataFrame, "isna", fail)
+    monkeypatch.setattr(pd.DataFrame, "duplicated", fail)
+    analysis = ExploratoryAnalyzer().analyze_dataframe(vendas, profile=profile)
+    summary = build_data_quality_summary(vendas, profile=profile)
+
+    assert summary == expected_summary
+    assert analysis["missing_values"] == expected_analysis["missing_values"]
+    assert analysis["unique_values"] == expected_analysis["unique_values"]
+    assert analysis["insights"] == expected_analysis["insights"]
+    assert analysis["data_types"] == expected_analysis["data_types"]
+    assert profile.missing_frame()["column"].iloc[0] == "categoria"
+    assert profile.describes(vendas) and not profile.describes(vendas.iloc[:10])
+
+
+def test_merged_profile_states_match_the_exact_profile(vendas):
+    exact = profile_dataframe(vendas)
+    state = ProfileState()
+    for rows in np.array_split(np.arange(len(vendas)), 5):
+        chunk_state = ProfileState.from_frame(vendas.iloc[rows])
+        state.merge(ProfileState.from_json(chunk_state.to_json()))
+
+    profile = state.to_profile()
+
+    assert profile.rows == exact.rows and profile.duplicate_count == exact.duplicate_count
+    assert profile.missing_counts.equals(exact.missing_counts)
+    for merged, expected in zip(profile.columns, exact.columns, strict=True):
+        assert str(merged.dtype) == str(expected.dtype)
+        assert merged.n_unique == pytest.approx(expected.n_unique, rel=0.05)
+        if expected.kind == "numeric":
+            assert merged.mean == pytest.approx(expected.mean)
+            assert merged.kurtosis == pytest.approx(expected.kurtosis)
+            assert merged.quantiles[0.5] == pytest.approx(expected.quantiles[0.5], rel=0.05)
+    assert profile.column("quantidade").sample == exact.column("quantidade").sample
+    assert profile.column("data").max == exact.column("data").max
+    assert not profile.exact
+
+
+def test_profile_state_rejects_chunks_with_other_columns(vendas):
+    state = ProfileState.from_frame(vendas)
+
+    with pytest.raises(ValueError):
+        state.update(vendas[["valor"]])
+    with pytest.raises(ValueError):
+        state.update(vendas.assign(valor="texto"))
+
+
+def test_analyzer_reports_from_a_stored_profile_without_the_frame(vendas):
+    profile = ProfileState.from_frame(vendas).to_profile()
+
+    analysis = ExploratoryAnalyzer().analyze_dataframe(None, profile=profile)
+
+    assert analysis["basic_info"]["shape"] == {"rows": len(vendas), "columns": 7}
+    assert not any("Correlações" in insight for insight in analysis["insights"])
+
+
+def test_parallel_profiling_matches_the_serial_profile(vendas):
+    wide = pd.concat([vendas.add_suffix(f"_{copy}") for copy in range(6)], axis=1)
+    expected = profile_dataframe(wide)
+    serial = ExploratoryAnalyzer().analyze_dataframe(wide)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        profile = profile_dataframe(wide, executor=executor)
+        parallel = ExploratoryAnalyzer(executor=executor).analyze_dataframe(wide)
+
+    assert profile.column_names == list(wide.columns)
+    pd.testing.assert_frame_equal(profile.describe_frame(), expected.describe_frame())
+    assert [column.n_unique for column in profile.columns] == wide.nunique().tolist()
+    assert [column.sample for column in profile.columns] == [
+        column.sample for column in expected.columns
+    ]
+    for section in ("data_types", "missing_values", "unique_values", "insights"):
+        assert parallel[section] == serial[section]
+
+
+def test_top_values_match_value_counts(vendas):
+    profile = profile_dataframe(vendas, top_k=3)
+
+    for name in ("categoria", "segmento", "quantidade", "estoque"):
+        counts = vendas[name].value_counts()
+        top = profile.column(name).top_values
+        assert [count for _, count in top] == counts.head(3).tolist()
+        assert all(counts[value] == count for value, count in top)
+    analysis = ExploratoryAnalyzer().analyze_dataframe(vendas, profile=profile)
+    assert (
+        analysis["unique_values"]["categoria"]["top_values"]
+        == profile.column("categoria").top_values
+    )
+
+
+def test_approximate_distinct_counts_bound_error_and_find_heavy_hitters(monkeypatch):
+    rng = np.random.default_rng(4)
+    codes = pd.Series(
+        np.where(rng.random(400_000) < 0.2, "frequente", rng.integers(0, 150_000, 400_000))
+    ).astype(object)
+    codes.iloc[::50] = None
+    exact = profile_column(codes)
+
+    approx = profile_column(codes, distinct="approx")
+
+    assert not approx.exact and exact.exact
+    assert approx.n_unique == pytest.approx(exact.n_unique, rel=0.05)
+    assert approx.top_values[0][0] == exact.top_values[0][0] == "frequente"
+    assert approx.top_values[0][1] <= exact.top_values[0][1]
+    small = profile_column(pd.Series(list("abcab") * 100), distinct="approx")
+    assert small.exact and small.n_unique == 3 and small.sample == ["a", "b", "c"]
+    assert small.top_values == [("a", 200), ("b", 200), ("c", 100)]
+    monkeypatch.setattr(Settings, "PROFILE_DISTINCT_MODE", "approx", raising=False)
+    assert resolve_distinct_mode() == "approx"
+    with pytest.raises(ValueError):
+        resolve_distinct_mode("hll")
+
+
+def test_profile_state_keeps_top_values_across_json_and_merges(vendas):
+    state = ProfileState()
+    for rows in np.array_split(np.arange(len(vendas)), 3):
+        state.merge(ProfileState.from_json(ProfileState.from_frame(vendas.iloc[rows]).to_json()))
+
+    profile = state.to_profile()
+
+    for name in ("categoria", "segmento", "quantidade"):
+        counts = vendas[name].value_counts()
+        top = profile.column(name).top_values
+        assert [count for _, count in top] == counts.head(5).tolist()
+        assert all(counts[value] == count for value, count in top)
+    dates = pd.DataFrame({"data": pd.to_datetime(["2025-01-02"] * 3 + ["2025-01-01"])})
+    stored = ProfileState.from_json(ProfileState.from_frame(dates).to_json()).to_profile()
+    assert stored.column("data").top_values[0] == (pd.Timestamp("2025-01-02"), 3)
+
+
+def test_stored_datetime_profiles_keep_timestamps_and_timezones():
+    df = pd.DataFrame(
+        {
+            "local": pd.to_datetime(["2024-01-01 03:00", "2024-01-02 00:00", None]).tz_localize(
+                "America/Sao_Paulo"
+            ),
+            "naive": pd.to_datetime(["2024-01-01", None, "2024-01-01"]),
+        }
+    )
+
+    stored = ProfileState.from_json(ProfileState.from_frame(df).to_json()).to_profile()
+    exact = profile_dataframe(df)
+
+    for name in ("local", "naive"):
+        column, expected = stored.column(name), exact.column(name)
+        assert column.sample == expected.sample
+        assert column.top_values == expected.top_values
+        assert (column.min, column.max) == (expected.min, expected.max)
+    assert stored.column("local").min.tz is not None
+    assert isinstance(stored.column("naive").sample[0], pd.Timestamp)
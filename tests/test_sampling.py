@@ -0,0 +1,129 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from config.settings import Settings
+from src.analysis.profiler import profile_dataframe
+from src.analysis.sampling import (
+    ProfileRefinement,
+    count_duplicate_rows,
+    resolve_profile_mode,
+    sample_positions,
+    sample_profile,
+)
+from src.app.curation_service import curate_dataset, profile_reports
+
+
+@pytest.fixture
+def pedidos():
+    rng = np.random.default_rng(21)
+    rows = 60_000
+    df = pd.DataFrame(
+        {
+            "valor": rng.lognormal(4, 0.8, rows),
+            "itens": rng.integers(1, 12, rows),
+            "loja": rng.choice([f"L{i:03d}" for i in range(300)], rows),
+            "pedido_id": np.arange(rows),
+            "data": pd.date_range("2024-01-01", periods=rows, freq="min"),
+        }
+    )
+    df.loc[::7, "valor"] = np.nan
+    df.loc[rows - 1, "valor"] = 1e6
+    return df
+
+
+def test_sampled_profile_is_exact_where_cheap_and_bounded_elsewhere(pedidos):
+    exact = profile_dataframe(pedidos)
+    sampled = sample_profile(pedidos, sample_size=5_000)
+
+    assert not sampled.exact and sampled.sample_rows == 5_000 and sampled.confidence == 0.95
+    assert sampled.rows == exact.rows and sampled.duplicate_count == exact.duplicate_count
+    assert sampled.missing_counts.equals(exact.missing_counts)
+    assert sampled.column("valor").max == exact.column("valor").max == 1e6
+    assert sampled.column("data").min == exact.column("data").min
+    for name in ("valor", "itens"):
+        low, high = sampled.column(name).intervals["mean"]
+        assert low <= exact.column(name).mean <= high
+        low, high = sampled.column(name).intervals["50%"]
+        assert low <= exact.column(name).quantiles[0.5] <= high
+    for name in ("loja", "pedido_id"):
+        low, high = sampled.column(name).intervals["n_unique"]
+        assert low <= exact.column(name).n_unique <= high
+    assert sampled.column("loja").n_unique == 300
+    intervals = sampled.interval_frame()
+    assert set(intervals["statistic"]) >= {"mean", "25%", "50%", "75%", "n_unique"}
+    assert (intervals["lower"] <= intervals["upper"]).all()
+
+
+def test_small_frames_are_profiled_exactly(pedidos):
+    small = pedidos.iloc[:1_000]
+
+    profile = sample_profile(small, sample_size=5_000)
+
+    assert profile.exact and profile.sample_rows is None
+    assert sample_positions(1_000, 5_000) is None
+
+
+def test_stratified_positions_cover_the_whole_frame():
+    positions = sample_positions(1_000_000, 1_000, seed=3)
+
+    assert len(positions) == 1_000 and (np.diff(positions) > 0).all()
+    assert (positions // 1_000 == np.arange(1_000)).all()
+    assert (positions == sample_positions(1_000_000, 1_000, seed=3)).all()
+
+
+def test_duplicate_rows_are_counted_exactly(pedidos):
+    doubled = pd.concat([pedidos, pedidos.iloc[:40]], ignore_index=True)
+
+    assert count_duplicate_rows(doubled) == int(doubled.duplicated().sum()) == 40
+    assert count_duplicate_rows(pd.DataFrame({"a": [[1], [1]]})) == 1
+
+
+def test_refinement_serves_the_sample_then_the_exact_profile(pedidos):
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        refinement = ProfileRefinement(pedidos, sample_size=5_000, executor=executor)
+        assert not refinement.sampled.exact
+        exact = refinement.result(timeout=30)
+
+    assert refinement.done() and refinement.profile is exact and exact.exact
+    assert exact.column("pedido_id").n_unique == len(pedidos)
+
+
+def test_profile_mode_resolution(monkeypatch):
+    monkeypatch.setattr(Settings, "PROFILE_AUTO_SAMPLE_ROWS", 100, raising=False)
+
+    assert resolve_profile_mode("auto", 100) == "exact"
+    assert resolve_profile_mode("auto", 101) == "sample"
+    assert resolve_profile_mode("EXACT", 10**9) == "exact"
+    with pytest.raises(ValueError):
+        resolve_profile_mode("approx", 10)
+
+
+def test_curation_in_sample_mode_refines_in_the_background(pedidos, monkeypatch):
+    monkeypatch.setattr(Settings, "PROFILE_SAMPLE_SIZE", 5_000, raising=False)
+
+    artifacts = curate_dataset(pedidos, profile_mode="sample", date_features=False)
+
+    assert not artifacts.profile.exact and artifacts.profile.rows == len(artifacts.curated_df)
+    assert artifacts.analysis["basic_info"]["shape"]["rows"] == len(artifacts.curated_df)
+    assert list(artifacts.correlations.matrix.columns) == artifacts.profile.numeric_columns
+    refined = artifacts.profile_refinement.result(timeout=30)
+    assert refined.exact and refined.describes(artifacts.curated_df)
+    assert curate_dataset(pedidos, profile_mode="exact").profile_refinement is None
+
+
+def test_reports_rebuilt_from_the_refined_profile_match_an_exact_curation(pedidos, monkeypatch):
+    monkeypatch.setattr(Settings, "PROFILE_SAMPLE_SIZE", 5_000, raising=False)
+    sampled = curate_dataset(pedidos, profile_mode="sample", date_features=False)
+    exact = curate_dataset(pedidos, profile_mode="exact", date_features=False)
+
+    analysis, quality_summary, priority_actions = profile_reports(
+        sampled.curated_df, sampled.profile_refinement.result(timeout=30), sampled.correlations
+    )
+
+    assert quality_summary == exact.quality_summary
+    assert priority_actions == exact.priority_actions
+    assert analysis["unique_values"] == exact.analysis["unique_values"]
+    assert analysis["unique_values"] != sampled.analysis["unique_values"]
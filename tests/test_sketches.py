@@ -0,0 +1,148 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.sketches import (
+    FrequentItemsSketch,
+    HyperLogLog,
+    MomentAccumulator,
+    QuantileSketch,
+    approximate_median,
+    approximate_mode,
+    sample_size_for_error,
+)
+
+
+def test_quantile_sketch_is_exact_below_capacity():
+    sketch = QuantileSketch(k=64)
+    sketch.update([5, 1, np.nan, 3, 2, 4])
+
+    assert sketch.is_exact
+    assert sketch.count == 5
+    assert sketch.median() == 3.0
+    assert sketch.quantile(0) == 1.0
+    assert sketch.quantile(1) == 5.0
+
+
+def test_quantile_sketch_merged_chunks_approximate_the_median():
+    values = np.random.default_rng(7).normal(100, 15, 200_000)
+    merged = QuantileSketch(k=256)
+    for chunk in np.array_split(values, 20):
+        part = QuantileSketch(k=256)
+        part.update(chunk)
+        merged.merge(part)
+
+    assert not merged.is_exact
+    assert merged.count == len(values)
+    assert abs(merged.median() - np.median(values)) < 1.5
+    assert merged.min == values.min()
+    assert merged.max == values.max()
+
+
+def test_empty_quantile_sketch_has_no_median():
+    assert QuantileSketch().median() is None
+
+
+def test_frequent_items_sketch_finds_the_mode_across_merges():
+    left = FrequentItemsSketch(capacity=4)
+    right = FrequentItemsSketch(capacity=4)
+    left.update(pd.Series(["a"] * 50 + list("bcdefgh")))
+    right.update(pd.Series(["a"] * 30 + ["b"] * 20 + list("ijklmn")))
+
+    merged = left.merge(right)
+
+    assert merged.mode() == "a"
+    assert merged.total == 113
+    assert len(merged.counts) <= 4
+    assert merged.counts["a"] <= 80 <= merged.counts["a"] + merged.error
+
+
+def test_frequent_items_sketch_ignores_missing_values():
+    sketch = FrequentItemsSketch()
+    sketch.update(pd.Series([None, np.nan]))
+
+    assert sketch.mode() is None
+    assert sketch.total == 0
+
+
+def test_sample_size_follows_the_dkw_bound():
+    assert sample_size_for_error(0.01, 0.99) == 26_492
+    assert sample_size_for_error(0.05, 0.95) < sample_size_for_error(0.01, 0.95)
+
+
+def test_approximate_median_and_mode_stay_within_the_error_bound():
+    rng = np.random.default_rng(11)
+    values = rng.exponential(10, 500_000)
+    values[::7] = np.nan
+    labels = pd.Series(rng.choice(["a", "b", "c", None], 500_000, p=[0.5, 0.3, 0.1, 0.1]))
+
+    median = approximate_median(values, epsilon=0.01)
+    present = np.sort(values[~np.isnan(values)])
+    rank = np.searchsorted(present, median) / len(present)
+
+    assert abs(rank - 0.5) <= 0.01
+    assert approximate_mode(labels, epsilon=0.01) == "a"
+    assert approximate_median(np.array([2.0, np.nan, 4.0])) == 3.0
+    assert approximate_mode(pd.Series([None, None])) is None
+
+
+def test_sketches_sized_for_an_error_report_their_rank_error():
+    values = np.random.default_rng(2).normal(0, 1, 300_000)
+    sketch = QuantileSketch.for_error(0.01)
+    for chunk in np.array_split(values, 6):
+        sketch.update(chunk)
+
+    assert not sketch.is_exact
+    assert 0 < sketch.rank_error <= 0.01
+    assert np.mean(values <= sketch.median()) == pytest.approx(0.5, abs=sketch.rank_error)
+    assert FrequentItemsSketch.for_error(0.01).capacity == 100
+
+
+def test_merged_moment_accumulators_match_pandas():
+    values = pd.Series(np.random.default_rng(9).gamma(2.0, 3.0, 40_000))
+    merged = MomentAccumulator()
+    for chunk in np.array_split(values.to_numpy(), 7):
+        merged.merge(MomentAccumulator.from_dict(MomentAccumulator.from_values(chunk).to_dict()))
+
+    assert merged.count == len(values)
+    assert merged.mean == pytest.approx(values.mean())
+    assert merged.std == pytest.approx(values.std())
+    assert merged.skewness == pytest.approx(values.skew())
+    assert merged.kurtosis == pytest.approx(values.kurtosis())
+    assert (merged.min, merged.max) == (values.min(), values.max())
+
+
+def test_hyperloglog_is_exact_when_small_and_close_when_large():
+    rng = np.random.default_rng(10)
+    small = HyperLogLog()
+    small.update(pd.Series(["a", "b", None, "a"]))
+    small.merge(HyperLogLog.from_dict(small.to_dict()))
+
+    values = rng.integers(0, 300_000, 600_000)
+    large = HyperLogLog()
+    for chunk in np.array_split(values, 4):
+        part = HyperLogLog()
+        part.update(pd.Series(chunk))
+        large.merge(part)
+    as_float = HyperLogLog()
+    as_float.update(pd.Series(values.astype(float)))
+
+    assert small.is_exact and small.count() == 2
+    assert not large.is_exact
+    assert large.count() == pytest.approx(len(np.unique(values)), rel=0.05)
+    assert np.array_equal(as_float.registers, large.registers)
+
+
+def test_frequent_items_sketch_reduces_large_batches_within_its_bound():
+    rng = np.random.default_rng(6)
+    values = pd.Series(np.where(rng.random(200_000) < 0.1, -1, rng.integers(0, 50_000, 200_000)))
+    sketch = FrequentItemsSketch(capacity=32)
+    for start in range(0, len(values), 50_000):
+        sketch.update(values.iloc[start : start + 50_000])
+
+    restored = FrequentItemsSketch.from_dict(sketch.to_dict())
+    true_count = int((values == -1).sum())
+
+    assert len(sketch.counts) <= 32 and sketch.error <= sketch.total / 33
+    assert restored.mode() == -1 and restored.error == sketch.error
+    assert restored.counts[-1] <= true_count <= restored.counts[-1] + restored.error
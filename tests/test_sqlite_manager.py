@@ -23,3 +23,25 @@ def test_sqlite_manager_execute_query_returns_affected_rows(tmp_path):
 
     rows = manager.fetch_all("SELECT nome FROM clientes")
     assert rows == [("Ana",)]
+
+
+def test_sqlite_manager_writes_chunks_and_registers_once(tmp_path):
+    manager = SQLiteManager(db_path=tmp_path / "analytics_test.db")
+    chunks = (pd.DataFrame({"id": range(start, start + 5)}) for start in range(0, 15, 5))
+
+    assert manager.df_chunks_to_sql(chunks, "eventos", metadata={"source_name": "stream"})
+    assert manager.fetch_scalar("SELECT COUNT(*) FROM eventos") == 15
+    assert manager.fetch_all("SELECT row_count FROM dataset_registry") == [(15,)]
+    assert manager.df_chunks_to_sql(iter([]), "vazia") is False
+
+
+def test_plain_writes_drop_a_stored_profile_payload(tmp_path):
+    manager = SQLiteManager(db_path=tmp_path / "analytics_test.db")
+    assert manager.df_to_sql(pd.DataFrame({"id": [1, 2]}), "vendas")
+    assert manager.store_profile_payload("vendas", 2, '{"version": 0}')
+    assert manager.get_profile_payload("vendas") == '{"version": 0}'
+
+    assert manager.df_to_sql(pd.DataFrame({"id": [3]}), "vendas", if_exists="append")
+
+    assert manager.get_profile_payload("vendas") is None
+    assert "dataset_profiles" not in manager.list_tables()
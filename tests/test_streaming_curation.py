@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from dashboard.utils.analytics import summarize_transformation_log
+from src.app.curation_service import curate_dataset
+from src.app.streaming_curation import StreamingCurator
+from src.data.sqlite_manager import SQLiteManager
+from src.data.type_inference import TypeInferenceEngine
+from src.utils.sketches import QuantileSketch
+
+
+def _vendas(rows=600):
+    rng = np.random.default_rng(11)
+    df = pd.DataFrame(
+        {
+            "Data Venda": pd.date_range("2025-01-01", periods=rows, freq="h").strftime("%Y-%m-%d"),
+            "Categoria": rng.choice(["A", "B", "C"], rows, p=[0.6, 0.3, 0.1]),
+            "Valor Total": rng.integers(10, 500, rows).astype(float),
+            "Quantidade": rng.integers(1, 5, rows),
+        }
+    )
+    df.loc[::7, "Valor Total"] = np.nan
+    df.loc[::11, "Categoria"] = None
+    return pd.concat([df, df.iloc[:40]], ignore_index=True)
+
+
+def _write_csv(df, path):
+    df.to_csv(path, index=False)
+    return path
+
+
+def test_streaming_curation_matches_in_memory_curation(tmp_path):
+    raw = _vendas()
+    path = _write_csv(raw, tmp_path / "vendas.csv")
+    expected = curate_dataset(pd.read_csv(path)).curated_df.reset_index(drop=True)
+
+    curator = StreamingCurator.from_csv(path, chunksize=100, spill_dir=tmp_path / "spill")
+    curated = pd.concat(list(curator.iter_curated()), ignore_index=True)
+
+    pd.testing.assert_frame_equal(curated, expected)
+    result = curator.result
+    assert result.rows_in == len(raw)
+    assert result.duplicates_removed == len(raw) - len(expected)
+    assert result.rows_out == len(expected)
+    assert result.column_types["data_venda"] == "datetime64[ns]"
+    assert result.fill_values["categoria"] == "A"
+    assert not list((tmp_path / "spill").iterdir())
+
+
+def test_streaming_curation_log_feeds_the_transformation_summary(tmp_path):
+    path = _write_csv(_vendas(), tmp_path / "vendas.csv")
+    curator = StreamingCurator.from_csv(path, chunksize=128)
+
+    result = curator.to_parquet(tmp_path / "out" / "vendas.parquet")
+
+    summary = summarize_transformation_log(result.transform_log)
+    assert f"Duplicate removal eliminated {result.duplicates_removed} rows." in summary
+    assert any(line.endswith("to 0.") for line in summary)
+    assert pq.ParquetFile(tmp_path / "out" / "vendas.parquet").metadata.num_rows == result.rows_out
+
+
+def test_streaming_curation_coerces_values_outside_the_sample():
+    chunks = [
+        pd.DataFrame({"id": [1, 2, 3], "Valor": ["1", "2", "3"]}),
+        pd.DataFrame({"id": [4, 5, 6], "Valor": ["4", "5", "n/d"]}),
+    ]
+    curator = StreamingCurator(lambda: iter(chunks), type_engine=TypeInferenceEngine(sample_size=2))
+
+    curated = pd.concat(list(curator.iter_curated()), ignore_index=True)
+
+    assert curated["valor"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0, 3.0]
+    assert curator.result.coerced == {"valor": 1}
+    assert curator.result.column_types == {"id": "int64", "valor": "float64"}
+
+
+def test_streaming_curation_writes_sqlite_table_once(tmp_path):
+    path = _write_csv(_vendas(), tmp_path / "vendas.csv")
+    manager = SQLiteManager(db_path=tmp_path / "analytics.db")
+
+    result = StreamingCurator.from_csv(path, chunksize=100).to_sqlite(manager, "vendas_curadas")
+
+    assert manager.fetch_scalar("SELECT COUNT(*) FROM vendas_curadas") == result.rows_out
+    registry = manager.fetch_all(
+        "SELECT row_count FROM dataset_registry WHERE table_name = 'vendas_curadas'"
+    )
+    assert registry == [(result.rows_out,)]
+
+
+def test_streaming_curation_sizes_sketches_for_a_target_error(tmp_path):
+    path = _write_csv(_vendas(), tmp_path / "vendas.csv")
+    curator = StreamingCurator.from_csv(path, chunksize=100, sketch_error=0.05)
+
+    curator.profile()
+
+    stats = curator.stats["valor_total"]
+    assert stats.quantiles.k == QuantileSketch.for_error(0.05).k
+    assert stats.frequent.capacity == 20
+    assert curator.plans["categoria"].fill_value == "A"
@@ -0,0 +1,186 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.transform_plan import PlanCache, TransformPlan, TransformStep, curation_plan
+from src.data.transformer import DataTransformer
+
+
+@pytest.fixture
+def vendas():
+    return pd.DataFrame(
+        {
+            "Data Venda": ["2025-01-01", "2025-01-02", "2025-01-02", "2025-01-03"],
+            "Categoria": ["A", None, None, "B"],
+            "Valor Total": [100.0, 250.0, 250.0, np.nan],
+        }
+    )
+
+
+class CountingTransformer(DataTransformer):
+    def __init__(self):
+        super().__init__(copy=False)
+        self.calls = []
+
+    def convert_dtypes(self, df, executor=None):
+        self.calls.append("convert_dtypes")
+        return super().convert_dtypes(df, executor=executor)
+
+    def remove_duplicates(self, df, subset=None):
+        self.calls.append("remove_duplicates")
+        return super().remove_duplicates(df, subset=subset)
+
+    def optimize_memory(self, df, **params):
+        self.calls.append("optimize_memory")
+        return super().optimize_memory(df, **params)
+
+
+def test_plan_matches_eager_transformer(vendas):
+    eager = DataTransformer()
+    expected = eager.clean_column_names(vendas)
+    expected = eager.convert_dtypes(expected)
+    expected = eager.handle_missing_values(expected, strategy="auto")
+    expected = eager.remove_duplicates(expected)
+
+    result = curation_plan().execute(vendas, cache=PlanCache())
+
+    pd.testing.assert_frame_equal(result.frame, expected)
+    assert [item["operation"] for item in result.transform_log] == [
+        item["operation"] for item in eager.get_transformation_log()
+    ]
+
+
+def test_plan_is_lazy_and_validates_steps(vendas):
+    plan = TransformPlan().clean_column_names().convert_dtypes()
+
+    assert len(plan) == 2
+    assert list(vendas.columns) == ["Data Venda", "Categoria", "Valor Total"]
+    with pytest.raises(ValueError):
+        plan.then("explode")
+    with pytest.raises(ValueError):
+        plan.then("remove_duplicates", keep="last")
+
+
+def test_optimizer_fuses_adjacent_column_steps_and_drops_noops():
+    df = pd.DataFrame({"a": [1.0, np.nan], "b": [1, 2], "c": ["x", "y"]})
+    plan = (
+        TransformPlan()
+        .rename_columns({"a": "x1"})
+        .rename_columns({"x1": "valor", "b": "b"})
+        .fill_columns({"valor": 0.0, "b": 0})
+        .fill_columns({"valor": 9.0})
+        .drop_columns([])
+        .handle_missing_values("auto")
+        .convert_dtypes()
+        .convert_dtypes()
+        .handle_missing_values("auto")
+    )
+
+    # The first missing-value step has nothing left to fill; the second follows a
+    # conversion that may introduce nulls, so it stays.
+    assert plan.optimize(df) == [
+        TransformStep("rename_columns", {"mapping": {"a": "valor"}}),
+        TransformStep("fill_columns", {"values": {"valor": 0.0}}),
+        TransformStep("convert_dtypes"),
+        TransformStep("handle_missing_values", {"strategy": "auto"}),
+    ]
+    result = plan.execute(df, cache=PlanCache())
+    assert result.frame["valor"].tolist() == [1.0, 0.0]
+
+
+def test_overlapping_casts_are_not_fused():
+    plan = TransformPlan().cast_columns({"a": "int64"}).cast_columns({"a": "str"})
+
+    assert len(plan.optimize()) == 2
+
+
+def test_plans_keep_nothing_without_an_explicit_cache(vendas):
+    curation_plan().execute(vendas)
+
+    second = CountingTransformer()
+    result = curation_plan().execute(vendas, transformer=second)
+
+    assert second.calls == ["convert_dtypes", "remove_duplicates"]
+    assert result.reused_steps == 0
+
+
+def test_rerunning_a_plan_reuses_every_step(vendas):
+    cache = PlanCache()
+    first = CountingTransformer()
+    curation_plan().execute(vendas, cache=cache, transformer=first)
+
+    second = CountingTransformer()
+    result = curation_plan().execute(vendas, cache=cache, transformer=second)
+
+    assert first.calls == ["convert_dtypes", "remove_duplicates"]
+    assert second.calls == []
+    assert result.reused_steps == len(result.steps)
+    assert result.transform_log[-1]["operation"] == "remove_duplicates"
+
+
+def test_changing_only_the_last_step_reruns_only_that_step(vendas):
+    cache = PlanCache()
+    curation_plan().execute(vendas, cache=cache)
+
+    transformer = CountingTransformer()
+    result = curation_plan(optimize_memory=True).execute(
+        vendas, cache=cache, transformer=transformer
+    )
+
+    assert transformer.calls == ["optimize_memory"]
+    assert result.executed_steps == 1
+    assert [item["operation"] for item in result.transform_log][-2:] == [
+        "remove_duplicates",
+        "optimize_memory",
+    ]
+
+
+def test_results_are_isolated_from_the_cache_by_default(vendas):
+    cache = PlanCache()
+    result = curation_plan().execute(vendas, cache=cache)
+    result.frame.loc[:, "categoria"] = "mutated"
+
+    again = curation_plan().execute(vendas, cache=cache)
+
+    assert "mutated" not in again.frame["categoria"].tolist()
+
+
+def test_plan_cache_evicts_least_recently_used_entries():
+    cache = PlanCache(max_entries=2)
+    frame = pd.DataFrame({"a": [1]})
+    for key in ("k1", "k2", "k3"):
+        cache.put(key, frame, ())
+
+    assert len(cache) == 2
+    assert cache.get("k1") is None
+    assert cache.get("k3") is not None
+
+    tiny = PlanCache(max_bytes=1)
+    tiny.put("big", frame, ())
+    assert len(tiny) == 0
+
+
+def test_missing_value_step_is_kept_when_conversion_introduces_nulls():
+    raw = pd.DataFrame(
+        {"Data": ["2025-01-01", "", "2025-01-03", "2025-01-04"], "Valor": [1.0, 2.0, 3.0, 4.0]}
+    )
+    eager = DataTransformer()
+    expected = eager.handle_missing_values(
+        eager.convert_dtypes(eager.clean_column_names(raw)), strategy="auto"
+    )
+
+    result = curation_plan().execute(raw, cache=PlanCache())
+
+    assert "handle_missing_values" in [step.operation for step in result.steps]
+    assert result.frame["data"].notna().all()
+    pd.testing.assert_frame_equal(result.frame, expected.drop_duplicates().reset_index(drop=True))
+
+
+def test_plan_cache_sizes_entries_with_their_deep_memory_usage():
+    frame = pd.DataFrame({"texto": ["x" * 200] * 1_000})
+    deep = int(frame.memory_usage(index=True, deep=True).sum())
+    cache = PlanCache(max_bytes=deep - 1)
+
+    cache.put("k", frame, ())
+
+    assert len(cache) == 0
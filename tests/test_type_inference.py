@@ -0,0 +1,65 @@
+import pandas as pd
+
+from src.data.transformer import DataTransformer
+from src.data.type_inference import TypeInferenceEngine
+
+
+def test_engine_detects_explicit_date_format_from_the_sample():
+    engine = TypeInferenceEngine(sample_size=20)
+    series = pd.Series([f"{day:02d}/03/2026" for day in range(1, 29)] * 10, name="data")
+
+    result = engine.convert(series)
+
+    assert result.kind == "datetime"
+    assert result.date_format == "%d/%m/%Y"
+    assert result.values.iloc[12] == pd.Timestamp("2026-03-13")
+
+
+def test_engine_rejects_text_and_numeric_columns_on_the_sample():
+    engine = TypeInferenceEngine()
+
+    numeric = engine.convert(pd.Series(["1", "2.5", None, "3"], name="valor"))
+    text = engine.convert(pd.Series(["Sul", "Norte", "Sul"], name="regiao"))
+
+    assert numeric.kind == "numeric"
+    assert numeric.values.dtype == "float64"
+    assert text.kind == "text"
+    assert text.numeric_error and text.datetime_error
+
+
+def test_engine_caches_inference_by_sample_fingerprint():
+    engine = TypeInferenceEngine()
+    series = pd.Series(["2026-01-01", "2026-01-02"] * 50, name="data")
+
+    engine.infer(series)
+    engine.infer(series.rename("outra_coluna"))
+
+    assert (engine.misses, engine.hits) == (1, 1)
+
+
+def test_engine_falls_back_when_a_value_outside_the_sample_breaks_the_format():
+    engine = TypeInferenceEngine(sample_size=10)
+    values = ["2026-01-15"] * 200
+    values[101] = "15 Jan 2026 10:30"
+    result = engine.convert(pd.Series(values, name="data"))
+
+    assert result.kind == "datetime"
+    assert result.date_format == "mixed"
+    assert result.values.iloc[101] == pd.Timestamp("2026-01-15 10:30")
+
+
+def test_convert_dtypes_records_detected_formats():
+    transformer = DataTransformer(type_engine=TypeInferenceEngine())
+    raw = pd.DataFrame(
+        {"data": ["2026-01-01", "2026-01-02"], "qtd": ["1", "2"], "nome": ["a", "b"]}
+    )
+
+    converted = transformer.convert_dtypes(raw)
+    stats = transformer.get_transformation_log()[-1]["details"]["conversion_stats"]
+
+    assert pd.api.types.is_datetime64_any_dtype(converted["data"])
+    assert pd.api.types.is_numeric_dtype(converted["qtd"])
+    assert converted["nome"].dtype == object
+    assert stats["date_formats"] == {"data": "%Y-%m-%d"}
+    assert stats["numeric_converted"] == ["qtd"]
+    assert [item["column"] for item in stats["numeric_failed"]] == ["nome"]